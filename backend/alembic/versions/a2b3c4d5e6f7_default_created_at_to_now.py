@@ -0,0 +1,30 @@
+"""default content/comment created_at to now()
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a5b6c7d8e9
+Create Date: 2026-10-16 15:20:12.418093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2b3c4d5e6f7'
+down_revision: Union[str, Sequence[str], None] = 'f1a5b6c7d8e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('content', 'created_at', server_default=sa.func.now())
+    op.alter_column('comments', 'created_at', server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('comments', 'created_at', server_default=None)
+    op.alter_column('content', 'created_at', server_default=None)
@@ -0,0 +1,40 @@
+"""add partial indexes on live (non-soft-deleted) rows
+
+Revision ID: b7c1d2e3f4a5
+Revises: ab250ef64e42
+Create Date: 2026-10-16 09:12:40.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1d2e3f4a5'
+down_revision: Union[str, Sequence[str], None] = 'ab250ef64e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LIVE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_content_workspace_live', 'content', ['workspace_id', 'content_type', 'name'], unique=False, postgresql_where=LIVE)
+    op.create_index('ix_troops_workspace_live', 'troops', ['workspace_id', 'name'], unique=False, postgresql_where=LIVE)
+    op.create_index('ix_users_live_name', 'users', ['name'], unique=False, postgresql_where=LIVE)
+    # tasks/memberships carry no deleted_at of their own; plain indexes on the lookup column.
+    op.create_index('ix_tasks_event_id', 'tasks', ['event_id'], unique=False)
+    op.create_index('ix_workspace_memberships_user_id', 'workspace_memberships', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workspace_memberships_user_id', table_name='workspace_memberships')
+    op.drop_index('ix_tasks_event_id', table_name='tasks')
+    op.drop_index('ix_users_live_name', table_name='users')
+    op.drop_index('ix_troops_workspace_live', table_name='troops')
+    op.drop_index('ix_content_workspace_live', table_name='content')
@@ -0,0 +1,38 @@
+"""store users.email as citext
+
+Revision ID: c8d2e3f4a5b6
+Revises: b7c1d2e3f4a5
+Create Date: 2026-10-16 10:03:27.551904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2e3f4a5b6'
+down_revision: Union[str, Sequence[str], None] = 'b7c1d2e3f4a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.alter_column('users', 'email',
+               existing_type=sa.VARCHAR(length=320),
+               type_=postgresql.CITEXT(),
+               existing_nullable=False)
+    op.create_check_constraint('ck_users_email_max', 'users', 'char_length(email) <= 320')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_users_email_max', 'users', type_='check')
+    op.alter_column('users', 'email',
+               existing_type=postgresql.CITEXT(),
+               type_=sa.VARCHAR(length=320),
+               existing_nullable=False)
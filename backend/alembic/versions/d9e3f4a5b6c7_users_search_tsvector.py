@@ -0,0 +1,40 @@
+"""add generated search tsvector to users
+
+Revision ID: d9e3f4a5b6c7
+Revises: c8d2e3f4a5b6
+Create Date: 2026-10-16 10:41:52.304117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9e3f4a5b6c7'
+down_revision: Union[str, Sequence[str], None] = 'c8d2e3f4a5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column(
+        'search_tsv',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(email::text, '')"
+            " || ' ' || coalesce(auth0_id, ''))",
+            persisted=True,
+        ),
+        nullable=False,
+    ))
+    op.create_index('ix_users_search', 'users', ['search_tsv'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_search', table_name='users', postgresql_using='gin')
+    op.drop_column('users', 'search_tsv')
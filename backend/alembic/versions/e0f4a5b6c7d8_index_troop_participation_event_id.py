@@ -0,0 +1,28 @@
+"""index troop_participation.event_id
+
+Revision ID: e0f4a5b6c7d8
+Revises: d9e3f4a5b6c7
+Create Date: 2026-10-16 11:20:06.873512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0f4a5b6c7d8'
+down_revision: Union[str, Sequence[str], None] = 'd9e3f4a5b6c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_troop_participation_event_id', 'troop_participation', ['event_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_troop_participation_event_id', table_name='troop_participation')
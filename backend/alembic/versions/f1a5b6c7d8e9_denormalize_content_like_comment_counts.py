@@ -0,0 +1,88 @@
+"""denormalize like/comment counts onto content
+
+Revision ID: f1a5b6c7d8e9
+Revises: e0f4a5b6c7d8
+Create Date: 2026-10-16 13:05:41.662390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a5b6c7d8e9'
+down_revision: Union[str, Sequence[str], None] = 'e0f4a5b6c7d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Snapshot of app/models/content_stats.py at this revision.
+LIKE_COUNT_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION content_like_count_trg() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE content SET like_count = like_count + 1 WHERE id = NEW.content_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE content SET like_count = like_count - 1 WHERE id = OLD.content_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_likes_content_count
+AFTER INSERT OR DELETE ON likes
+FOR EACH ROW EXECUTE FUNCTION content_like_count_trg();
+"""
+
+COMMENT_COUNT_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION content_comment_count_trg() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' AND NEW.deleted_at IS NULL THEN
+        UPDATE content SET comment_count = comment_count + 1 WHERE id = NEW.content_id;
+    ELSIF TG_OP = 'DELETE' AND OLD.deleted_at IS NULL THEN
+        UPDATE content SET comment_count = comment_count - 1 WHERE id = OLD.content_id;
+    ELSIF TG_OP = 'UPDATE' THEN
+        IF OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN
+            UPDATE content SET comment_count = comment_count - 1 WHERE id = OLD.content_id;
+        ELSIF OLD.deleted_at IS NOT NULL AND NEW.deleted_at IS NULL THEN
+            UPDATE content SET comment_count = comment_count + 1 WHERE id = NEW.content_id;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_comments_content_count
+AFTER INSERT OR DELETE OR UPDATE OF deleted_at ON comments
+FOR EACH ROW EXECUTE FUNCTION content_comment_count_trg();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('content', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('content', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill from the existing rows before the triggers take over.
+    op.execute(
+        "UPDATE content SET like_count = s.n FROM "
+        "(SELECT content_id, count(*) AS n FROM likes GROUP BY content_id) s "
+        "WHERE s.content_id = content.id"
+    )
+    op.execute(
+        "UPDATE content SET comment_count = s.n FROM "
+        "(SELECT content_id, count(*) AS n FROM comments WHERE deleted_at IS NULL GROUP BY content_id) s "
+        "WHERE s.content_id = content.id"
+    )
+    op.execute(LIKE_COUNT_TRIGGER_SQL)
+    op.execute(COMMENT_COUNT_TRIGGER_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_comments_content_count ON comments")
+    op.execute("DROP TRIGGER IF EXISTS trg_likes_content_count ON likes")
+    op.execute("DROP FUNCTION IF EXISTS content_comment_count_trg()")
+    op.execute("DROP FUNCTION IF EXISTS content_like_count_trg()")
+    op.drop_column('content', 'comment_count')
+    op.drop_column('content', 'like_count')
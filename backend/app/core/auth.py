@@ -12,6 +12,7 @@ import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from threading import Lock
 from uuid import UUID
 
@@ -23,9 +24,10 @@ from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.cache import CACHE_MISS, membership_cache, user_cache
+from app.core.cache import CACHE_MISS, group_membership_cache, membership_cache, user_cache
 from app.core.db import get_session
 from app.core.default_workspace import get_default_workspace_id
+from app.core.loaders import get_membership_loader
 from app.domain.enums import GroupRole, Permissions, WorkspaceRole
 from app.schemas.user import UserCreate, UserOut, UserUpdateAdmin
 from app.services.groups import GroupService
@@ -415,10 +417,14 @@ async def get_current_user(
     return user
 
 
+@lru_cache(maxsize=len(Permissions))
 def require_permission(minimum: Permissions) -> Callable[[UserOut], Awaitable[UserOut]]:
     """
     FastAPI dependency factory that enforces a minimum global permission level.
 
+    Cached per level, so every handler requiring the same level shares one
+    dependency callable and FastAPI resolves it once per request.
+
     Usage:
         @router.delete("/admin-only")
         async def admin_endpoint(
@@ -445,14 +451,23 @@ def require_permission(minimum: Permissions) -> Callable[[UserOut], Awaitable[Us
 # ---------------------------------------------------------------------------
 
 
-async def _get_workspace_role(
+async def get_workspace_role(
     workspace_id: UUID, user_id: UUID, session: AsyncSession
 ) -> WorkspaceRole | None:
-    """Return the user's workspace role from cache, falling back to DB on miss."""
+    """Return the user's workspace role from cache, falling back to DB on miss.
+
+    The role is memoised on the request's session, so repeat checks against the
+    same workspace skip the shared cache (a Redis round trip in production) too.
+    """
+    loader = get_membership_loader(session)
+    known = loader.peek(workspace_id, user_id)
+    if known is not CACHE_MISS:
+        return known  # type: ignore[return-value]  # WorkspaceRole or None (non-member)
     cached = await membership_cache.get(user_id, workspace_id)
     if cached is not CACHE_MISS:
+        loader.prime(workspace_id, user_id, cached)  # type: ignore[arg-type]
         return cached  # type: ignore[return-value]  # WorkspaceRole or None (non-member)
-    role = await WorkspaceService(session).find_user_role(workspace_id, user_id)
+    role = await loader.load(workspace_id, user_id)
     await membership_cache.set(user_id, workspace_id, role)
     return role
 
@@ -477,7 +492,23 @@ async def check_workspace_access(
     if current_user.permissions == Permissions.admin:
         return
 
-    role = await _get_workspace_role(workspace_id, current_user.id, session)
+    role = await get_workspace_role(workspace_id, current_user.id, session)
+    require_workspace_role(role, current_user, minimum_role, hide_from_non_members)
+
+
+def require_workspace_role(
+    role: WorkspaceRole | None,
+    current_user: UserOut,
+    minimum_role: WorkspaceRole,
+    hide_from_non_members: bool = False,
+) -> None:
+    """
+    Apply the ``check_workspace_access`` rules to a role the caller already fetched.
+
+    For handlers that read the role together with other data in one query.
+    """
+    if current_user.permissions == Permissions.admin:
+        return
 
     if role is None:
         if hide_from_non_members:
@@ -514,7 +545,7 @@ async def check_program_edit_access(
     if current_user.permissions == Permissions.admin:
         return
 
-    role = await _get_workspace_role(workspace_id, current_user.id, session)
+    role = await get_workspace_role(workspace_id, current_user.id, session)
 
     if role is None:
         if hide_from_non_members:
@@ -535,6 +566,17 @@ async def check_program_edit_access(
     )
 
 
+async def get_group_role(group_id: UUID, user_id: UUID, session: AsyncSession) -> GroupRole | None:
+    """Return the user's group role from cache, falling back to DB on miss."""
+    cached = await group_membership_cache.get(user_id, group_id)
+    if cached is not CACHE_MISS:
+        return cached  # type: ignore[return-value]  # GroupRole or None (non-member)
+    membership = await GroupService(session).get_user_membership(group_id, user_id)
+    role = membership.role if membership else None
+    await group_membership_cache.set(user_id, group_id, role)
+    return role
+
+
 async def check_group_access(
     group_id: UUID,
     current_user: UserOut,
@@ -549,13 +591,12 @@ async def check_group_access(
     if current_user.permissions == Permissions.admin:
         return
 
-    g_svc = GroupService(session)
-    membership = await g_svc.get_user_membership(group_id, current_user.id)
+    role = await get_group_role(group_id, current_user.id, session)
 
-    if not membership:
+    if role is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a group member")
 
-    if _GROUP_ROLE_RANK[membership.role] < _GROUP_ROLE_RANK[minimum_role]:
+    if _GROUP_ROLE_RANK[role] < _GROUP_ROLE_RANK[minimum_role]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Requires {minimum_role.value} role or higher",
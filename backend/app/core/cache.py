@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 from uuid import UUID
 
 from aiocache import BaseCache, RedisCache, SimpleMemoryCache  # type: ignore[import-untyped]
 from aiocache.serializers import PickleSerializer  # type: ignore[import-untyped]
 
-from app.domain.enums import WorkspaceRole
+from app.domain.enums import GroupRole, WorkspaceRole
+from app.schemas.email_list import EmailListOut
+from app.schemas.group import GroupOut
 from app.schemas.tag import TagOut
 from app.schemas.user import UserOut
 from app.settings import settings
@@ -15,10 +19,12 @@ from app.settings import settings
 # This lets WorkspaceMembershipCache distinguish "cache miss" from "confirmed non-member (None)".
 CACHE_MISS: object = object()
 
-# Internal sentinel stored in place of None to represent "confirmed non-member".
+# Internal marker stored in place of None to represent "confirmed non-member".
 # Needed because aiocache's base get() returns `default` whenever the value is None,
-# making it impossible to distinguish a stored None from a cache miss without this sentinel.
-_NON_MEMBER: object = object()
+# making it impossible to distinguish a stored None from a cache miss without it.
+# It must survive a pickle round trip through Redis, so it is compared by value;
+# an object() sentinel would come back as a different instance.
+_NON_MEMBER = "__none__"
 
 
 def _make_cache(ttl: int, namespace: str) -> BaseCache:
@@ -57,7 +63,7 @@ class WorkspaceMembershipCache:
         """Return CACHE_MISS when key absent, None for confirmed non-member, or WorkspaceRole."""
         key = f"{user_id}:{workspace_id}"
         value = await self._cache.get(key, default=CACHE_MISS)
-        if value is _NON_MEMBER:
+        if value == _NON_MEMBER:
             return None
         return value
 
@@ -70,11 +76,40 @@ class WorkspaceMembershipCache:
     async def invalidate(self, user_id: UUID, workspace_id: UUID) -> None:
         await self._cache.delete(f"{user_id}:{workspace_id}")
 
+    async def invalidate_workspace(self, workspace_id: UUID, user_ids: Iterable[UUID]) -> None:
+        """Drop the cached roles of a workspace's members (called on workspace delete)."""
+        await asyncio.gather(*(self.invalidate(user_id, workspace_id) for user_id in user_ids))
+
     async def clear_all(self) -> None:
-        """Flush the entire membership namespace (called on workspace delete)."""
+        """Flush the entire membership namespace."""
         await self._cache.clear(namespace=self._cache.namespace)
 
 
+class GroupMembershipCache:
+    """Group roles by (user, group), with the same miss/non-member protocol as workspaces."""
+
+    def __init__(self, backend: BaseCache) -> None:
+        self._cache = backend
+
+    async def get(self, user_id: UUID, group_id: UUID) -> GroupRole | None | object:
+        """Return CACHE_MISS when key absent, None for confirmed non-member, or GroupRole."""
+        value = await self._cache.get(f"{user_id}:{group_id}", default=CACHE_MISS)
+        if value == _NON_MEMBER:
+            return None
+        return value
+
+    async def set(self, user_id: UUID, group_id: UUID, role: GroupRole | None) -> None:
+        stored = _NON_MEMBER if role is None else role
+        await self._cache.set(f"{user_id}:{group_id}", stored)
+
+    async def invalidate(self, user_id: UUID, group_id: UUID) -> None:
+        await self._cache.delete(f"{user_id}:{group_id}")
+
+    async def invalidate_group(self, group_id: UUID, user_ids: Iterable[UUID]) -> None:
+        """Drop the cached roles of a group's members (called on group delete)."""
+        await asyncio.gather(*(self.invalidate(user_id, group_id) for user_id in user_ids))
+
+
 class TagsCache:
     _KEY = "all_tags"
 
@@ -92,9 +127,104 @@ class TagsCache:
         await self._cache.delete(self._KEY)
 
 
+class EmailListCache:
+    """Full subscriber list, shared by the admin listing and broadcasts."""
+
+    _KEY = "all"
+
+    def __init__(self, backend: BaseCache) -> None:
+        self._cache = backend
+
+    async def get(self) -> list[EmailListOut] | None:
+        result: list[EmailListOut] | None = await self._cache.get(self._KEY)
+        return result
+
+    async def set(self, entries: list[EmailListOut]) -> None:
+        await self._cache.set(self._KEY, entries)
+
+    async def invalidate(self) -> None:
+        await self._cache.delete(self._KEY)
+
+
+class GroupCache:
+    """Group detail payloads by id; they carry no per-user fields."""
+
+    def __init__(self, backend: BaseCache) -> None:
+        self._cache = backend
+
+    async def get(self, group_id: UUID) -> GroupOut | None:
+        result: GroupOut | None = await self._cache.get(str(group_id))
+        return result
+
+    async def set(self, group: GroupOut) -> None:
+        await self._cache.set(str(group.id), group)
+
+    async def invalidate(self, group_id: UUID) -> None:
+        await self._cache.delete(str(group_id))
+
+
+class GroupListCache:
+    """Pages of the group listing by ``(q, limit, offset)``, with their totals.
+
+    Any write to a group can move it between pages, so writes invalidate every
+    page at once by bumping a version counter that prefixes the page keys. The
+    old pages are never read again and age out with their TTL, which avoids a
+    key scan over the namespace on every write. Readers pass the version they
+    read to ``set``, so a page computed before a write is filed under the old
+    version rather than the new one.
+    """
+
+    _VERSION_KEY = "version"
+
+    def __init__(self, backend: BaseCache) -> None:
+        self._cache = backend
+
+    @staticmethod
+    def _key(version: int, q: str | None, limit: int, offset: int) -> str:
+        return f"{version}:{q or ''}:{limit}:{offset}"
+
+    async def version(self) -> int:
+        # increment() stores a bare integer (INCRBY on Redis), not a pickled value.
+        value = await self._cache.get(
+            self._VERSION_KEY, loads_fn=lambda v: None if v is None else int(v)
+        )
+        return value or 0
+
+    async def get(
+        self, version: int, q: str | None, limit: int, offset: int
+    ) -> tuple[list[GroupOut], int] | None:
+        result: tuple[list[GroupOut], int] | None = await self._cache.get(
+            self._key(version, q, limit, offset)
+        )
+        return result
+
+    async def set(
+        self,
+        version: int,
+        q: str | None,
+        limit: int,
+        offset: int,
+        page: tuple[list[GroupOut], int],
+    ) -> None:
+        await self._cache.set(self._key(version, q, limit, offset), page)
+
+    async def clear_all(self) -> None:
+        await self._cache.increment(self._VERSION_KEY)
+
+
 # Module-level singletons — instantiated once at import time.
 user_cache = UserCache(_make_cache(ttl=settings.cache_user_ttl_seconds, namespace="user"))
 membership_cache = WorkspaceMembershipCache(
     _make_cache(ttl=settings.cache_membership_ttl_seconds, namespace="membership")
 )
+group_membership_cache = GroupMembershipCache(
+    _make_cache(ttl=settings.cache_membership_ttl_seconds, namespace="group_membership")
+)
 tags_cache = TagsCache(_make_cache(ttl=settings.cache_tags_ttl_seconds, namespace="tags"))
+email_list_cache = EmailListCache(
+    _make_cache(ttl=settings.cache_email_list_ttl_seconds, namespace="email_list")
+)
+group_cache = GroupCache(_make_cache(ttl=settings.cache_group_ttl_seconds, namespace="group"))
+group_list_cache = GroupListCache(
+    _make_cache(ttl=settings.cache_group_list_ttl_seconds, namespace="group_list")
+)
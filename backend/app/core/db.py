@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 from functools import lru_cache
+from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 from app.settings import settings
 
@@ -16,7 +19,55 @@ from app.settings import settings
 @lru_cache
 def get_engine(url: str | None = None) -> AsyncEngine:
     db_url = url or settings.db_url
-    return create_async_engine(db_url, pool_pre_ping=True)
+    # Default compiled-statement cache is 500 entries; the app's distinct
+    # statements (filters × eager-load options) exceed that.
+    engine = create_async_engine(
+        db_url,
+        query_cache_size=1200,
+        connect_args=_connect_args(),
+        **_pool_args(),
+    )
+    if _use_prepared_statements():
+        event.listen(engine.sync_engine, "connect", _size_prepared_cache)
+    return engine
+
+
+def _pool_args() -> dict[str, Any]:
+    # Pre-ping is off by default: it costs a SELECT 1 round-trip on every
+    # checkout, and stale connections are retired by age through pool_recycle.
+    if settings.db_use_pgbouncer:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+# Prepare a statement on its second execution rather than psycopg's default fifth,
+# so the list/count/get queries that run on every request skip the parse/plan step.
+_PREPARE_THRESHOLD = 2
+
+
+def _use_prepared_statements() -> bool:
+    # Transaction-mode PgBouncer hands each transaction a different backend, so a
+    # statement prepared on one is missing on the next ("prepared statement ...
+    # does not exist"); the PgBouncer switch turns them off along with the pool.
+    return settings.db_prepared_statements and not settings.db_use_pgbouncer
+
+
+def _connect_args() -> dict[str, Any]:
+    if not _use_prepared_statements():
+        return {"prepare_threshold": None}
+    return {"prepare_threshold": _PREPARE_THRESHOLD}
+
+
+def _size_prepared_cache(dbapi_connection: Any, _record: Any) -> None:
+    # psycopg keeps 100 prepared statements per connection by default, fewer than
+    # the app's distinct statements; evicted ones would be re-prepared in a loop.
+    dbapi_connection.driver_connection.prepared_max = settings.db_prepared_max
 
 
 def get_session_maker(
@@ -8,6 +8,7 @@ logic and the key names used in the JSON.
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
 import logging
 import os
@@ -40,6 +41,7 @@ def read_seed_output() -> dict:
     return {}
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_workspace_id() -> UUID | None:
     """Return the default workspace UUID, or None if not configured.
 
@@ -47,7 +49,10 @@ def get_default_workspace_id() -> UUID | None:
     1. DEFAULT_WORKSPACE_ID environment variable (takes priority)
     2. dagskrarbankinn_workspace_id key in seed_output.json
 
-    Resolved once at startup — treat the return value as a deployment-time constant.
+    Resolved once per process — the seed output is a deployment-time artefact, so
+    the (immutable) UUID is cached rather than re-reading the environment and the
+    file on every call. Call ``get_default_workspace_id.cache_clear()`` after
+    re-seeding if a running process must pick up the new value.
     """
     ws_id: str | None = None
     with contextlib.suppress(Exception):
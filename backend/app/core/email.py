@@ -1,32 +1,55 @@
 from __future__ import annotations
 
+import json
 import logging
 
 import resend
 from fastapi import BackgroundTasks
+from redis.asyncio import Redis
+from starlette.concurrency import run_in_threadpool
 
+from app.core.db import get_session_maker
+from app.repositories.email_list import EmailListRepository
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
 _BATCH_SIZE = 100
+# Resend accepts at most 50 addresses in a single "bcc" field.
+_BCC_LIMIT = 50
 
+# Redis stream drained by ``python -m app.workers.email_outbox`` when
+# EMAIL_QUEUE_BACKEND is "redis".
+OUTBOX_STREAM = "email:outbox"
 
-def _send_email(recipients: list[str], subject: str, html: str) -> None:
+_outbox: Redis | None = None
+
+
+def outbox_client() -> Redis:
+    """Return the process-wide Redis client for the email outbox (created on first use)."""
+    global _outbox
+    if _outbox is None:
+        _outbox = Redis(host=settings.redis_host, port=settings.redis_port, decode_responses=True)
+    return _outbox
+
+
+def send_email(recipients: list[str], subject: str, html: str) -> None:
+    """Send one message to all recipients, BCC'd in envelopes of up to ``_BCC_LIMIT``."""
     if not settings.resend_api_key:
         logger.warning("RESEND_API_KEY not configured — skipping email to %s", recipients)
         return
 
     resend.api_key = settings.resend_api_key
-    params: resend.Emails.SendParams = {
-        "from": settings.resend_from_email,
-        "to": [settings.resend_from_email],
-        "bcc": recipients,
-        "reply_to": settings.resend_from_email,
-        "subject": subject,
-        "html": html,
-    }
-    resend.Emails.send(params)
+    for i in range(0, len(recipients), _BCC_LIMIT):
+        params: resend.Emails.SendParams = {
+            "from": settings.resend_from_email,
+            "to": [settings.resend_from_email],
+            "bcc": recipients[i : i + _BCC_LIMIT],
+            "reply_to": settings.resend_from_email,
+            "subject": subject,
+            "html": html,
+        }
+        resend.Emails.send(params)
 
 
 def _send_batch(messages: list[tuple[str, str, str, str | None]]) -> None:
@@ -64,6 +87,13 @@ def _send_batch(messages: list[tuple[str, str, str, str | None]]) -> None:
         resend.Batch.send(params)
 
 
+async def _enqueue_email(recipients: list[str], subject: str, html: str) -> None:
+    await outbox_client().xadd(
+        OUTBOX_STREAM,
+        {"recipients": json.dumps(recipients), "subject": subject, "html": html},
+    )
+
+
 def send_email_background(
     background_tasks: BackgroundTasks,
     recipients: list[str],
@@ -72,11 +102,16 @@ def send_email_background(
 ) -> None:
     """Queue an email to be sent after the response is returned.
 
-    If RESEND_API_KEY is not set the call is a no-op (logs a warning).
-    FastAPI runs sync background tasks in a thread-pool executor, so the
-    blocking Resend SDK call does not block the event loop.
+    With EMAIL_QUEUE_BACKEND="redis" the message is only appended to the outbox
+    stream and a separate worker process talks to Resend. Otherwise the send runs
+    here as a sync background task, which FastAPI executes in a thread pool.
+
+    If RESEND_API_KEY is not set the send is a no-op (logs a warning).
     """
-    background_tasks.add_task(_send_email, recipients, subject, html)
+    if settings.email_queue_backend == "redis":
+        background_tasks.add_task(_enqueue_email, recipients, subject, html)
+    else:
+        background_tasks.add_task(send_email, recipients, subject, html)
 
 
 def send_batch_background(
@@ -88,3 +123,33 @@ def send_batch_background(
     Each message is (recipient, subject, html, unsubscribe_url).
     """
     background_tasks.add_task(_send_batch, messages)
+
+
+def unsubscribe_url(token: object) -> str:
+    return f"https://slodi.is/unsubscribe?token={token}"
+
+
+async def _broadcast_to_subscribers(subject: str, html: str) -> None:
+    """Stream the email list and send one Resend batch per chunk.
+
+    Runs after the response with its own session (the request's is closed by
+    then), so only one chunk of subscribers is ever held in memory.
+    """
+    async with get_session_maker()() as session:
+        async for chunk in EmailListRepository(session).iter_chunks(_BATCH_SIZE):
+            messages: list[tuple[str, str, str, str | None]] = []
+            for entry in chunk:
+                unsub_url = unsubscribe_url(entry.unsubscribe_token)
+                messages.append(
+                    (entry.email, subject, html.replace("{unsubscribe_url}", unsub_url), unsub_url)
+                )
+            await run_in_threadpool(_send_batch, messages)
+
+
+def send_broadcast_background(background_tasks: BackgroundTasks, subject: str, html: str) -> None:
+    """Queue a broadcast to every subscriber on the email list.
+
+    ``html`` may contain the literal ``{unsubscribe_url}`` placeholder, which is
+    replaced per recipient.
+    """
+    background_tasks.add_task(_broadcast_to_subscribers, subject, html)
@@ -12,17 +12,38 @@ ALLOWED_TEMPLATES: set[str] = {"welcome", "newsletter", "new_feature", "workspac
 _TEMPLATE_DIR = Path(__file__).resolve().parent
 _TEXT_CONFIG_PATH = _TEMPLATE_DIR / "template_text.json"
 
+# Templates ship with the code, so compiled templates are cached for the life of
+# the process without a stat() per render. Only template_text.json is edited live.
 _env = Environment(
     loader=FileSystemLoader(str(_TEMPLATE_DIR)),
     autoescape=select_autoescape(["html"]),
+    auto_reload=False,
 )
 
+# Built once; css_inline.inline() would construct a default inliner per call.
+_inliner = css_inline.CSSInliner()
+
+
+# (mtime_ns, parsed config) of the last read; None until first use.
+_text_config_cache: tuple[int, dict[str, dict[str, str]]] | None = None
+
 
 def _load_text_config() -> dict[str, dict[str, str]]:
-    """Load editable text overrides from template_text.json."""
-    if not _TEXT_CONFIG_PATH.exists():
+    """Load editable text overrides from template_text.json.
+
+    The parsed file is kept in memory and only re-read when its mtime changes,
+    so renders don't read and parse JSON from disk inside the request. Keying
+    on mtime keeps other workers in step after ``save_text_config``.
+    """
+    global _text_config_cache
+    try:
+        mtime = _TEXT_CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
+    if _text_config_cache is not None and _text_config_cache[0] == mtime:
+        return _text_config_cache[1]
     result: dict[str, dict[str, str]] = json.loads(_TEXT_CONFIG_PATH.read_text(encoding="utf-8"))
+    _text_config_cache = (mtime, result)
     return result
 
 
@@ -46,7 +67,7 @@ def render(template_name: str, context: dict[str, Any]) -> str:
        Raise ``ValueError`` (→ 404) for unknown names.
     2. Load editable text from ``template_text.json`` and merge into context.
     3. Render the Jinja2 template with merged context.
-    4. Inline CSS via ``css_inline.inline()``.
+    4. Inline CSS with the module-level ``css_inline.CSSInliner``.
     5. Return the final HTML string.
 
     NOTE: Do **not** pass ``unsubscribe_url`` in *context*.
@@ -72,5 +93,5 @@ def render(template_name: str, context: dict[str, Any]) -> str:
 
     template = _env.get_template(f"{template_name}.html")
     html = template.render(**merged)
-    inlined: str = css_inline.inline(html)
+    inlined: str = _inliner.inline(html)
     return inlined
@@ -0,0 +1,10 @@
+from fastapi import Response
+
+
+def set_location(response: Response, path: str) -> None:
+    """Add a ``Location`` header for a created resource.
+
+    Appends the raw header pair, skipping ``MutableHeaders``' lookup for an
+    existing value and its per-call latin-1 encode; create handlers set it once.
+    """
+    response.raw_headers.append((b"location", path.encode("ascii")))
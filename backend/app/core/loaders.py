@@ -0,0 +1,61 @@
+"""Request-scoped memo of workspace roles.
+
+A loader lives in ``session.info`` and therefore shares the lifetime of the
+request's ``AsyncSession``. Each ``(workspace, user)`` pair is queried at most
+once per request; membership writes clear the memo so a later check in the
+same request sees the new role.
+
+Lookups run inline on the caller's task. Nothing in the app resolves roles
+concurrently, so batching them would never save a query, and a detached task
+could outlive the session it queries on.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import CACHE_MISS
+from app.domain.enums import WorkspaceRole
+from app.repositories.workspaces import WorkspaceRepository
+
+MembershipKey = tuple[UUID, UUID]  # (workspace_id, user_id)
+
+_MEMBERSHIP_LOADER_KEY = "membership_loader"
+
+
+class MembershipRoleLoader:
+    def __init__(self, session: AsyncSession) -> None:
+        self._repo = WorkspaceRepository(session)
+        self._roles: dict[MembershipKey, WorkspaceRole | None] = {}
+
+    async def load(self, workspace_id: UUID, user_id: UUID) -> WorkspaceRole | None:
+        """Return the user's role in the workspace (None if not a member)."""
+        key = (workspace_id, user_id)
+        if key in self._roles:
+            return self._roles[key]
+        # Failures propagate without being memoised, so a later load() retries.
+        roles = await self._repo.find_user_roles([key])
+        role = self._roles[key] = roles.get(key)
+        return role
+
+    def peek(self, workspace_id: UUID, user_id: UUID) -> WorkspaceRole | None | object:
+        """Return the memoised role, or CACHE_MISS if this pair has not been loaded."""
+        return self._roles.get((workspace_id, user_id), CACHE_MISS)
+
+    def prime(self, workspace_id: UUID, user_id: UUID, role: WorkspaceRole | None) -> None:
+        """Memoise a role resolved elsewhere (e.g. the shared cache) for the rest of the request."""
+        self._roles.setdefault((workspace_id, user_id), role)
+
+    def clear(self) -> None:
+        """Forget every memoised role; called after a membership write."""
+        self._roles.clear()
+
+
+def get_membership_loader(session: AsyncSession) -> MembershipRoleLoader:
+    """Return the membership loader bound to this session, creating it on first use."""
+    loader = session.info.get(_MEMBERSHIP_LOADER_KEY)
+    if loader is None:
+        loader = session.info[_MEMBERSHIP_LOADER_KEY] = MembershipRoleLoader(session)
+    return loader
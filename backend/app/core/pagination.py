@@ -1,11 +1,28 @@
 import math
-from typing import Annotated
+from collections.abc import Sequence
+from typing import Annotated, Any
+from urllib.parse import parse_qsl, urlencode
 
-from fastapi import Query, Request, Response
+from fastapi import HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, TypeAdapter
 
 Limit = Annotated[int, Query(ge=1, le=200, description="Max items to return (1-200)")]
 Offset = Annotated[int, Query(ge=0, description="Number of items to skip")]
 
+SEARCH_MIN_LENGTH = 2
+
+_PAGE_KEYS = ("offset", "limit")
+
+
+def search_query(description: str) -> Any:
+    """Default for a list endpoint's optional ``q`` search parameter."""
+    return Query(None, min_length=SEARCH_MIN_LENGTH, description=description)
+
+
+def invalid_cursor() -> HTTPException:
+    """Error for a keyset ``after`` id that names no row, so its page cannot be located."""
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
 
 def add_pagination_headers(
     *,
@@ -15,16 +32,24 @@ def add_pagination_headers(
     limit: int,
     offset: int,
 ) -> None:
-    """Attach RFC 8288 Link headers + helpful count headers."""
+    """Attach RFC 8288 Link headers + helpful count headers.
+
+    The request's query string is parsed once; the links differ only in
+    ``offset``, which is appended to a shared prefix. The headers are appended
+    to ``raw_headers`` as pre-encoded pairs in one extend, rather than set one
+    by one through ``MutableHeaders``.
+    """
     links: list[str] = []
 
-    def url_with(new_offset: int, new_limit: int | None = None) -> str:
-        return str(
-            request.url.include_query_params(
-                offset=new_offset,
-                limit=new_limit if new_limit is not None else limit,
-            )
-        )
+    # Same URLs as url.include_query_params(offset=..., limit=...), which would
+    # re-parse and re-encode the query for each link.
+    url = request.url
+    kept = [(k, v) for k, v in parse_qsl(url.query, keep_blank_values=True) if k not in _PAGE_KEYS]
+    base = url.replace(query="")
+    prefix = f"{base}?{urlencode(kept)}&" if kept else f"{base}?"
+
+    def url_with(new_offset: int) -> str:
+        return f"{prefix}offset={new_offset}&limit={limit}"
 
     # next
     if offset + limit < total:
@@ -40,9 +65,51 @@ def add_pagination_headers(
     last_offset = 0 if total == 0 else max(0, (math.ceil(total / limit) - 1) * limit)
     links.append(f'<{url_with(last_offset)}>; rel="last"')
 
-    if links:
-        response.headers["Link"] = ", ".join(links)
+    response.raw_headers.extend(
+        (
+            (b"link", ", ".join(links).encode("latin-1")),
+            (b"x-total-count", str(total).encode()),
+            (b"x-limit", str(limit).encode()),
+            (b"x-offset", str(offset).encode()),
+        )
+    )
+
+
+def add_keyset_headers(
+    *,
+    response: Response,
+    request: Request,
+    limit: int,
+    next_after: object | None,
+) -> None:
+    """Attach a ``rel="next"`` Link carrying the keyset cursor, if there is a next page.
+
+    Keyset pages have no total or offset, so only ``X-Limit`` accompanies it.
+    """
+    if next_after is not None:
+        url = request.url.remove_query_params("offset").include_query_params(
+            after=next_after, limit=limit
+        )
+        response.raw_headers.append((b"link", f'<{url}>; rel="next"'.encode("latin-1")))
+    response.raw_headers.append((b"x-limit", str(limit).encode()))
+
+
+def list_response(
+    adapter: TypeAdapter[list[Any]], items: Sequence[Any], response: Response
+) -> Response:
+    """Serialize a page of already-built schema objects in one ``dump_json`` pass.
+
+    Returning a ``Response`` skips FastAPI's per-item re-validation of the
+    ``response_model``, but also the merge of headers set on the injected
+    ``response``, so the pagination headers are carried over here.
+    """
+    out = Response(content=adapter.dump_json(list(items)), media_type="application/json")
+    out.headers.raw.extend(response.headers.raw)
+    return out
+
 
-    response.headers["X-Total-Count"] = str(total)
-    response.headers["X-Limit"] = str(limit)
-    response.headers["X-Offset"] = str(offset)
+def model_response(item: BaseModel, response: Response) -> Response:
+    """Serialize one already-built schema object, carrying over headers like ``list_response``."""
+    out = Response(content=item.model_dump_json(), media_type="application/json")
+    out.headers.raw.extend(response.headers.raw)
+    return out
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 
-from fastapi import FastAPI, Request
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 
 from app.core.logging import configure_logging
 from app.routers import (
@@ -28,9 +30,60 @@ from app.settings import settings
 
 _log = logging.getLogger(__name__)
 
+ROUTERS: tuple[APIRouter, ...] = (
+    email_list_router.router,
+    email_router.router,
+    users_router.router,
+    groups_router.router,
+    workspaces_router.router,
+    troops_router.router,
+    programs_router.router,
+    events_router.router,
+    tasks_router.router,
+    tags_router.router,
+    comments_router.router,
+    likes_router.router,
+    heidursordla_router.router,
+    game_scores_router.router,
+)
+
+
+def assert_unique_routes(routers: Iterable[APIRouter]) -> None:
+    """Fail startup if two handlers are registered for the same method and path.
+
+    Starlette silently serves whichever route was added first, so a duplicate
+    would otherwise shadow a handler without any error.
+    """
+    seen: dict[tuple[str, str], str] = {}
+    for router in routers:
+        for route in router.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            for method in route.methods:
+                key = (method, route.path)
+                if key in seen:
+                    raise RuntimeError(
+                        f"Duplicate route {method} {key[1]}: {seen[key]} and {route.name}"
+                    )
+                seen[key] = route.name
+
+
+def assert_shared_cache(web_concurrency: int, cache_backend: str) -> None:
+    """Fail startup if several workers would each keep their own in-memory caches.
+
+    Cache invalidation only reaches the worker that served the write, so a
+    revoked role or an unsubscribed address would stay cached on the others
+    until the TTL runs out.
+    """
+    if web_concurrency > 1 and cache_backend != "redis":
+        raise RuntimeError(
+            f"WEB_CONCURRENCY={web_concurrency} requires CACHE_BACKEND=redis, got {cache_backend!r}"
+        )
+
 
 def create_app() -> FastAPI:
     configure_logging()
+    assert_shared_cache(settings.web_concurrency, settings.cache_backend)
     app = FastAPI(title="Backend API")
 
     # Add CORS middleware
@@ -58,20 +111,9 @@ def create_app() -> FastAPI:
             content={"detail": "Internal server error"},
         )
 
-    app.include_router(email_list_router.router)
-    app.include_router(email_router.router)
-    app.include_router(users_router.router)
-    app.include_router(groups_router.router)
-    app.include_router(workspaces_router.router)
-    app.include_router(troops_router.router)
-    app.include_router(programs_router.router)
-    app.include_router(events_router.router)
-    app.include_router(tasks_router.router)
-    app.include_router(tags_router.router)
-    app.include_router(comments_router.router)
-    app.include_router(likes_router.router)
-    app.include_router(heidursordla_router.router)
-    app.include_router(game_scores_router.router)
+    for router in ROUTERS:
+        app.include_router(router)
+    assert_unique_routes(ROUTERS)
 
     @app.get("/healthz")
     async def healthz() -> dict[str, bool]:
@@ -1,4 +1,5 @@
 # ruff: noqa: F401
+from . import content_stats  # registers the count triggers on metadata create_all
 from .base import Base
 from .comment import Comment
 from .content import Content, ContentType
@@ -4,7 +4,7 @@ import datetime as dt
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, ForeignKey, Index, String
+from sqlalchemy import CheckConstraint, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import DateTime as SADateTime
@@ -39,6 +39,7 @@ class Comment(SoftDeleteMixin, Base):
     created_at: Mapped[dt.datetime] = mapped_column(
         SADateTime(timezone=True),
         nullable=False,
+        server_default=func.now(),
     )
 
     user_id: Mapped[UUID] = mapped_column(
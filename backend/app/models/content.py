@@ -8,7 +8,10 @@ from uuid import UUID, uuid4
 from sqlalchemy import (
     CheckConstraint,
     ForeignKey,
+    Index,
     String,
+    func,
+    text,
 )
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
@@ -46,6 +49,15 @@ class Content(SoftDeleteMixin, Base):
         "with_polymorphic": "*",
     }
     __table_args__ = (
+        # Workspace listings always filter on live rows; a partial index keeps
+        # soft-deleted content out of the index entirely.
+        Index(
+            "ix_content_workspace_live",
+            "workspace_id",
+            "content_type",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
         CheckConstraint("count_min >= 0", name="ck_content_count_min_nonneg"),
         CheckConstraint("count_max >= 0", name="ck_content_count_max_nonneg"),
         CheckConstraint(
@@ -107,9 +119,15 @@ class Content(SoftDeleteMixin, Base):
     price: Mapped[int | None] = mapped_column(Integer, nullable=True)
     prep_time_min: Mapped[int | None] = mapped_column(Integer, nullable=True)
     prep_time_max: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Maintained by triggers on likes/comments (see content_stats.py); never set from Python.
+    like_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[dt.datetime] = mapped_column(
         SADateTime(timezone=True),
         nullable=False,
+        server_default=func.now(),
     )
     author_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -0,0 +1,66 @@
+"""Triggers that keep ``content.like_count`` / ``content.comment_count`` current.
+
+The counts are maintained at write time so list and detail reads select two
+plain columns instead of running correlated COUNT subqueries per row. The same
+SQL is installed by the Alembic migration and, via the ``after_create`` hook
+below, by ``Base.metadata.create_all`` (used by the integration tests).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import DDL, event
+
+from .base import Base
+
+LIKE_COUNT_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION content_like_count_trg() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE content SET like_count = like_count + 1 WHERE id = NEW.content_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE content SET like_count = like_count - 1 WHERE id = OLD.content_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_likes_content_count
+AFTER INSERT OR DELETE ON likes
+FOR EACH ROW EXECUTE FUNCTION content_like_count_trg();
+"""
+
+# Comments are soft-deleted, so only rows with deleted_at IS NULL are counted
+# and flipping deleted_at moves a comment in or out of the count.
+COMMENT_COUNT_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION content_comment_count_trg() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' AND NEW.deleted_at IS NULL THEN
+        UPDATE content SET comment_count = comment_count + 1 WHERE id = NEW.content_id;
+    ELSIF TG_OP = 'DELETE' AND OLD.deleted_at IS NULL THEN
+        UPDATE content SET comment_count = comment_count - 1 WHERE id = OLD.content_id;
+    ELSIF TG_OP = 'UPDATE' THEN
+        IF OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN
+            UPDATE content SET comment_count = comment_count - 1 WHERE id = OLD.content_id;
+        ELSIF OLD.deleted_at IS NOT NULL AND NEW.deleted_at IS NULL THEN
+            UPDATE content SET comment_count = comment_count + 1 WHERE id = NEW.content_id;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_comments_content_count
+AFTER INSERT OR DELETE OR UPDATE OF deleted_at ON comments
+FOR EACH ROW EXECUTE FUNCTION content_comment_count_trg();
+"""
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(LIKE_COUNT_TRIGGER_SQL).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(COMMENT_COUNT_TRIGGER_SQL).execute_if(dialect="postgresql"),
+)
@@ -25,10 +25,13 @@ class Task(Content):
         nullable=False,
     )
 
+    # Indexed as ix_tasks_event_id. deleted_at lives on the parent ``content`` table,
+    # so the index can't be partial.
     event_id: Mapped[UUID | None] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("events.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
     # Relationships
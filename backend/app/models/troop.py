@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,6 +16,14 @@ if TYPE_CHECKING:
 
 class Troop(SoftDeleteMixin, Base):
     __tablename__ = "troops"
+    __table_args__ = (
+        Index(
+            "ix_troops_workspace_live",
+            "workspace_id",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     # Columns
     id: Mapped[UUID] = mapped_column(
@@ -45,6 +53,8 @@ class Troop(SoftDeleteMixin, Base):
 
 class TroopParticipation(Base):
     __tablename__ = "troop_participation"
+    # The composite PK leads with troop_id; event pages look up by event_id.
+    __table_args__ = (Index("ix_troop_participation_event_id", "event_id"),)
 
     # Columns
     troop_id: Mapped[UUID] = mapped_column(
@@ -3,9 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, String, UniqueConstraint
+from sqlalchemy import CheckConstraint, Computed, Index, String, UniqueConstraint, text
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import (
     Mapped,
@@ -39,6 +39,9 @@ class User(SoftDeleteMixin, Base):
         UniqueConstraint("email", name="uq_users_email"),
         CheckConstraint(f"char_length(name) >= {NAME_MIN}", name="ck_users_name_min"),
         CheckConstraint(f"char_length(auth0_id) >= {AUTH0_ID_MIN}", name="ck_users_auth0_min"),
+        CheckConstraint(f"char_length(email) <= {EMAIL_MAX}", name="ck_users_email_max"),
+        Index("ix_users_live_name", "name", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_users_search", "search_tsv", postgresql_using="gin"),
     )
 
     # Columns
@@ -65,8 +68,9 @@ class User(SoftDeleteMixin, Base):
         nullable=True,
     )
 
+    # citext compares case-insensitively, so lookups need no lower() on either side.
     email: Mapped[str] = mapped_column(
-        String(EMAIL_MAX),
+        CITEXT(),
         nullable=False,
         index=True,
     )
@@ -82,6 +86,17 @@ class User(SoftDeleteMixin, Base):
         nullable=True,
     )
 
+    # Maintained by Postgres; backs the ``q`` search in UserRepository.
+    search_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(email::text, '')"
+            " || ' ' || coalesce(auth0_id, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Relationships
     ws_memberships: Mapped[list[WorkspaceMembership]] = relationship(back_populates="user")
     group_memberships: Mapped[list[GroupMembership]] = relationship(back_populates="user")
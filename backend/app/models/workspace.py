@@ -8,6 +8,7 @@ from sqlalchemy import (
     CheckConstraint,
     Date,
     ForeignKey,
+    Index,
     String,
     Time,
 )
@@ -111,6 +112,8 @@ class Workspace(SoftDeleteMixin, Base):
 
 class WorkspaceMembership(Base):
     __tablename__ = "workspace_memberships"
+    # The composite PK leads with workspace_id; "my workspaces" looks up by user.
+    __table_args__ = (Index("ix_workspace_memberships_user_id", "user_id"),)
 
     # Columns
     workspace_id: Mapped[UUID] = mapped_column(
@@ -3,12 +3,36 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any, TypeVar
 
-from sqlalchemy import Select
+from sqlalchemy import ColumnElement, Select, func, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 T = TypeVar("T")
 
 
+def with_total(stmt: Select[Any]) -> Select[Any]:
+    """Append a ``COUNT(*) OVER ()`` column labelled ``total``.
+
+    The window is evaluated before LIMIT/OFFSET, so every returned row carries
+    the size of the full filtered result set — one round trip instead of a
+    separate COUNT query.
+    """
+    return stmt.add_columns(func.count().over().label("total"))
+
+
+def keyset_after(
+    stmt: Select[Any], key: ColumnElement[Any], id_col: ColumnElement[Any], after: Any
+) -> Select[Any]:
+    """Keep the rows of ``stmt`` that sort after the row ``after`` on ``(key, id_col)``.
+
+    The cursor row's key is read by a scalar subquery. It is left uncorrelated, as
+    its table is also in the outer FROM and would otherwise be correlated away.
+    An unknown ``after`` makes the subquery NULL and the page empty; see
+    ``Repository.cursor_exists``.
+    """
+    cursor_key = select(key).where(id_col == after).correlate(None).scalar_subquery()
+    return stmt.where(tuple_(key, id_col) > tuple_(cursor_key, literal(after, id_col.type)))
+
+
 class Repository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -17,6 +41,10 @@ class Repository:
         self.session.add(instance)
         return instance
 
+    async def cursor_exists(self, id_col: ColumnElement[Any], after: Any) -> bool:
+        """Whether a keyset cursor names a row, to tell a stale cursor from the last page."""
+        return await self.session.scalar(select(id_col).where(id_col == after)) is not None
+
     async def scalars(self, stmt: Select[Any]) -> Sequence[Any]:
         result = await self.session.execute(stmt)
         return result.scalars().all()
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.comment import Comment
-from app.repositories.base import Repository
+from app.repositories.base import Repository, with_total
 
 
 class CommentRepository(Repository):
@@ -53,6 +53,25 @@ class CommentRepository(Repository):
         )
         return await self.scalars(stmt)
 
+    async def list_for_content_with_total(
+        self,
+        content_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[Comment], int]:
+        """Return one page of a content item's comments together with the unpaginated total."""
+        stmt = with_total(
+            select(Comment)
+            .where(Comment.content_id == content_id, Comment.deleted_at.is_(None))
+            .order_by(desc(Comment.created_at), Comment.id)
+        )
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_content_comments(content_id) if offset else 0
+        return [comment for comment, _ in rows], rows[0].total
+
     async def create(self, comment: Comment) -> Comment:
         await self.add(comment)
         return comment
@@ -63,6 +82,7 @@ class CommentRepository(Repository):
             update(Comment)
             .where(Comment.id == comment_id, Comment.deleted_at.is_(None))
             .values(deleted_at=now)
+            .execution_options(synchronize_session=False)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
@@ -1,49 +1,72 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, NamedTuple, cast
 from uuid import UUID
 
-from sqlalchemy import false, func, select
+from sqlalchemy import BindParameter, ColumnElement, Table, false, select, update
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
-from app.models.comment import Comment
 from app.models.content import Content
 from app.models.like import UserLikedContent
 from app.repositories.base import Repository
 
 
-@dataclass
-class ContentStats:
+class ContentStats(NamedTuple):
+    """Per-row stats selected alongside a content item.
+
+    The columns below already come back as Python ``int``/``bool`` from the
+    driver, so rows can be unpacked positionally without coercion.
+    """
+
     like_count: int
     comment_count: int
     liked_by_me: bool
 
 
-def like_count_subq() -> Any:
-    """Correlated subquery: COUNT of likes for the current Content row."""
-    return (
-        select(func.count())
-        .select_from(UserLikedContent)
-        .where(UserLikedContent.content_id == Content.id)
-        .correlate(Content)
-        .scalar_subquery()
-    )
+# ``__table__`` is typed as a FromClause; DML constructs need the Table itself.
+content_table = cast(Table, Content.__table__)
+
+# Stats of a row that was just inserted, so the read-back after a create does not
+# have to select them.
+NEW_CONTENT_STATS = ContentStats(like_count=0, comment_count=0, liked_by_me=False)
 
 
-def comment_count_subq() -> Any:
-    """Correlated subquery: COUNT of non-deleted comments for the current Content row."""
+def list_deferrals(entity: Any) -> tuple[Any, ...]:
+    """Loader options that skip the body columns no ``*ListOut`` schema reads.
+
+    ``instructions`` and ``media`` are the largest columns on a content row; list
+    pages never serialize them, so they are left in the database. ``raiseload``
+    turns an accidental access into an error instead of a lazy load per row.
+    """
     return (
-        select(func.count())
-        .select_from(Comment)
-        .where(Comment.content_id == Content.id, Comment.deleted_at.is_(None))
-        .correlate(Content)
-        .scalar_subquery()
+        defer(entity.instructions, raiseload=True),
+        defer(entity.media, raiseload=True),
     )
 
 
-def liked_by_me_subq(current_user_id: UUID | None) -> Any:
-    """Correlated EXISTS subquery: True if current_user has liked the row."""
+# The counters are read off the bare ``content`` table rather than the mapped
+# Content class. Selected next to a subtype such as Task, an ORM attribute would add
+# Content as a second, polymorphic FROM entry; the table column resolves against
+# the ``content`` table the subtype's own join already brings in.
+
+
+def like_count_col() -> Any:
+    """Like count for the current Content row (trigger-maintained column)."""
+    return Content.__table__.c.like_count
+
+
+def comment_count_col() -> Any:
+    """Non-deleted comment count for the current Content row (trigger-maintained column)."""
+    return Content.__table__.c.comment_count
+
+
+def liked_by_me_subq(current_user_id: UUID | BindParameter[UUID] | None) -> Any:
+    """Correlated EXISTS subquery: True if current_user has liked the row.
+
+    ``current_user_id`` may be a bind parameter for statements built ahead of time.
+    """
     if current_user_id is None:
         return false()
     return (
@@ -57,9 +80,52 @@ def liked_by_me_subq(current_user_id: UUID | None) -> Any:
     )
 
 
+async def update_content_fields(
+    session: AsyncSession,
+    model: type[Content],
+    content_id: UUID,
+    values: dict[str, Any],
+    *,
+    guard: ColumnElement[bool] | None = None,
+) -> bool:
+    """Patch a live content row and its subtype row with plain UPDATEs.
+
+    Columns are split between the ``content`` table and the subtype's own table,
+    so neither the row nor its relations are loaded first. Returns ``False`` if no
+    live content of ``model``'s type has that id, or if ``guard`` (a condition on
+    the ``content`` row) does not hold for it.
+    """
+    content, subtype = content_table, cast(Table, model.__table__)
+    base_values = {k: v for k, v in values.items() if k in content.c}
+    subtype_values = {k: v for k, v in values.items() if k not in content.c}
+    match = (
+        content.c.id == content_id,
+        content.c.content_type == model.__mapper__.polymorphic_identity,
+        content.c.deleted_at.is_(None),
+        *(() if guard is None else (guard,)),
+    )
+    if base_values:
+        res = await session.execute(update(content).where(*match).values(**base_values))
+        assert isinstance(res, CursorResult)
+        found = bool(res.rowcount)
+    else:
+        found = await session.scalar(select(content.c.id).where(*match)) is not None
+    if found and subtype_values:
+        await session.execute(
+            update(subtype).where(subtype.c.id == content_id).values(**subtype_values)
+        )
+    return found
+
+
 class ContentRepository(Repository):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
 
     async def get_author_id(self, content_id: UUID) -> UUID | None:
-        return await self.session.scalar(select(Content.author_id).where(Content.id == content_id))
+        # The bare table rather than the mapped class: Content is loaded
+        # with_polymorphic="*", so select(Content.author_id) would outer-join every
+        # subtype table for a lookup that only needs the content primary key.
+        content = Content.__table__
+        return await self.session.scalar(
+            select(content.c.author_id).where(content.c.id == content_id)
+        )
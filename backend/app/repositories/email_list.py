@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,9 +20,32 @@ class EmailListRepository(Repository):
         stmt = select(EmailList).order_by(EmailList.email.asc())
         return await self.scalars(stmt)
 
-    async def create(self, email_entry: EmailList) -> EmailList:
-        await self.add(email_entry)
-        return email_entry
+    async def count(self) -> int:
+        result = await self.session.scalar(select(func.count()).select_from(EmailList))
+        return result or 0
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[Sequence[EmailList]]:
+        """Yield subscribers ``chunk_size`` rows at a time from a server-side cursor."""
+        result = await self.session.stream_scalars(
+            select(EmailList)
+            .order_by(EmailList.email.asc())
+            .execution_options(yield_per=chunk_size)
+        )
+        async for chunk in result.partitions():
+            yield chunk
+
+    async def create_if_absent(self, email: str) -> bool:
+        """Subscribe ``email`` with ``INSERT ... ON CONFLICT DO NOTHING``.
+
+        Returns whether a row was inserted; an existing subscription is left as is.
+        """
+        res = await self.session.execute(
+            pg_insert(EmailList)
+            .values(email=email)
+            .on_conflict_do_nothing(index_elements=[EmailList.email])
+        )
+        assert isinstance(res, CursorResult)
+        return bool(res.rowcount)
 
     async def delete(self, email: str) -> int:
         res = await self.session.execute(delete(EmailList).where(EmailList.email == email))
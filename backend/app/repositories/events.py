@@ -1,27 +1,58 @@
 from __future__ import annotations
 
 import datetime as dt
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import and_, asc, func, select, update
+from sqlalchemy import ColumnElement, Select, Table, and_, asc, func, select, update
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, noload, raiseload, selectinload
 
+from app.domain.enums import ContentType, WorkspaceRole
 from app.models.content import Content
 from app.models.event import Event
 from app.models.tag import ContentTag
 from app.models.task import Task
-from app.repositories.base import Repository
+from app.models.workspace import WorkspaceMembership
+from app.repositories.base import Repository, keyset_after, with_total
 from app.repositories.content import (
     ContentStats,
-    comment_count_subq,
-    like_count_subq,
+    comment_count_col,
+    content_table,
+    like_count_col,
     liked_by_me_subq,
+    list_deferrals,
+    update_content_fields,
 )
+from app.repositories.tasks import TaskRepository
+
+_tasks_table = cast(Table, Task.__table__)
 
 
 class EventRepository(Repository):
+    # Eager loads for everything EventListOut / EventOut read, declared once so the
+    # list and detail queries (and other repositories returning events) stay in sync.
+    list_options = (
+        # Many-to-one, so joined into the main query rather than loaded separately.
+        joinedload(Event.author),
+        joinedload(Event.workspace),
+        selectinload(Event.content_tags).selectinload(ContentTag.tag),
+        # Any other relationship raises on access instead of lazy loading.
+        raiseload("*"),
+    )
+    detail_options = (
+        *list_options,
+        selectinload(Event.tasks).options(*TaskRepository.list_options),
+        selectinload(Event.comments),
+    )
+    # An event that was just inserted has no tasks or comments yet.
+    created_options = (
+        *list_options,
+        noload(Event.tasks),
+        noload(Event.comments),
+    )
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
 
@@ -29,27 +60,47 @@ class EventRepository(Repository):
         self, event_id: UUID, current_user_id: UUID | None = None
     ) -> tuple[Event, ContentStats] | None:
         stmt = (
-            select(
-                Event, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id)
-            )
-            .options(
-                selectinload(Event.author),
-                selectinload(Event.workspace),
-                selectinload(Event.tasks).options(
-                    selectinload(Task.author),
-                    selectinload(Task.workspace),
-                    selectinload(Task.content_tags).selectinload(ContentTag.tag),
+            select(Event, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id))
+            .options(*self.detail_options)
+            .where(Event.id == event_id, Event.deleted_at.is_(None))
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None
+        event, lc, cc, lm = row
+        return event, ContentStats(lc, cc, lm)
+
+    async def get_created(self, event_id: UUID) -> Event | None:
+        """Read back an event created in this request, without its (empty) stats."""
+        return await self.session.scalar(
+            select(Event).options(*self.created_options).where(Event.id == event_id)
+        )
+
+    async def get_workspace_id(self, event_id: UUID) -> UUID | None:
+        """Return the event's workspace id without loading the event or its relations."""
+        return await self.session.scalar(
+            select(Event.workspace_id).where(Event.id == event_id, Event.deleted_at.is_(None))
+        )
+
+    async def get_workspace_id_with_role(
+        self, event_id: UUID, user_id: UUID
+    ) -> tuple[UUID, WorkspaceRole | None] | None:
+        """Return the event's workspace id and the user's role there (None if not a member)."""
+        stmt = (
+            select(Event.workspace_id, WorkspaceMembership.role)
+            .outerjoin(
+                WorkspaceMembership,
+                and_(
+                    WorkspaceMembership.workspace_id == Event.workspace_id,
+                    WorkspaceMembership.user_id == user_id,
                 ),
-                selectinload(Event.comments),
-                selectinload(Event.content_tags).selectinload(ContentTag.tag),
             )
             .where(Event.id == event_id, Event.deleted_at.is_(None))
         )
         row = (await self.session.execute(stmt)).first()
         if row is None:
             return None
-        event, lc, cc, lm = row
-        return event, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm))
+        return row.workspace_id, row.role
 
     async def get_in_program(
         self,
@@ -59,20 +110,8 @@ class EventRepository(Repository):
         current_user_id: UUID | None = None,
     ) -> tuple[Event, ContentStats] | None:
         stmt = (
-            select(
-                Event, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id)
-            )
-            .options(
-                selectinload(Event.author),
-                selectinload(Event.workspace),
-                selectinload(Event.tasks).options(
-                    selectinload(Task.author),
-                    selectinload(Task.workspace),
-                    selectinload(Task.content_tags).selectinload(ContentTag.tag),
-                ),
-                selectinload(Event.comments),
-                selectinload(Event.content_tags).selectinload(ContentTag.tag),
-            )
+            select(Event, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id))
+            .options(*self.detail_options)
             .where(
                 Event.id == event_id,
                 Event.program_id == program_id,
@@ -84,7 +123,68 @@ class EventRepository(Repository):
         if row is None:
             return None
         event, lc, cc, lm = row
-        return event, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm))
+        return event, ContentStats(lc, cc, lm)
+
+    @staticmethod
+    def _filter_conds(
+        date_from: dt.datetime | None, date_to: dt.datetime | None
+    ) -> list[ColumnElement[bool]]:
+        conds: list[ColumnElement[bool]] = [Event.deleted_at.is_(None)]
+        if date_from is not None:
+            conds.append(Event.start_dt >= date_from)
+        if date_to is not None:
+            conds.append(Event.start_dt <= date_to)
+        return conds
+
+    @staticmethod
+    def _list_stmt(conds: list[ColumnElement[bool]], current_user_id: UUID | None) -> Select[Any]:
+        return (
+            select(Event, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id))
+            .options(*EventRepository.list_options, *list_deferrals(Event))
+            .where(and_(*conds))
+            .order_by(asc(Event.start_dt), Event.id)
+        )
+
+    async def _page(
+        self,
+        conds: list[ColumnElement[bool]],
+        current_user_id: UUID | None,
+        *,
+        limit: int,
+        offset: int,
+        after: UUID | None,
+    ) -> list[tuple[Event, ContentStats]]:
+        stmt = self._list_stmt(conds, current_user_id).limit(limit)
+        if after is not None:
+            stmt = keyset_after(stmt, Event.start_dt, Event.id, after)
+        else:
+            stmt = stmt.offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        return [(event, ContentStats(lc, cc, lm)) for event, lc, cc, lm in rows]
+
+    async def _page_with_total(
+        self,
+        conds: list[ColumnElement[bool]],
+        current_user_id: UUID | None,
+        *,
+        limit: int,
+        offset: int,
+    ) -> tuple[list[tuple[Event, ContentStats]], int]:
+        stmt = with_total(self._list_stmt(conds, current_user_id))
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            total = 0
+            if offset:
+                total = (
+                    await self.session.scalar(
+                        select(func.count()).select_from(Event).where(and_(*conds))
+                    )
+                    or 0
+                )
+            return [], total
+        items = [(event, ContentStats(lc, cc, lm)) for event, lc, cc, lm, _ in rows]
+        return items, rows[0].total
 
     async def count_for_workspace(
         self,
@@ -93,12 +193,7 @@ class EventRepository(Repository):
         date_from: dt.datetime | None = None,
         date_to: dt.datetime | None = None,
     ) -> int:
-        conds = [Event.workspace_id == workspace_id, Event.deleted_at.is_(None)]
-        if date_from is not None:
-            conds.append(Event.start_dt >= date_from)
-        if date_to is not None:
-            conds.append(Event.start_dt <= date_to)
-
+        conds = [Event.workspace_id == workspace_id, *self._filter_conds(date_from, date_to)]
         result = await self.session.scalar(
             select(func.count()).select_from(Event).where(and_(*conds))
         )
@@ -113,32 +208,29 @@ class EventRepository(Repository):
         date_to: dt.datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: UUID | None = None,
     ) -> list[tuple[Event, ContentStats]]:
-        conds = [Event.workspace_id == workspace_id, Event.deleted_at.is_(None)]
-        if date_from is not None:
-            conds.append(Event.start_dt >= date_from)
-        if date_to is not None:
-            conds.append(Event.start_dt <= date_to)
+        """List events ordered by ``(start_dt, id)``.
 
-        stmt = (
-            select(
-                Event, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id)
-            )
-            .options(
-                selectinload(Event.author),
-                selectinload(Event.workspace),
-                selectinload(Event.content_tags).selectinload(ContentTag.tag),
-            )
-            .where(and_(*conds))
-            .order_by(asc(Event.start_dt))
-            .limit(limit)
-            .offset(offset)
-        )
-        rows = (await self.session.execute(stmt)).all()
-        return [
-            (event, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm)))
-            for event, lc, cc, lm in rows
-        ]
+        With ``after`` set, pages by keyset instead: rows sorting after the event
+        with that id are returned and ``offset`` is ignored.
+        """
+        conds = [Event.workspace_id == workspace_id, *self._filter_conds(date_from, date_to)]
+        return await self._page(conds, current_user_id, limit=limit, offset=offset, after=after)
+
+    async def list_for_workspace_with_total(
+        self,
+        workspace_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        date_from: dt.datetime | None = None,
+        date_to: dt.datetime | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[tuple[Event, ContentStats]], int]:
+        """Return one page of a workspace's events together with the unpaginated total."""
+        conds = [Event.workspace_id == workspace_id, *self._filter_conds(date_from, date_to)]
+        return await self._page_with_total(conds, current_user_id, limit=limit, offset=offset)
 
     async def count_for_program(
         self,
@@ -151,13 +243,8 @@ class EventRepository(Repository):
         conds = [
             Event.workspace_id == workspace_id,
             Event.program_id == program_id,
-            Event.deleted_at.is_(None),
+            *self._filter_conds(date_from, date_to),
         ]
-        if date_from is not None:
-            conds.append(Event.start_dt >= date_from)
-        if date_to is not None:
-            conds.append(Event.start_dt <= date_to)
-
         result = await self.session.scalar(
             select(func.count()).select_from(Event).where(and_(*conds))
         )
@@ -173,36 +260,59 @@ class EventRepository(Repository):
         date_to: dt.datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: UUID | None = None,
     ) -> list[tuple[Event, ContentStats]]:
+        """List events ordered by ``(start_dt, id)``.
+
+        With ``after`` set, pages by keyset instead: rows sorting after the event
+        with that id are returned and ``offset`` is ignored.
+        """
         conds = [
             Event.workspace_id == workspace_id,
             Event.program_id == program_id,
-            Event.deleted_at.is_(None),
+            *self._filter_conds(date_from, date_to),
         ]
-        if date_from is not None:
-            conds.append(Event.start_dt >= date_from)
-        if date_to is not None:
-            conds.append(Event.start_dt <= date_to)
+        return await self._page(conds, current_user_id, limit=limit, offset=offset, after=after)
 
-        stmt = (
-            select(
-                Event, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id)
-            )
-            .options(
-                selectinload(Event.author),
-                selectinload(Event.workspace),
-                selectinload(Event.content_tags).selectinload(ContentTag.tag),
-            )
-            .where(and_(*conds))
-            .order_by(asc(Event.start_dt))
-            .limit(limit)
-            .offset(offset)
-        )
-        rows = (await self.session.execute(stmt)).all()
-        return [
-            (event, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm)))
-            for event, lc, cc, lm in rows
+    async def list_for_program_with_total(
+        self,
+        workspace_id: UUID,
+        program_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        date_from: dt.datetime | None = None,
+        date_to: dt.datetime | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[tuple[Event, ContentStats]], int]:
+        """Return one page of a program's events together with the unpaginated total."""
+        conds = [
+            Event.workspace_id == workspace_id,
+            Event.program_id == program_id,
+            *self._filter_conds(date_from, date_to),
         ]
+        return await self._page_with_total(conds, current_user_id, limit=limit, offset=offset)
+
+    async def update_fields(self, event_id: UUID, values: dict[str, Any]) -> bool:
+        """Apply a column patch in place. Returns ``False`` if the event does not exist.
+
+        When the patch sets a ``program_id``, the UPDATE also requires that program
+        to be live and in the event's workspace, so ``False`` can mean either.
+        """
+        guard = None
+        if values.get("program_id") is not None:
+            content, program = Content.__table__, Content.__table__.alias("program")
+            guard = (
+                select(program.c.id)
+                .where(
+                    program.c.id == values["program_id"],
+                    program.c.content_type == ContentType.program,
+                    program.c.deleted_at.is_(None),
+                    program.c.workspace_id == content.c.workspace_id,
+                )
+                .exists()
+            )
+        return await update_content_fields(self.session, Event, event_id, values, guard=guard)
 
     async def create(self, event: Event) -> Event:
         await self.add(event)
@@ -211,16 +321,26 @@ class EventRepository(Repository):
     async def delete(self, event_id: UUID) -> int:
         now = dt.datetime.now(dt.timezone.utc)
 
-        # Orphan tasks: clear event_id so tasks remain as workspace tasks
-        await self.session.execute(
-            update(Task).where(Task.event_id == event_id).values(event_id=None)
+        # Orphan tasks: clear event_id so tasks remain as workspace tasks. It rides
+        # along as a data-modifying CTE, so the delete is one round trip.
+        tasks_orphaned = (
+            update(_tasks_table)
+            .where(_tasks_table.c.event_id == event_id)
+            .values(event_id=None)
+            .cte("tasks_orphaned")
         )
 
-        # Soft-delete the event itself
+        # Soft-delete the event itself; the rowcount doubles as the existence check.
+        content = content_table
         res = await self.session.execute(
-            update(Content)
-            .where(Content.id == event_id, Content.deleted_at.is_(None))
+            update(content)
+            .where(
+                content.c.id == event_id,
+                content.c.content_type == ContentType.event,
+                content.c.deleted_at.is_(None),
+            )
             .values(deleted_at=now)
+            .add_cte(tasks_orphaned)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import builtins
 import datetime as dt
 from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Select, and_, delete, func, select, update
+from sqlalchemy import Boolean, Select, and_, delete, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -12,7 +15,7 @@ from sqlalchemy.orm import selectinload
 from app.domain.enums import GroupRole
 from app.models.group import Group, GroupMemberRow, GroupMembership
 from app.models.user import User
-from app.repositories.base import Repository
+from app.repositories.base import Repository, keyset_after, with_total
 
 
 class GroupRepository(Repository):
@@ -33,6 +36,11 @@ class GroupRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
+    async def exists(self, group_id: UUID) -> bool:
+        """EXISTS probe for 404 checks; stops at the primary-key hit and loads nothing."""
+        stmt = select(Group.id).where(Group.id == group_id, Group.deleted_at.is_(None)).exists()
+        return bool(await self.session.scalar(select(stmt)))
+
     async def count(self, *, q: str | None = None) -> int:
         stmt = select(func.count()).select_from(Group).where(Group.deleted_at.is_(None))
         if q:
@@ -41,15 +49,39 @@ class GroupRepository(Repository):
         result = await self.session.scalar(stmt)
         return result or 0
 
-    async def list(
-        self, *, q: str | None = None, limit: int = 50, offset: int = 0
-    ) -> Sequence[Group]:
+    @staticmethod
+    def _list_stmt(q: str | None) -> Select[tuple[Group]]:
         stmt = select(Group).where(Group.deleted_at.is_(None)).order_by(Group.name)
         if q:
             ilike = f"%{q.strip()}%"
             stmt = stmt.where(Group.name.ilike(ilike))
-        stmt = stmt.limit(limit).offset(offset)
-        return await self.scalars(stmt)
+        return stmt
+
+    async def list(
+        self, *, q: str | None = None, limit: int = 50, offset: int = 0
+    ) -> Sequence[Group]:
+        return await self.scalars(self._list_stmt(q).limit(limit).offset(offset))
+
+    async def list_with_total(
+        self, *, q: str | None = None, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[Group], int]:
+        """Return one page of groups together with the unpaginated total."""
+        stmt = with_total(self._list_stmt(q))
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count(q=q) if offset else 0
+        return [group for group, _ in rows], rows[0].total
+
+    async def update_fields(self, group_id: UUID, values: dict[str, Any]) -> Group | None:
+        """Apply a column patch with ``UPDATE ... RETURNING``; None if the group does not exist."""
+        res = await self.session.execute(
+            update(Group)
+            .where(Group.id == group_id, Group.deleted_at.is_(None))
+            .values(**values)
+            .returning(Group)
+        )
+        return res.scalars().first()
 
     async def create(self, group: Group) -> Group:
         await self.add(group)
@@ -61,11 +93,17 @@ class GroupRepository(Repository):
             update(Group)
             .where(Group.id == group_id, Group.deleted_at.is_(None))
             .values(deleted_at=now)
+            .execution_options(synchronize_session=False)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
 
     # ----- memberships -----
+
+    async def list_member_ids(self, group_id: UUID) -> builtins.list[UUID]:
+        stmt = select(GroupMembership.user_id).where(GroupMembership.group_id == group_id)
+        return list(await self.scalars(stmt))
+
     async def count_groups_for_user(self, user_id: UUID) -> int:
         result = await self.session.scalar(
             select(func.count())
@@ -75,19 +113,32 @@ class GroupRepository(Repository):
         )
         return result or 0
 
-    async def list_groups_for_user(
-        self, user_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Group]:
-        stmt = (
+    @staticmethod
+    def _groups_for_user_stmt(user_id: UUID) -> Select[tuple[Group]]:
+        return (
             select(Group)
             .join(GroupMembership, Group.id == GroupMembership.group_id)
             .where(GroupMembership.user_id == user_id, Group.deleted_at.is_(None))
             .order_by(Group.name)
-            .limit(limit)
-            .offset(offset)
         )
+
+    async def list_groups_for_user(
+        self, user_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> Sequence[Group]:
+        stmt = self._groups_for_user_stmt(user_id).limit(limit).offset(offset)
         return await self.scalars(stmt)
 
+    async def list_groups_for_user_with_total(
+        self, user_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[Group], int]:
+        """Return one page of a user's groups together with the unpaginated total."""
+        stmt = with_total(self._groups_for_user_stmt(user_id))
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_groups_for_user(user_id) if offset else 0
+        return [group for group, _ in rows], rows[0].total
+
     async def count_group_members(self, group_id: UUID) -> int:
         result = await self.session.scalar(
             select(func.count())
@@ -96,10 +147,9 @@ class GroupRepository(Repository):
         )
         return result or 0
 
-    async def list_group_members(
-        self, group_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[GroupMemberRow]:  # type: ignore[valid-type]
-        stmt = (
+    @staticmethod
+    def _group_members_stmt(group_id: UUID) -> Select[Any]:
+        return (
             select(
                 User.id.label("user_id"),
                 User.name,
@@ -107,15 +157,43 @@ class GroupRepository(Repository):
             )
             .select_from(GroupMembership)
             .join(User, User.id == GroupMembership.user_id)
+            # Joining the live group lets an empty page stand in for the 404 check.
+            .join(Group, and_(Group.id == GroupMembership.group_id, Group.deleted_at.is_(None)))
             .where(GroupMembership.group_id == group_id)
             .order_by(func.lower(User.name).asc(), User.id.asc())
-            .limit(limit)
-            .offset(offset)
         )
+
+    async def list_group_members(
+        self, group_id: UUID, *, limit: int = 50, offset: int = 0, after: UUID | None = None
+    ) -> list[GroupMemberRow]:  # type: ignore[valid-type]
+        """List a group's members ordered by ``(lower(name), user_id)``.
+
+        With ``after`` set, pages by keyset instead: members sorting after the user
+        with that id are returned and ``offset`` is ignored.
+        """
+        stmt = self._group_members_stmt(group_id).limit(limit)
+        if after is not None:
+            stmt = keyset_after(stmt, func.lower(User.name), User.id, after)
+        else:
+            stmt = stmt.offset(offset)
         res = await self.session.execute(stmt)
         # Row -> dataclass
         return [GroupMemberRow(**row._mapping) for row in res.all()]
 
+    async def list_group_members_with_total(
+        self, group_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[list[GroupMemberRow], int]:  # type: ignore[valid-type]
+        """Return one page of a group's members together with the unpaginated total."""
+        stmt = with_total(self._group_members_stmt(group_id))
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_group_members(group_id) if offset else 0
+        members = [
+            GroupMemberRow(user_id=row.user_id, name=row.name, role=row.role) for row in rows
+        ]
+        return members, rows[0].total
+
     async def get_membership(self, group_id: UUID, user_id: UUID) -> GroupMembership | None:
         return await self.session.scalar(
             select(GroupMembership).where(
@@ -126,15 +204,39 @@ class GroupRepository(Repository):
             )
         )
 
+    async def update_membership(
+        self, group_id: UUID, user_id: UUID, values: dict[str, Any]
+    ) -> GroupMembership | None:
+        """Apply a patch with ``UPDATE ... RETURNING``; None if there is no such membership."""
+        if not values:
+            return await self.get_membership(group_id, user_id)
+        res = await self.session.execute(
+            update(GroupMembership)
+            .where(GroupMembership.group_id == group_id, GroupMembership.user_id == user_id)
+            .values(**values)
+            .returning(GroupMembership)
+        )
+        return res.scalars().first()
+
     async def add_membership(
         self, group_id: UUID, user_id: UUID, role: GroupRole
     ) -> tuple[bool, GroupMembership]:
-        existing = await self.get_membership(group_id, user_id)
-        if existing:
-            return False, existing
-        gs = GroupMembership(group_id=group_id, user_id=user_id, role=role)
-        await self.add(gs)
-        return True, gs
+        """Insert a membership, or return the existing one unchanged, in one statement.
+
+        The conflict branch rewrites ``role`` with its own value so that ``RETURNING``
+        yields the existing row; ``xmax = 0`` only holds for a freshly inserted one.
+        """
+        stmt = (
+            pg_insert(GroupMembership)
+            .values(group_id=group_id, user_id=user_id, role=role)
+            .on_conflict_do_update(
+                index_elements=[GroupMembership.group_id, GroupMembership.user_id],
+                set_={"role": GroupMembership.role},
+            )
+            .returning(GroupMembership, literal_column("xmax = 0", Boolean).label("created"))
+        )
+        gm, created = (await self.session.execute(stmt)).one()
+        return created, gm
 
     async def remove_member(self, group_id: UUID, user_id: UUID) -> int:
         res = await self.session.execute(
@@ -4,11 +4,12 @@ from collections.abc import Sequence
 from uuid import UUID
 
 from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.like import UserLikedContent
-from app.repositories.base import Repository
+from app.repositories.base import Repository, with_total
 
 
 class LikeRepository(Repository):
@@ -29,19 +30,62 @@ class LikeRepository(Repository):
         *,
         limit: int = 50,
         offset: int = 0,
+        after: UUID | None = None,
     ) -> Sequence[UserLikedContent]:
+        """List a content item's likes ordered by ``user_id``.
+
+        With ``after`` set, pages by keyset instead: likes from users sorting after
+        that id are returned and ``offset`` is ignored.
+        """
         stmt = (
             select(UserLikedContent)
             .where(UserLikedContent.content_id == content_id)
+            .order_by(UserLikedContent.user_id)
             .limit(limit)
-            .offset(offset)
         )
+        if after is not None:
+            stmt = stmt.where(UserLikedContent.user_id > after)
+        else:
+            stmt = stmt.offset(offset)
         return await self.scalars(stmt)
 
+    async def list_for_content_with_total(
+        self,
+        content_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[UserLikedContent], int]:
+        """Return one page of a content item's likes together with the unpaginated total."""
+        stmt = with_total(
+            select(UserLikedContent)
+            .where(UserLikedContent.content_id == content_id)
+            .order_by(UserLikedContent.user_id)
+        )
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_content_likes(content_id) if offset else 0
+        return [like for like, _ in rows], rows[0].total
+
     async def create(self, like: UserLikedContent) -> UserLikedContent:
         await self.add(like)
         return like
 
+    async def upsert(self, user_id: UUID, content_id: UUID) -> bool:
+        """Insert the like unless it already exists; return whether a row was inserted.
+
+        ``ON CONFLICT DO NOTHING`` makes a repeated like a no-op in one statement,
+        and the like-count trigger only fires for rows actually inserted.
+        """
+        res = await self.session.execute(
+            pg_insert(UserLikedContent)
+            .values(user_id=user_id, content_id=content_id)
+            .on_conflict_do_nothing(index_elements=["user_id", "content_id"])
+        )
+        assert isinstance(res, CursorResult)
+        return bool(res.rowcount)
+
     async def delete(self, user_id: UUID, content_id: UUID) -> int:
         res = await self.session.execute(
             delete(UserLikedContent).where(
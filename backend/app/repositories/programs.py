@@ -1,29 +1,58 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Any
-from uuid import UUID
+from typing import Any, cast
+from uuid import UUID, uuid4
 
-from sqlalchemy import ColumnElement, Select, func, or_, select, update
+from sqlalchemy import ColumnElement, Select, Table, func, insert, literal, or_, select, update
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, noload, raiseload, selectinload
 
-from app.models.content import Content
+from app.domain.enums import ContentType
 from app.models.event import Event
 from app.models.program import Program
 from app.models.tag import ContentTag
-from app.repositories.base import Repository
+from app.repositories.base import Repository, with_total
 from app.repositories.content import (
     ContentStats,
-    comment_count_subq,
-    like_count_subq,
+    comment_count_col,
+    content_table,
+    like_count_col,
     liked_by_me_subq,
+    list_deferrals,
+    update_content_fields,
 )
+from app.repositories.events import EventRepository
 from app.schemas.program import ProgramFilters
 
+_events_table = cast(Table, Event.__table__)
+_programs_table = cast(Table, Program.__table__)
+_content_tags_table = cast(Table, ContentTag.__table__)
+
 
 class ProgramRepository(Repository):
+    # Eager loads for everything ProgramListOut / ProgramOut read, declared once so
+    # the list and detail queries stay in sync.
+    list_options = (
+        joinedload(Program.author),
+        joinedload(Program.workspace),
+        selectinload(Program.content_tags).selectinload(ContentTag.tag),
+        # Any other relationship raises on access instead of lazy loading.
+        raiseload("*"),
+    )
+    detail_options = (
+        *list_options,
+        selectinload(Program.events).options(*EventRepository.list_options),
+        selectinload(Program.comments),
+    )
+    # A program that was just inserted has no events or comments yet.
+    created_options = (
+        *list_options,
+        noload(Program.events),
+        noload(Program.comments),
+    )
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
 
@@ -32,45 +61,44 @@ class ProgramRepository(Repository):
     ) -> tuple[Program, ContentStats] | None:
         stmt = (
             select(
-                Program, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id)
-            )
-            .options(
-                selectinload(Program.author),
-                selectinload(Program.workspace),
-                selectinload(Program.events).options(
-                    selectinload(Event.author),
-                    selectinload(Event.workspace),
-                    selectinload(Event.content_tags).selectinload(ContentTag.tag),
-                ),
-                selectinload(Program.comments),
-                selectinload(Program.content_tags).selectinload(ContentTag.tag),
+                Program, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id)
             )
+            .options(*self.detail_options)
             .where(Program.id == program_id, Program.deleted_at.is_(None))
         )
         row = (await self.session.execute(stmt)).first()
         if row is None:
             return None
         prog, lc, cc, lm = row
-        return prog, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm))
+        return prog, ContentStats(lc, cc, lm)
+
+    async def get_created(self, program_id: UUID) -> Program | None:
+        """Read back a program created in this request, without its (empty) stats."""
+        return await self.session.scalar(
+            select(Program).options(*self.created_options).where(Program.id == program_id)
+        )
+
+    async def get_owner(self, program_id: UUID) -> tuple[UUID, UUID | None] | None:
+        """Return ``(workspace_id, author_id)`` without loading the program or its relations."""
+        row = (
+            await self.session.execute(
+                select(Program.workspace_id, Program.author_id).where(
+                    Program.id == program_id, Program.deleted_at.is_(None)
+                )
+            )
+        ).first()
+        if row is None:
+            return None
+        return row.workspace_id, row.author_id
 
     async def get_in_workspace(
         self, program_id: UUID, workspace_id: UUID, current_user_id: UUID | None = None
     ) -> tuple[Program, ContentStats] | None:
         stmt = (
             select(
-                Program, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id)
-            )
-            .options(
-                selectinload(Program.author),
-                selectinload(Program.workspace),
-                selectinload(Program.events).options(
-                    selectinload(Event.author),
-                    selectinload(Event.workspace),
-                    selectinload(Event.content_tags).selectinload(ContentTag.tag),
-                ),
-                selectinload(Program.comments),
-                selectinload(Program.content_tags).selectinload(ContentTag.tag),
+                Program, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id)
             )
+            .options(*self.detail_options)
             .where(
                 Program.id == program_id,
                 Program.workspace_id == workspace_id,
@@ -81,7 +109,7 @@ class ProgramRepository(Repository):
         if row is None:
             return None
         prog, lc, cc, lm = row
-        return prog, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm))
+        return prog, ContentStats(lc, cc, lm)
 
     def _apply_filters(self, stmt: Select, filters: ProgramFilters) -> Select:  # noqa: C901
         """Apply filter conditions to a SELECT statement."""
@@ -157,6 +185,22 @@ class ProgramRepository(Repository):
         result = await self.session.scalar(stmt)
         return result or 0
 
+    def _list_stmt(
+        self,
+        workspace_id: UUID,
+        current_user_id: UUID | None,
+        filters: ProgramFilters | None,
+    ) -> Select[Any]:
+        resolved_filters = filters or ProgramFilters()
+        lc_subq = like_count_col()
+        stmt = (
+            select(Program, lc_subq, comment_count_col(), liked_by_me_subq(current_user_id))
+            .options(*self.list_options, *list_deferrals(Program))
+            .where(Program.workspace_id == workspace_id, Program.deleted_at.is_(None))
+        )
+        stmt = self._apply_filters(stmt, resolved_filters)
+        return self._apply_sort(stmt, resolved_filters, like_count_col=lc_subq)
+
     async def list_by_workspace(
         self,
         workspace_id: UUID,
@@ -166,43 +210,122 @@ class ProgramRepository(Repository):
         offset: int = 0,
         filters: ProgramFilters | None = None,
     ) -> list[tuple[Program, ContentStats]]:
-        resolved_filters = filters or ProgramFilters()
-        lc_subq = like_count_subq()
-        stmt = (
-            select(Program, lc_subq, comment_count_subq(), liked_by_me_subq(current_user_id))
-            .options(
-                selectinload(Program.author),
-                selectinload(Program.workspace),
-                selectinload(Program.content_tags).selectinload(ContentTag.tag),
-            )
-            .where(Program.workspace_id == workspace_id, Program.deleted_at.is_(None))
-        )
-        stmt = self._apply_filters(stmt, resolved_filters)
-        stmt = self._apply_sort(stmt, resolved_filters, like_count_col=lc_subq)
-        stmt = stmt.limit(limit).offset(offset)
-        rows = (await self.session.execute(stmt)).all()
-        return [
-            (prog, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm)))
-            for prog, lc, cc, lm in rows
-        ]
+        stmt = self._list_stmt(workspace_id, current_user_id, filters)
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        return [(prog, ContentStats(lc, cc, lm)) for prog, lc, cc, lm in rows]
+
+    async def list_by_workspace_with_total(
+        self,
+        workspace_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        filters: ProgramFilters | None = None,
+    ) -> tuple[list[tuple[Program, ContentStats]], int]:
+        """Return one page of a workspace's programs together with the unpaginated total."""
+        stmt = with_total(self._list_stmt(workspace_id, current_user_id, filters))
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_programs_for_workspace(
+                workspace_id, filters
+            ) if offset else 0
+        items = [(prog, ContentStats(lc, cc, lm)) for prog, lc, cc, lm, _ in rows]
+        return items, rows[0].total
+
+    async def update_fields(self, program_id: UUID, values: dict[str, Any]) -> bool:
+        """Apply a column patch in place. Returns ``False`` if the program does not exist."""
+        return await update_content_fields(self.session, Program, program_id, values)
 
     async def create(self, program: Program) -> Program:
         await self.add(program)
         return program
 
+    # Content columns carried over by copy_to_workspace; identity, authorship,
+    # counters and timestamps are set fresh for the copy.
+    _COPIED_COLUMNS = (
+        "content_type",
+        "name",
+        "description",
+        "image",
+        "media",
+        "equipment",
+        "instructions",
+        "duration_min",
+        "duration_max",
+        "age",
+        "location",
+        "count_min",
+        "count_max",
+        "price",
+        "prep_time_min",
+        "prep_time_max",
+    )
+
+    async def copy_to_workspace(
+        self, program_id: UUID, workspace_id: UUID, author_id: UUID
+    ) -> UUID | None:
+        """Copy a program and its tags server-side with ``INSERT ... SELECT``.
+
+        Returns the new program's id, or ``None`` if the source does not exist.
+        """
+        # Core tables rather than the mapped classes: Content is polymorphic, so an
+        # ORM select would outer-join every subtype table.
+        content, programs, content_tags = content_table, _programs_table, _content_tags_table
+        new_id = uuid4()
+        source = (
+            select(
+                literal(new_id, content.c.id.type),
+                literal(workspace_id, content.c.workspace_id.type),
+                literal(author_id, content.c.author_id.type),
+                *(content.c[name] for name in self._COPIED_COLUMNS),
+            )
+            .join_from(content, programs, programs.c.id == content.c.id)
+            .where(content.c.id == program_id, content.c.deleted_at.is_(None))
+        )
+        res = await self.session.execute(
+            insert(content).from_select(
+                ["id", "workspace_id", "author_id", *self._COPIED_COLUMNS], source
+            )
+        )
+        assert isinstance(res, CursorResult)
+        if not res.rowcount:
+            return None
+        await self.session.execute(insert(programs).values(id=new_id))
+        await self.session.execute(
+            insert(content_tags).from_select(
+                ["content_id", "tag_id"],
+                select(
+                    literal(new_id, content_tags.c.content_id.type), content_tags.c.tag_id
+                ).where(content_tags.c.content_id == program_id),
+            )
+        )
+        return new_id
+
     async def delete(self, program_id: UUID) -> int:
         now = dt.datetime.now(dt.timezone.utc)
 
-        # Orphan events: clear program_id so events remain as standalone workspace events
-        await self.session.execute(
-            update(Event).where(Event.program_id == program_id).values(program_id=None)
+        # Orphan events: clear program_id so events remain as standalone workspace
+        # events. It rides along as a data-modifying CTE, so the delete is one round trip.
+        events_orphaned = (
+            update(_events_table)
+            .where(_events_table.c.program_id == program_id)
+            .values(program_id=None)
+            .cte("events_orphaned")
         )
 
-        # Soft-delete the program itself
+        # Soft-delete the program itself; the rowcount doubles as the existence check.
+        content = content_table
         res = await self.session.execute(
-            update(Content)
-            .where(Content.id == program_id, Content.deleted_at.is_(None))
+            update(content)
+            .where(
+                content.c.id == program_id,
+                content.c.content_type == ContentType.program,
+                content.c.deleted_at.is_(None),
+            )
             .values(deleted_at=now)
+            .add_cte(events_orphaned)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
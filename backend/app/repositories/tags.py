@@ -1,22 +1,37 @@
 from __future__ import annotations
 
+import builtins
 import datetime as dt
 from collections.abc import Sequence
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import Select, and_, delete, func, select, update
+from sqlalchemy import Select, Table, and_, bindparam, delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from app.models.content import Content
 from app.models.tag import ContentTag, Tag
-from app.repositories.base import Repository
+from app.repositories.base import Repository, keyset_after, with_total
 from app.repositories.content import (
     ContentStats,
-    comment_count_subq,
-    like_count_subq,
+    comment_count_col,
+    content_table,
+    like_count_col,
     liked_by_me_subq,
+    list_deferrals,
+)
+
+_content_tags_table = cast(Table, ContentTag.__table__)
+
+# Built once at import, like the user lookup in app.repositories.users: get runs on
+# every tag read, so skip rebuilding the construct and its cache key each time.
+_STMT_GET_TAG: Select[tuple[Tag]] = (
+    select(Tag)
+    .options(selectinload(Tag.content_tags))
+    .where(Tag.id == bindparam("tag_id"), Tag.deleted_at.is_(None))
 )
 
 
@@ -27,12 +42,17 @@ class TagRepository(Repository):
     # ----- tags -----
 
     async def get(self, tag_id: UUID) -> Tag | None:
-        stmt: Select[tuple[Tag]] = (
-            select(Tag)
-            .options(selectinload(Tag.content_tags))
+        res = await self.session.execute(_STMT_GET_TAG, {"tag_id": tag_id})
+        return res.scalars().first()
+
+    async def update_fields(self, tag_id: UUID, values: dict[str, Any]) -> Tag | None:
+        """Apply a column patch with ``UPDATE ... RETURNING``; None if the tag does not exist."""
+        res = await self.session.execute(
+            update(Tag)
             .where(Tag.id == tag_id, Tag.deleted_at.is_(None))
+            .values(**values)
+            .returning(Tag)
         )
-        res = await self.session.execute(stmt)
         return res.scalars().first()
 
     async def get_by_name(self, name: str) -> Tag | None:
@@ -48,16 +68,45 @@ class TagRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalar_one()
 
-    async def list(
-        self, *, q: str | None = None, limit: int = 50, offset: int = 0
-    ) -> Sequence[Tag]:
-        stmt = select(Tag).where(Tag.deleted_at.is_(None)).order_by(Tag.name)
+    @staticmethod
+    def _list_stmt(q: str | None) -> Select[tuple[Tag]]:
+        stmt = select(Tag).where(Tag.deleted_at.is_(None)).order_by(Tag.name, Tag.id)
         if q:
             like = f"%{q.strip()}%"
             stmt = stmt.where(Tag.name.ilike(like))
-        stmt = stmt.limit(limit).offset(offset)
+        return stmt
+
+    async def list(
+        self,
+        *,
+        q: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: UUID | None = None,
+    ) -> Sequence[Tag]:
+        """List tags ordered by ``(name, id)``.
+
+        With ``after`` set, pages by keyset instead: rows sorting after the tag
+        with that id are returned and ``offset`` is ignored.
+        """
+        stmt = self._list_stmt(q).limit(limit)
+        if after is not None:
+            stmt = keyset_after(stmt, Tag.name, Tag.id, after)
+        else:
+            stmt = stmt.offset(offset)
         return await self.scalars(stmt)
 
+    async def list_with_total(
+        self, *, q: str | None = None, limit: int = 50, offset: int = 0
+    ) -> tuple[Sequence[Tag], int]:
+        """Return one page of tags together with the unpaginated total."""
+        stmt = with_total(self._list_stmt(q)).limit(limit).offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count(q=q) if offset else 0
+        return [tag for tag, _ in rows], rows[0].total
+
     async def create(self, tag: Tag) -> Tag:
         await self.add(tag)
         return tag
@@ -65,7 +114,10 @@ class TagRepository(Repository):
     async def delete(self, tag_id: UUID) -> int:
         now = dt.datetime.now(dt.timezone.utc)
         res = await self.session.execute(
-            update(Tag).where(Tag.id == tag_id, Tag.deleted_at.is_(None)).values(deleted_at=now)
+            update(Tag)
+            .where(Tag.id == tag_id, Tag.deleted_at.is_(None))
+            .values(deleted_at=now)
+            .execution_options(synchronize_session=False)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
@@ -78,18 +130,30 @@ class TagRepository(Repository):
         )
         return result or 0
 
-    async def list_content_tags(
-        self, content_id: UUID, *, limit: int = 100, offset: int = 0
-    ) -> Sequence[Tag]:
-        stmt = (
+    @staticmethod
+    def _content_tags_stmt(content_id: UUID) -> Select[tuple[Tag]]:
+        return (
             select(Tag)
             .join(ContentTag, ContentTag.tag_id == Tag.id)
             .where(ContentTag.content_id == content_id, Tag.deleted_at.is_(None))
             .order_by(Tag.name)
-            .limit(limit)
-            .offset(offset)
         )
-        return await self.scalars(stmt)
+
+    async def list_content_tags(
+        self, content_id: UUID, *, limit: int = 100, offset: int = 0
+    ) -> Sequence[Tag]:
+        return await self.scalars(self._content_tags_stmt(content_id).limit(limit).offset(offset))
+
+    async def list_content_tags_with_total(
+        self, content_id: UUID, *, limit: int = 100, offset: int = 0
+    ) -> tuple[Sequence[Tag], int]:
+        """Return one page of a content item's tags together with the unpaginated total."""
+        stmt = with_total(self._content_tags_stmt(content_id)).limit(limit).offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_content_tags(content_id) if offset else 0
+        return [tag for tag, _ in rows], rows[0].total
 
     async def count_tagged_content(self, tag_id: UUID) -> int:
         result = await self.session.scalar(
@@ -100,29 +164,42 @@ class TagRepository(Repository):
         )
         return result or 0
 
-    async def list_tagged_content(
-        self, tag_id: UUID, current_user_id: UUID | None = None, *, limit: int = 50, offset: int = 0
-    ) -> list[tuple[Content, ContentStats]]:  # type: ignore[valid-type]
-        stmt = (
+    @staticmethod
+    def _tagged_content_stmt(tag_id: UUID, current_user_id: UUID | None) -> Select:
+        return (
             select(
-                Content, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id)
+                Content, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id)
             )
             .join(ContentTag, ContentTag.content_id == Content.id)
             .options(
-                selectinload(Content.author),
-                selectinload(Content.workspace),
+                joinedload(Content.author),
+                joinedload(Content.workspace),
                 selectinload(Content.content_tags).selectinload(ContentTag.tag),
+                raiseload("*"),
+                *list_deferrals(Content),
             )
             .where(ContentTag.tag_id == tag_id, Content.deleted_at.is_(None))
             .order_by(Content.created_at.desc())
-            .limit(limit)
-            .offset(offset)
         )
+
+    async def list_tagged_content(
+        self, tag_id: UUID, current_user_id: UUID | None = None, *, limit: int = 50, offset: int = 0
+    ) -> list[tuple[Content, ContentStats]]:  # type: ignore[valid-type]
+        stmt = self._tagged_content_stmt(tag_id, current_user_id).limit(limit).offset(offset)
         rows = (await self.session.execute(stmt)).all()
-        return [
-            (content, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm)))
-            for content, lc, cc, lm in rows
-        ]
+        return [(content, ContentStats(lc, cc, lm)) for content, lc, cc, lm in rows]
+
+    async def list_tagged_content_with_total(
+        self, tag_id: UUID, current_user_id: UUID | None = None, *, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[tuple[Content, ContentStats]], int]:
+        """Return one page of a tag's content together with the unpaginated total."""
+        stmt = with_total(self._tagged_content_stmt(tag_id, current_user_id))
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_tagged_content(tag_id) if offset else 0
+        items = [(content, ContentStats(lc, cc, lm)) for content, lc, cc, lm, _ in rows]
+        return items, rows[0].total
 
     async def get_content_tag(self, content_id: UUID, tag_id: UUID) -> ContentTag | None:
         return await self.session.scalar(
@@ -139,14 +216,71 @@ class TagRepository(Repository):
         await self.add(ct)
         return True, ct
 
-    async def remove_content_tag(self, content_id: UUID, tag_id: UUID) -> int:
-        res = await self.session.execute(
-            delete(ContentTag).where(
-                and_(ContentTag.content_id == content_id, ContentTag.tag_id == tag_id)
-            )
+    async def add_content_tag_if_authorized(
+        self, content_id: UUID, tag_id: UUID, user_id: UUID, *, is_admin: bool
+    ) -> tuple[bool, bool, bool]:
+        """Attach a tag in one statement if the user may tag the content.
+
+        The author lookup and ``INSERT ... ON CONFLICT DO NOTHING`` run as CTEs of
+        a single query. Returns ``(found, authorized, created)``: whether the
+        content exists, whether the user is its author (or an admin), and whether
+        a row was inserted rather than already present.
+        """
+        # The bare tables, as in ContentRepository.get_author_id: the mapped
+        # Content class would outer-join every subtype table.
+        content, content_tags = content_table, _content_tags_table
+        auth = select(content.c.author_id).where(content.c.id == content_id).cte("auth")
+        source = select(
+            literal(content_id, content_tags.c.content_id.type),
+            literal(tag_id, content_tags.c.tag_id.type),
+        ).select_from(auth)
+        if not is_admin:
+            source = source.where(auth.c.author_id == user_id)
+        ins = (
+            pg_insert(content_tags)
+            .from_select(["content_id", "tag_id"], source)
+            .on_conflict_do_nothing(index_elements=["content_id", "tag_id"])
+            .returning(content_tags.c.tag_id)
+            .cte("ins")
         )
-        assert isinstance(res, CursorResult)
-        return res.rowcount or 0
+        row = (
+            await self.session.execute(
+                select(
+                    select(func.count()).select_from(auth).scalar_subquery().label("found"),
+                    select(auth.c.author_id).scalar_subquery().label("author_id"),
+                    select(func.count()).select_from(ins).scalar_subquery().label("created"),
+                )
+            )
+        ).one()
+        authorized = is_admin or row.author_id == user_id
+        return bool(row.found), bool(row.found) and authorized, bool(row.created)
+
+    async def remove_content_tag_if_authorized(
+        self, content_id: UUID, tag_id: UUID, user_id: UUID, *, is_admin: bool
+    ) -> tuple[bool, bool, bool]:
+        """Detach a tag in one statement if the user may untag the content.
+
+        The counterpart of ``add_content_tag_if_authorized``: the author lookup and
+        the guarded ``DELETE`` run as CTEs of a single query. Returns
+        ``(found, authorized, deleted)``.
+        """
+        content, content_tags = content_table, _content_tags_table
+        auth = select(content.c.author_id).where(content.c.id == content_id).cte("auth")
+        conds = [content_tags.c.content_id == content_id, content_tags.c.tag_id == tag_id]
+        if not is_admin:
+            conds.append(select(auth.c.author_id).where(auth.c.author_id == user_id).exists())
+        removed = delete(content_tags).where(*conds).returning(content_tags.c.tag_id).cte("removed")
+        row = (
+            await self.session.execute(
+                select(
+                    select(func.count()).select_from(auth).scalar_subquery().label("found"),
+                    select(auth.c.author_id).scalar_subquery().label("author_id"),
+                    select(func.count()).select_from(removed).scalar_subquery().label("deleted"),
+                )
+            )
+        ).one()
+        authorized = is_admin or row.author_id == user_id
+        return bool(row.found), bool(row.found) and authorized, bool(row.deleted)
 
     async def add_content_tags_by_names(
         self, content_id: UUID, names: Sequence[str]
@@ -3,64 +3,91 @@ from __future__ import annotations
 import datetime as dt
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import Select, bindparam, func, select, update
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from app.models.content import Content
 from app.models.tag import ContentTag
 from app.models.task import Task
-from app.repositories.base import Repository
+from app.repositories.base import Repository, keyset_after, with_total
 from app.repositories.content import (
     ContentStats,
-    comment_count_subq,
-    like_count_subq,
+    comment_count_col,
+    like_count_col,
     liked_by_me_subq,
+    list_deferrals,
 )
 
 
 class TaskRepository(Repository):
+    # Eager loads for everything TaskListOut / TaskOut read, declared once so the
+    # list and detail queries stay in sync.
+    list_options = (
+        joinedload(Task.author),
+        joinedload(Task.workspace),
+        selectinload(Task.content_tags).selectinload(ContentTag.tag),
+        # Any other relationship raises on access instead of lazy loading.
+        raiseload("*"),
+    )
+    detail_options = (*list_options, selectinload(Task.comments))
+
+    # get statements built once, with and without a viewer for liked_by_me, so the
+    # task detail read skips rebuilding the construct and its cache key each time.
+    _get_stmt = (
+        select(Task, like_count_col(), comment_count_col(), liked_by_me_subq(None))
+        .options(*detail_options)
+        .where(Task.id == bindparam("task_id"), Task.deleted_at.is_(None))
+    )
+    _get_for_user_stmt = (
+        select(
+            Task,
+            like_count_col(),
+            comment_count_col(),
+            liked_by_me_subq(bindparam("current_user_id")),
+        )
+        .options(*detail_options)
+        .where(Task.id == bindparam("task_id"), Task.deleted_at.is_(None))
+    )
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
 
     async def get(
         self, task_id: UUID, current_user_id: UUID | None = None
     ) -> tuple[Task, ContentStats] | None:
-        stmt = (
-            select(Task, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id))
-            .options(
-                selectinload(Task.author),
-                selectinload(Task.workspace),
-                selectinload(Task.comments),
-                selectinload(Task.content_tags).selectinload(ContentTag.tag),
+        if current_user_id is None:
+            res = await self.session.execute(self._get_stmt, {"task_id": task_id})
+        else:
+            res = await self.session.execute(
+                self._get_for_user_stmt, {"task_id": task_id, "current_user_id": current_user_id}
             )
-            .where(Task.id == task_id, Task.deleted_at.is_(None))
-        )
-        row = (await self.session.execute(stmt)).first()
+        row = res.first()
         if row is None:
             return None
         task, lc, cc, lm = row
-        return task, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm))
+        return task, ContentStats(lc, cc, lm)
+
+    async def get_workspace_id(self, task_id: UUID) -> UUID | None:
+        """Return the task's workspace id without loading the task or its relations."""
+        return await self.session.scalar(
+            select(Task.workspace_id).where(Task.id == task_id, Task.deleted_at.is_(None))
+        )
 
     async def get_in_event(
         self, task_id: UUID, event_id: UUID, current_user_id: UUID | None = None
     ) -> tuple[Task, ContentStats] | None:
         stmt = (
-            select(Task, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id))
-            .options(
-                selectinload(Task.author),
-                selectinload(Task.workspace),
-                selectinload(Task.comments),
-                selectinload(Task.content_tags).selectinload(ContentTag.tag),
-            )
+            select(Task, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id))
+            .options(*self.detail_options)
             .where(Task.id == task_id, Task.event_id == event_id, Task.deleted_at.is_(None))
         )
         row = (await self.session.execute(stmt)).first()
         if row is None:
             return None
         task, lc, cc, lm = row
-        return task, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm))
+        return task, ContentStats(lc, cc, lm)
 
     async def count_tasks_for_event(self, event_id: UUID) -> int:
         result = await self.session.scalar(
@@ -70,6 +97,14 @@ class TaskRepository(Repository):
         )
         return result or 0
 
+    def _event_tasks_stmt(self, event_id: UUID, current_user_id: UUID | None) -> Select:
+        return (
+            select(Task, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id))
+            .options(*self.list_options, *list_deferrals(Task))
+            .where(Task.event_id == event_id, Task.deleted_at.is_(None))
+            .order_by(Task.name, Task.id)
+        )
+
     async def list_for_event(
         self,
         event_id: UUID,
@@ -77,24 +112,37 @@ class TaskRepository(Repository):
         *,
         limit: int = 50,
         offset: int = 0,
+        after: UUID | None = None,
     ) -> list[tuple[Task, ContentStats]]:
-        stmt = (
-            select(Task, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id))
-            .options(
-                selectinload(Task.author),
-                selectinload(Task.workspace),
-                selectinload(Task.content_tags).selectinload(ContentTag.tag),
-            )
-            .where(Task.event_id == event_id, Task.deleted_at.is_(None))
-            .order_by(Task.name)
-            .limit(limit)
-            .offset(offset)
-        )
+        """List an event's tasks ordered by ``(name, id)``.
+
+        With ``after`` set, pages by keyset instead: rows sorting after the task
+        with that id are returned and ``offset`` is ignored.
+        """
+        stmt = self._event_tasks_stmt(event_id, current_user_id).limit(limit)
+        if after is not None:
+            stmt = keyset_after(stmt, Task.name, Task.id, after)
+        else:
+            stmt = stmt.offset(offset)
         rows = (await self.session.execute(stmt)).all()
-        return [
-            (task, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm)))
-            for task, lc, cc, lm in rows
-        ]
+        return [(task, ContentStats(lc, cc, lm)) for task, lc, cc, lm in rows]
+
+    async def list_for_event_with_total(
+        self,
+        event_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[tuple[Task, ContentStats]], int]:
+        """Return one page of an event's tasks together with the unpaginated total."""
+        stmt = with_total(self._event_tasks_stmt(event_id, current_user_id))
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_tasks_for_event(event_id) if offset else 0
+        items = [(task, ContentStats(lc, cc, lm)) for task, lc, cc, lm, _ in rows]
+        return items, rows[0].total
 
     async def count_for_workspace(self, workspace_id: UUID) -> int:
         result = await self.session.scalar(
@@ -104,6 +152,14 @@ class TaskRepository(Repository):
         )
         return result or 0
 
+    def _workspace_tasks_stmt(self, workspace_id: UUID, current_user_id: UUID | None) -> Select:
+        return (
+            select(Task, like_count_col(), comment_count_col(), liked_by_me_subq(current_user_id))
+            .options(*self.list_options, *list_deferrals(Task))
+            .where(Task.workspace_id == workspace_id, Task.deleted_at.is_(None))
+            .order_by(Task.name)
+        )
+
     async def list_for_workspace(
         self,
         workspace_id: UUID,
@@ -112,23 +168,26 @@ class TaskRepository(Repository):
         limit: int = 50,
         offset: int = 0,
     ) -> list[tuple[Task, ContentStats]]:
-        stmt = (
-            select(Task, like_count_subq(), comment_count_subq(), liked_by_me_subq(current_user_id))
-            .options(
-                selectinload(Task.author),
-                selectinload(Task.workspace),
-                selectinload(Task.content_tags).selectinload(ContentTag.tag),
-            )
-            .where(Task.workspace_id == workspace_id, Task.deleted_at.is_(None))
-            .order_by(Task.name)
-            .limit(limit)
-            .offset(offset)
-        )
+        stmt = self._workspace_tasks_stmt(workspace_id, current_user_id).limit(limit).offset(offset)
         rows = (await self.session.execute(stmt)).all()
-        return [
-            (task, ContentStats(like_count=int(lc), comment_count=int(cc), liked_by_me=bool(lm)))
-            for task, lc, cc, lm in rows
-        ]
+        return [(task, ContentStats(lc, cc, lm)) for task, lc, cc, lm in rows]
+
+    async def list_for_workspace_with_total(
+        self,
+        workspace_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[tuple[Task, ContentStats]], int]:
+        """Return one page of a workspace's tasks together with the unpaginated total."""
+        stmt = with_total(self._workspace_tasks_stmt(workspace_id, current_user_id))
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_for_workspace(workspace_id) if offset else 0
+        items = [(task, ContentStats(lc, cc, lm)) for task, lc, cc, lm, _ in rows]
+        return items, rows[0].total
 
     async def create(self, task: Task) -> Task:
         await self.add(task)
@@ -140,6 +199,7 @@ class TaskRepository(Repository):
             update(Content)
             .where(Content.id == task_id, Content.deleted_at.is_(None))
             .values(deleted_at=now)
+            .execution_options(synchronize_session=False)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
@@ -4,14 +4,28 @@ import datetime as dt
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, and_, delete, func, select, update
+from sqlalchemy import Select, and_, bindparam, delete, func, select, update
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.domain.enums import WorkspaceRole
 from app.models.event import Event
 from app.models.troop import Troop, TroopParticipation
-from app.repositories.base import Repository
+from app.models.workspace import WorkspaceMembership
+from app.repositories.base import Repository, keyset_after, with_total
+from app.repositories.events import EventRepository
+
+# Built once at import, like the user lookup in app.repositories.users: get runs on
+# every troop read and access check, so skip rebuilding the construct each time.
+_STMT_GET_TROOP: Select[tuple[Troop]] = (
+    select(Troop)
+    .options(
+        selectinload(Troop.workspace),
+        selectinload(Troop.troop_participations),
+    )
+    .where(Troop.id == bindparam("troop_id"), Troop.deleted_at.is_(None))
+)
 
 
 class TroopRepository(Repository):
@@ -21,16 +35,28 @@ class TroopRepository(Repository):
     # ----- troops -----
 
     async def get(self, troop_id: UUID) -> Troop | None:
-        stmt: Select[tuple[Troop]] = (
-            select(Troop)
-            .options(
-                selectinload(Troop.workspace),
-                selectinload(Troop.troop_participations),
+        res = await self.session.execute(_STMT_GET_TROOP, {"troop_id": troop_id})
+        return res.scalars().first()
+
+    async def get_workspace_id_with_role(
+        self, troop_id: UUID, user_id: UUID
+    ) -> tuple[UUID, WorkspaceRole | None] | None:
+        """Return the troop's workspace id and the user's role there (None if not a member)."""
+        stmt = (
+            select(Troop.workspace_id, WorkspaceMembership.role)
+            .outerjoin(
+                WorkspaceMembership,
+                and_(
+                    WorkspaceMembership.workspace_id == Troop.workspace_id,
+                    WorkspaceMembership.user_id == user_id,
+                ),
             )
             .where(Troop.id == troop_id, Troop.deleted_at.is_(None))
         )
-        res = await self.session.execute(stmt)
-        return res.scalars().first()
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None
+        return row.workspace_id, row.role
 
     async def get_in_workspace(self, troop_id: UUID, workspace_id: UUID) -> Troop | None:
         stmt = select(Troop).where(
@@ -49,18 +75,45 @@ class TroopRepository(Repository):
         )
         return result or 0
 
-    async def list_for_workspace(
-        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Troop]:
-        stmt = (
+    @staticmethod
+    def _workspace_troops_stmt(workspace_id: UUID) -> Select[tuple[Troop]]:
+        return (
             select(Troop)
             .where(Troop.workspace_id == workspace_id, Troop.deleted_at.is_(None))
-            .order_by(Troop.name)
-            .limit(limit)
-            .offset(offset)
+            .order_by(Troop.name, Troop.id)
         )
+
+    async def list_for_workspace(
+        self,
+        workspace_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        after: UUID | None = None,
+    ) -> Sequence[Troop]:
+        """List a workspace's troops ordered by ``(name, id)``.
+
+        With ``after`` set, pages by keyset instead: rows sorting after the troop
+        with that id are returned and ``offset`` is ignored.
+        """
+        stmt = self._workspace_troops_stmt(workspace_id).limit(limit)
+        if after is not None:
+            stmt = keyset_after(stmt, Troop.name, Troop.id, after)
+        else:
+            stmt = stmt.offset(offset)
         return await self.scalars(stmt)
 
+    async def list_for_workspace_with_total(
+        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[Sequence[Troop], int]:
+        """Return one page of a workspace's troops together with the unpaginated total."""
+        stmt = with_total(self._workspace_troops_stmt(workspace_id)).limit(limit).offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_troops_for_workspace(workspace_id) if offset else 0
+        return [troop for troop, _ in rows], rows[0].total
+
     async def create(self, troop: Troop) -> Troop:
         await self.add(troop)
         return troop
@@ -71,6 +124,7 @@ class TroopRepository(Repository):
             update(Troop)
             .where(Troop.id == troop_id, Troop.deleted_at.is_(None))
             .values(deleted_at=now)
+            .execution_options(synchronize_session=False)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
@@ -86,39 +140,81 @@ class TroopRepository(Repository):
         )
         return result or 0
 
-    async def list_event_troops(
-        self, event_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Troop]:
-        stmt = (
+    @staticmethod
+    def _event_troops_stmt(event_id: UUID) -> Select[tuple[Troop]]:
+        return (
             select(Troop)
             .join(TroopParticipation, TroopParticipation.troop_id == Troop.id)
             .where(TroopParticipation.event_id == event_id, Troop.deleted_at.is_(None))
-            .order_by(Troop.name)
-            .limit(limit)
-            .offset(offset)
+            .order_by(Troop.name, Troop.id)
         )
+
+    async def list_event_troops(
+        self,
+        event_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        after: UUID | None = None,
+    ) -> Sequence[Troop]:
+        """List an event's troops ordered by ``(name, id)``.
+
+        With ``after`` set, pages by keyset instead: rows sorting after the troop
+        with that id are returned and ``offset`` is ignored, so deep pages cost
+        O(limit) rather than O(limit + offset).
+        """
+        stmt = self._event_troops_stmt(event_id).limit(limit)
+        if after is not None:
+            stmt = keyset_after(stmt, Troop.name, Troop.id, after)
+        else:
+            stmt = stmt.offset(offset)
         return await self.scalars(stmt)
 
+    async def list_event_troops_with_total(
+        self, event_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[Sequence[Troop], int]:
+        """Return one page of an event's troops together with the unpaginated total."""
+        stmt = with_total(self._event_troops_stmt(event_id)).limit(limit).offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_event_troops(event_id) if offset else 0
+        return [troop for troop, _ in rows], rows[0].total
+
     async def count_troop_events(self, troop_id: UUID) -> int:
         result = await self.session.scalar(
             select(func.count())
             .select_from(TroopParticipation)
-            .where(TroopParticipation.troop_id == troop_id)
+            .join(Event, Event.id == TroopParticipation.event_id)
+            .where(TroopParticipation.troop_id == troop_id, Event.deleted_at.is_(None))
         )
         return result or 0
 
-    async def list_troop_events(
-        self, troop_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Event]:
-        stmt = (
+    @staticmethod
+    def _troop_events_stmt(troop_id: UUID) -> Select[tuple[Event]]:
+        return (
             select(Event)
+            .options(*EventRepository.detail_options)
             .join(TroopParticipation, TroopParticipation.event_id == Event.id)
             .where(TroopParticipation.troop_id == troop_id, Event.deleted_at.is_(None))
             .order_by(Event.start_dt)
-            .limit(limit)
-            .offset(offset)
         )
-        return await self.scalars(stmt)
+
+    async def list_troop_events(
+        self, troop_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> Sequence[Event]:
+        return await self.scalars(self._troop_events_stmt(troop_id).limit(limit).offset(offset))
+
+    async def list_troop_events_with_total(
+        self, troop_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[Sequence[Event], int]:
+        """Return one page of a troop's events together with the unpaginated total."""
+        stmt = with_total(self._troop_events_stmt(troop_id)).limit(limit).offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_troop_events(troop_id) if offset else 0
+        return [event for event, _ in rows], rows[0].total
 
     async def get_participation(self, event_id: UUID, troop_id: UUID) -> TroopParticipation | None:
         return await self.session.scalar(
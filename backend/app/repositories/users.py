@@ -4,13 +4,38 @@ import datetime as dt
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, func, or_, select, update
+from sqlalchemy import ColumnElement, Select, bindparam, func, select, true, update
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.user import User
-from app.repositories.base import Repository
+from app.repositories.base import Repository, keyset_after, with_total
+
+# Built once at import: get_by_auth0_id runs on every authenticated request that
+# misses the user cache, so skip rebuilding the construct and its cache key each time.
+_STMT_GET_USER_BY_AUTH0: Select[tuple[User]] = select(User).where(
+    User.auth0_id == bindparam("auth0_id"), User.deleted_at.is_(None)
+)
+
+
+def _prefix_tsquery(q: str) -> str:
+    """``jo smi`` -> ``'jo':* & 'smi':*``; ``""`` when ``q`` has no words.
+
+    Matching is prefix-only: each word must start a token, so unlike the ILIKE
+    search this replaced, "son" no longer finds "Jonsson".
+    """
+    terms = (t.replace("\\", "\\\\").replace("'", "''") for t in q.split())
+    return " & ".join(f"'{t}':*" for t in terms)
+
+
+def _matches_search(q: str) -> ColumnElement[bool]:
+    # search_tsv is a generated column over name/email/auth0_id with a GIN index.
+    # Each word is a prefix match: "jo" finds "Jon", "foo" finds "foo@bar.com".
+    tsquery = _prefix_tsquery(q)
+    if not tsquery:
+        # Whitespace only: an empty tsquery would match nothing, so don't filter.
+        return true()
+    return User.search_tsv.op("@@")(func.to_tsquery("simple", tsquery))
 
 
 class UserRepository(Repository):
@@ -18,63 +43,69 @@ class UserRepository(Repository):
         super().__init__(session)
 
     async def get(self, user_id: UUID) -> User | None:
-        stmt: Select[tuple[User]] = (
-            select(User)
-            .options(
-                selectinload(User.ws_memberships),
-                selectinload(User.group_memberships),
-            )
-            .where(User.id == user_id, User.deleted_at.is_(None))
-        )
+        # No membership eager loads: none of the user DTOs read them.
+        stmt = select(User).where(User.id == user_id, User.deleted_at.is_(None))
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
     async def get_by_email(self, email: str) -> User | None:
-        stmt = select(User).where(
-            func.lower(User.email) == email.lower(), User.deleted_at.is_(None)
-        )
+        stmt = select(User).where(User.email == email, User.deleted_at.is_(None))
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
     async def get_by_auth0_id(self, auth0_id: str) -> User | None:
-        stmt = select(User).where(User.auth0_id == auth0_id, User.deleted_at.is_(None))
-        res = await self.session.execute(stmt)
+        res = await self.session.execute(_STMT_GET_USER_BY_AUTH0, {"auth0_id": auth0_id})
         return res.scalars().first()
 
     async def count(self, *, q: str | None = None) -> int:
         stmt = select(func.count()).select_from(User).where(User.deleted_at.is_(None))
         if q:
-            ilike = f"%{q.strip()}%"
-            stmt = stmt.where(
-                or_(
-                    User.name.ilike(ilike),
-                    User.email.ilike(ilike),
-                    User.auth0_id.ilike(ilike),
-                )
-            )
+            stmt = stmt.where(_matches_search(q))
         res = await self.session.execute(stmt)
         return res.scalar_one()
 
+    @staticmethod
+    def _list_stmt(q: str | None) -> Select[tuple[User]]:
+        stmt = select(User).where(User.deleted_at.is_(None)).order_by(User.name.asc(), User.id)
+        if q:
+            stmt = stmt.where(_matches_search(q))
+        return stmt
+
     async def list(
         self,
         *,
         q: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: UUID | None = None,
     ) -> Sequence[User]:
-        stmt = select(User).where(User.deleted_at.is_(None)).order_by(User.name.asc())
-        if q:
-            ilike = f"%{q.strip()}%"
-            stmt = stmt.where(
-                or_(
-                    User.name.ilike(ilike),
-                    User.email.ilike(ilike),
-                    User.auth0_id.ilike(ilike),
-                )
-            )
-        stmt = stmt.limit(limit).offset(offset)
+        """List users ordered by ``(name, id)``.
+
+        With ``after`` set, pages by keyset instead: rows sorting after the user
+        with that id are returned and ``offset`` is ignored.
+        """
+        stmt = self._list_stmt(q).limit(limit)
+        if after is not None:
+            stmt = keyset_after(stmt, User.name, User.id, after)
+        else:
+            stmt = stmt.offset(offset)
         return await self.scalars(stmt)
 
+    async def list_with_total(
+        self,
+        *,
+        q: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[Sequence[User], int]:
+        """Return one page of users together with the unpaginated total."""
+        stmt = with_total(self._list_stmt(q)).limit(limit).offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count(q=q) if offset else 0
+        return [user for user, _ in rows], rows[0].total
+
     async def create(self, user: User) -> User:
         await self.add(user)
         return user
@@ -82,7 +113,10 @@ class UserRepository(Repository):
     async def delete(self, user_id: UUID) -> int:
         now = dt.datetime.now(dt.timezone.utc)
         res = await self.session.execute(
-            update(User).where(User.id == user_id, User.deleted_at.is_(None)).values(deleted_at=now)
+            update(User)
+            .where(User.id == user_id, User.deleted_at.is_(None))
+            .values(deleted_at=now)
+            .execution_options(synchronize_session=False)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
@@ -4,17 +4,16 @@ import datetime as dt
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import and_, func, select, tuple_, update
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.domain.enums import WorkspaceRole
 from app.models.content import Content
 from app.models.troop import Troop
 from app.models.workspace import Workspace, WorkspaceMembership
 
-from .base import Repository
+from .base import Repository, with_total
 
 
 class WorkspaceRepository(Repository):
@@ -22,17 +21,51 @@ class WorkspaceRepository(Repository):
         super().__init__(session)
 
     async def get(self, workspace_id: UUID) -> Workspace | None:
+        # No eager loads: WorkspaceOut has no relationship fields, and each
+        # selectinload would cost its own round trip.
+        stmt = select(Workspace).where(Workspace.id == workspace_id, Workspace.deleted_at.is_(None))
+        res = await self.session.execute(stmt)
+        return res.scalars().first()
+
+    async def get_with_role(
+        self, workspace_id: UUID, user_id: UUID
+    ) -> tuple[Workspace, WorkspaceRole | None] | None:
+        """Return the workspace and the user's role in it (None if not a member)."""
         stmt = (
-            select(Workspace)
-            .options(
-                selectinload(Workspace.programs),
-                selectinload(Workspace.events),
-                selectinload(Workspace.troops),
+            select(Workspace, WorkspaceMembership.role)
+            .outerjoin(
+                WorkspaceMembership,
+                and_(
+                    WorkspaceMembership.workspace_id == Workspace.id,
+                    WorkspaceMembership.user_id == user_id,
+                ),
             )
             .where(Workspace.id == workspace_id, Workspace.deleted_at.is_(None))
         )
-        res = await self.session.execute(stmt)
-        return res.scalars().first()
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None
+        return row.Workspace, row.role
+
+    async def get_name_with_role(
+        self, workspace_id: UUID, user_id: UUID
+    ) -> tuple[str, WorkspaceRole | None] | None:
+        """Return the workspace name and the user's role in it (None if not a member)."""
+        stmt = (
+            select(Workspace.name, WorkspaceMembership.role)
+            .outerjoin(
+                WorkspaceMembership,
+                and_(
+                    WorkspaceMembership.workspace_id == Workspace.id,
+                    WorkspaceMembership.user_id == user_id,
+                ),
+            )
+            .where(Workspace.id == workspace_id, Workspace.deleted_at.is_(None))
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None
+        return row.name, row.role
 
     async def count_user_workspaces(self, user_id: UUID) -> int:
         result = await self.session.scalar(
@@ -43,18 +76,21 @@ class WorkspaceRepository(Repository):
         )
         return result or 0
 
-    async def list_user_workspaces(
+    async def list_user_workspaces_with_total(
         self, user_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Workspace]:
-        stmt = (
+    ) -> tuple[list[Workspace], int]:
+        """Return one page of the user's workspaces together with the unpaginated total."""
+        stmt = with_total(
             select(Workspace)
             .join(WorkspaceMembership, WorkspaceMembership.workspace_id == Workspace.id)
             .where(WorkspaceMembership.user_id == user_id, Workspace.deleted_at.is_(None))
             .order_by(Workspace.name)
-            .limit(limit)
-            .offset(offset)
         )
-        return await self.scalars(stmt)
+        rows = (await self.session.execute(stmt.limit(limit).offset(offset))).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], await self.count_user_workspaces(user_id) if offset else 0
+        return [ws for ws, _ in rows], rows[0].total
 
     async def create_user_workspace(
         self, user_id: UUID, ws: Workspace
@@ -67,26 +103,28 @@ class WorkspaceRepository(Repository):
     async def delete(self, workspace_id: UUID) -> int:
         now = dt.datetime.now(dt.timezone.utc)
 
-        # Cascade: soft-delete all content items (programs, events, tasks) in the workspace.
-        # workspace_id is on the content table so one query covers all content types.
-        await self.session.execute(
+        # The cascades ride along as data-modifying CTEs so the whole soft delete
+        # is one round trip; Postgres runs every CTE even though none is referenced.
+        # workspace_id is on the content table so one UPDATE covers all content types.
+        content_deleted = (
             update(Content)
             .where(Content.workspace_id == workspace_id, Content.deleted_at.is_(None))
             .values(deleted_at=now)
+            .cte("content_deleted")
         )
-
-        # Cascade: soft-delete troops (separate table with its own deleted_at)
-        await self.session.execute(
+        # Troops are a separate table with their own deleted_at.
+        troops_deleted = (
             update(Troop)
             .where(Troop.workspace_id == workspace_id, Troop.deleted_at.is_(None))
             .values(deleted_at=now)
+            .cte("troops_deleted")
         )
-
-        # Soft-delete the workspace itself
         res = await self.session.execute(
             update(Workspace)
             .where(Workspace.id == workspace_id, Workspace.deleted_at.is_(None))
             .values(deleted_at=now)
+            .add_cte(content_deleted, troops_deleted)
+            .execution_options(synchronize_session=False)
         )
         assert isinstance(res, CursorResult)
         return res.rowcount or 0
@@ -108,6 +146,22 @@ class WorkspaceRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
+    async def find_user_roles(
+        self, keys: Sequence[tuple[UUID, UUID]]
+    ) -> dict[tuple[UUID, UUID], WorkspaceRole]:
+        """Resolve many ``(workspace_id, user_id)`` pairs in one query; non-members are absent."""
+        stmt = select(
+            WorkspaceMembership.workspace_id, WorkspaceMembership.user_id, WorkspaceMembership.role
+        ).where(tuple_(WorkspaceMembership.workspace_id, WorkspaceMembership.user_id).in_(keys))
+        rows = (await self.session.execute(stmt)).all()
+        return {(ws_id, user_id): role for ws_id, user_id, role in rows}
+
+    async def list_member_ids(self, workspace_id: UUID) -> list[UUID]:
+        stmt = select(WorkspaceMembership.user_id).where(
+            WorkspaceMembership.workspace_id == workspace_id
+        )
+        return list(await self.scalars(stmt))
+
     async def list_members(self, workspace_id: UUID) -> Sequence[WorkspaceMembership]:
         stmt = select(WorkspaceMembership).where(WorkspaceMembership.workspace_id == workspace_id)
         return await self.scalars(stmt)
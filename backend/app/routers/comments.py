@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user, require_permission
 from app.core.db import get_session
+from app.core.headers import set_location
 from app.core.pagination import Limit, Offset, add_pagination_headers
 from app.schemas.comment import CommentCreate, CommentOut, CommentUpdate
 from app.schemas.user import Permissions, UserOut
@@ -31,8 +32,7 @@ async def list_content_comments(
     offset: Offset = 0,
 ) -> list[CommentOut]:
     svc = CommentService(session)
-    total = await svc.count_content_comments(content_id)
-    items = await svc.list_for_content(content_id, limit=limit, offset=offset)
+    items, total = await svc.list_for_content_with_total(content_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -59,7 +59,7 @@ async def create_comment_under_content(
     svc = CommentService(session)
     comment_data = CommentCreate(body=body.body, user_id=current_user.id)
     comment = await svc.create_under_content(content_id, comment_data)
-    response.headers["Location"] = f"/comments/{comment.id}"
+    set_location(response, f"/comments/{comment.id}")
     return comment
 
 
@@ -93,12 +93,15 @@ async def update_comment(
     return await svc.update(comment_id, body)
 
 
-@router.patch("/admin/comments/{comment_id}", response_model=CommentOut)
+@router.patch(
+    "/admin/comments/{comment_id}",
+    response_model=CommentOut,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def update_comment_admin(
     session: SessionDep,
     comment_id: UUID,
     body: CommentUpdate,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> CommentOut:
     svc = CommentService(session)
     return await svc.update(comment_id, body)
@@ -121,11 +124,14 @@ async def delete_comment(
     return None
 
 
-@router.delete("/admin/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/admin/comments/{comment_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def delete_comment_admin(
     session: SessionDep,
     comment_id: UUID,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> None:
     svc = CommentService(session)
     await svc.delete(comment_id)
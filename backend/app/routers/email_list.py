@@ -17,12 +17,14 @@ router = APIRouter(prefix="/emaillist", tags=["emaillist"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
-@router.get("", response_model=list[EmailListOut])
-async def list_email_list(
-    session: SessionDep, current_user: str = Depends(require_permission(Permissions.admin))
-) -> list[EmailListOut]:
+@router.get(
+    "",
+    response_model=list[EmailListOut],
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
+async def list_email_list(session: SessionDep) -> list[EmailListOut]:
     svc = EmailListService(session)
-    return await svc.list()
+    return await svc.list_cached()
 
 
 @router.post("", status_code=status.HTTP_202_ACCEPTED)
@@ -43,11 +45,14 @@ async def unsubscribe_by_token(token: UUID, session: SessionDep) -> None:
     await EmailListService(session).unsubscribe_by_token(token)
 
 
-@router.delete("/{email}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{email}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def delete_email_entry(
     session: SessionDep,
     email: str,
-    current_user: str = Depends(require_permission(Permissions.admin)),
 ) -> None:
     svc = EmailListService(session)
     await svc.delete(email)
@@ -10,9 +10,14 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import check_workspace_access, get_current_user, require_permission
+from app.core.auth import get_current_user, require_permission, require_workspace_role
 from app.core.db import get_session
-from app.core.email import send_batch_background, send_email_background
+from app.core.email import (
+    send_batch_background,
+    send_broadcast_background,
+    send_email_background,
+    unsubscribe_url,
+)
 from app.core.email_templates.renderer import (
     ALLOWED_TEMPLATES,
     get_text_config,
@@ -44,11 +49,14 @@ SessionDep = Annotated[AsyncSession, Depends(get_session)]
 router = APIRouter(prefix="/emails", tags=["emails"])
 
 
-@router.post("/send", status_code=status.HTTP_202_ACCEPTED)
+@router.post(
+    "/send",
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def send_email(
     body: EmailSendRequest,
     background_tasks: BackgroundTasks,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> None:
     """Send a custom email to one or more recipients. Admin only."""
     send_email_background(
@@ -68,16 +76,18 @@ async def invite_to_workspace(
     current_user: UserOut = Depends(get_current_user),
 ) -> None:
     """Send a workspace invitation email. Requires workspace admin role."""
-    await check_workspace_access(
-        workspace_id, current_user, session, minimum_role=WorkspaceRole.admin
-    )
-    workspace = await WorkspaceService(session).get(workspace_id)
+    # Workspace name and the caller's role come back together in one query.
+    found = await WorkspaceService(session).get_name_with_role(workspace_id, current_user.id)
+    workspace_name, role = found or (None, None)
+    require_workspace_role(role, current_user, minimum_role=WorkspaceRole.admin)
+    if workspace_name is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
 
     html = render(
         "workspace_invite",
         {
             "inviter_name": current_user.name,
-            "workspace_name": workspace.name,
+            "workspace_name": workspace_name,
             "personal_note": body.message or None,
             "accept_url": "https://slodi.is",
         },
@@ -85,42 +95,36 @@ async def invite_to_workspace(
     send_email_background(
         background_tasks,
         recipients=[str(body.email)],
-        subject=f"Boð í {workspace.name} á Slóða",
+        subject=f"Boð í {workspace_name} á Slóða",
         html=html,
     )
 
 
-@router.post("/broadcast", response_model=BroadcastOut, status_code=status.HTTP_202_ACCEPTED)
+@router.post(
+    "/broadcast",
+    response_model=BroadcastOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def broadcast_to_email_list(
     body: BroadcastRequest,
     background_tasks: BackgroundTasks,
     session: SessionDep,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> BroadcastOut:
     """Broadcast an email to all subscribers on the email list. Admin only."""
-    subscribers = await EmailListService(session).list()
+    recipients_count = await EmailListService(session).count()
 
-    if len(subscribers) > settings.resend_max_recipients:
+    if recipients_count > settings.resend_max_recipients:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Recipient count ({len(subscribers)}) exceeds the configured limit ({settings.resend_max_recipients}). Raise RESEND_MAX_RECIPIENTS to proceed.",
+            detail=f"Recipient count ({recipients_count}) exceeds the configured limit ({settings.resend_max_recipients}). Raise RESEND_MAX_RECIPIENTS to proceed.",
         )
 
-    if subscribers:
-        messages: list[tuple[str, str, str, str | None]] = []
-        for entry in subscribers:
-            unsub_url = f"https://slodi.is/unsubscribe?token={entry.unsubscribe_token}"
-            messages.append(
-                (
-                    entry.email,
-                    body.subject,
-                    body.html.replace("{unsubscribe_url}", unsub_url),
-                    unsub_url,
-                )
-            )
-        send_batch_background(background_tasks, messages)
+    # Subscribers are read inside the background task, chunk by chunk.
+    if recipients_count:
+        send_broadcast_background(background_tasks, body.subject, body.html)
 
-    return BroadcastOut(recipients_count=len(subscribers))
+    return BroadcastOut(recipients_count=recipients_count)
 
 
 # ---------------------------------------------------------------------------
@@ -222,10 +226,11 @@ async def list_templates() -> list[TemplateInfo]:
     return TEMPLATE_METADATA
 
 
-@router.get("/templates/{name}/preview")
+@router.get(
+    "/templates/{name}/preview", dependencies=[Depends(require_permission(Permissions.admin))]
+)
 async def preview_template(
     name: str,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> Response:
     """Render a template with sample data and return HTML. Admin only."""
     if name not in ALLOWED_TEMPLATES:
@@ -257,10 +262,9 @@ async def preview_template(
     return Response(content=html, media_type="text/html")
 
 
-@router.post("/render")
+@router.post("/render", dependencies=[Depends(require_permission(Permissions.admin))])
 async def render_template(
     body: RenderRequest,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> Response:
     """Render a template with provided context data. Admin only."""
     try:
@@ -285,18 +289,15 @@ async def render_template(
 # ---------------------------------------------------------------------------
 
 
-@router.get("/templates/text")
-async def get_template_text(
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
-) -> dict[str, dict[str, str]]:
+@router.get("/templates/text", dependencies=[Depends(require_permission(Permissions.admin))])
+async def get_template_text() -> dict[str, dict[str, str]]:
     """Get editable text for all email templates. Admin only."""
     return get_text_config()
 
 
-@router.put("/templates/text")
+@router.put("/templates/text", dependencies=[Depends(require_permission(Permissions.admin))])
 async def update_template_text(
     body: dict[str, dict[str, str]],
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> dict[str, dict[str, str]]:
     """Update editable text for email templates. Admin only."""
     save_text_config(body)
@@ -334,10 +335,13 @@ async def create_draft(
     return DraftOut.model_validate(draft)
 
 
-@router.get("/drafts", response_model=list[DraftOut])
+@router.get(
+    "/drafts",
+    response_model=list[DraftOut],
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def list_drafts(
     session: SessionDep,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> list[DraftOut]:
     """List all email drafts. Admin only."""
     result = await session.execute(select(EmailDraft).order_by(EmailDraft.created_at.desc()))
@@ -345,12 +349,15 @@ async def list_drafts(
     return [DraftOut.model_validate(d) for d in drafts]
 
 
-@router.put("/drafts/{draft_id}", response_model=DraftOut)
+@router.put(
+    "/drafts/{draft_id}",
+    response_model=DraftOut,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def update_draft(
     draft_id: UUID,
     body: DraftUpdate,
     session: SessionDep,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> DraftOut:
     """Update an email draft. Does not allow status changes. Admin only."""
     draft = await session.get(EmailDraft, draft_id)
@@ -369,11 +376,14 @@ async def update_draft(
     return DraftOut.model_validate(draft)
 
 
-@router.delete("/drafts/{draft_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/drafts/{draft_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def delete_draft(
     draft_id: UUID,
     session: SessionDep,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> None:
     """Delete an email draft. Only allowed if status is 'draft' or 'failed'. Admin only."""
     draft = await session.get(EmailDraft, draft_id)
@@ -410,12 +420,15 @@ def _build_render_context(draft: EmailDraft) -> dict[str, Any]:
     return context
 
 
-@router.post("/drafts/{draft_id}/send", response_model=DraftOut)
+@router.post(
+    "/drafts/{draft_id}/send",
+    response_model=DraftOut,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def send_draft(
     draft_id: UUID,
     background_tasks: BackgroundTasks,
     session: SessionDep,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> DraftOut:
     """Send a draft immediately. Admin only."""
     draft = await session.get(EmailDraft, draft_id)
@@ -442,7 +455,7 @@ async def send_draft(
     else:
         subscribers = await EmailListService(session).list()
         for subscriber in subscribers:
-            unsub_url = f"https://slodi.is/unsubscribe?token={subscriber.unsubscribe_token}"
+            unsub_url = unsubscribe_url(subscriber.unsubscribe_token)
             subscriber_html = html.replace("{unsubscribe_url}", unsub_url)
             messages.append((subscriber.email, draft.subject, subscriber_html, unsub_url))
 
@@ -6,11 +6,19 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import check_workspace_access, get_current_user
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.headers import set_location
+from app.core.pagination import (
+    Limit,
+    Offset,
+    add_keyset_headers,
+    add_pagination_headers,
+    list_response,
+)
 from app.schemas.event import EventCreate, EventListOut, EventOut, EventUpdate
 from app.schemas.user import UserOut
 from app.schemas.workspace import WorkspaceRole
@@ -19,15 +27,30 @@ from app.services.events import EventService
 router = APIRouter(tags=["events"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
+
+def get_event_service(session: SessionDep) -> EventService:
+    return EventService(session)
+
+
+EventServiceDep = Annotated[EventService, Depends(get_event_service)]
+
+EVENT_LIST_ADAPTER = TypeAdapter(list[EventListOut])
+
 DEFAULT_DATE_FROM = Query(None)
 DEFAULT_DATE_TO = Query(None)
+DEFAULT_AFTER = Query(None, description="Keyset cursor: id of the last event on the previous page")
 
 # ----- collections -----
 
 
-@router.get("/workspaces/{workspace_id}/events", response_model=list[EventListOut])
+@router.get(
+    "/workspaces/{workspace_id}/events",
+    response_model=None,
+    responses={200: {"model": list[EventListOut]}},
+)
 async def list_workspace_events(
     session: SessionDep,
+    svc: EventServiceDep,
     workspace_id: UUID,
     request: Request,
     response: Response,
@@ -36,13 +59,29 @@ async def list_workspace_events(
     date_to: dt.datetime | None = DEFAULT_DATE_TO,
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[EventListOut]:
+    after: UUID | None = DEFAULT_AFTER,
+) -> Response:
     await check_workspace_access(
         workspace_id, current_user, session, minimum_role=WorkspaceRole.viewer
     )
-    svc = EventService(session)
-    total = await svc.count_events_for_workspace(workspace_id, date_from=date_from, date_to=date_to)
-    items = await svc.list_for_workspace(
+    if after is not None:
+        items = await svc.list_for_workspace(
+            workspace_id,
+            current_user.id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            after=after,
+        )
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].id if len(items) == limit else None,
+        )
+        return list_response(EVENT_LIST_ADAPTER, items, response)
+
+    items, total = await svc.list_for_workspace_with_total(
         workspace_id,
         current_user.id,
         date_from=date_from,
@@ -57,15 +96,17 @@ async def list_workspace_events(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(EVENT_LIST_ADAPTER, items, response)
 
 
 @router.get(
     "/workspaces/{workspace_id}/programs/{program_id}/events",
-    response_model=list[EventListOut],
+    response_model=None,
+    responses={200: {"model": list[EventListOut]}},
 )
 async def list_program_events(
     session: SessionDep,
+    svc: EventServiceDep,
     workspace_id: UUID,
     program_id: UUID,
     request: Request,
@@ -75,15 +116,30 @@ async def list_program_events(
     date_to: dt.datetime | None = DEFAULT_DATE_TO,
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[EventListOut]:
+    after: UUID | None = DEFAULT_AFTER,
+) -> Response:
     await check_workspace_access(
         workspace_id, current_user, session, minimum_role=WorkspaceRole.viewer
     )
-    svc = EventService(session)
-    total = await svc.count_events_for_program(
-        workspace_id, program_id, date_from=date_from, date_to=date_to
-    )
-    items = await svc.list_for_program(
+    if after is not None:
+        items = await svc.list_for_program(
+            workspace_id,
+            program_id,
+            current_user.id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            after=after,
+        )
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].id if len(items) == limit else None,
+        )
+        return list_response(EVENT_LIST_ADAPTER, items, response)
+
+    items, total = await svc.list_for_program_with_total(
         workspace_id,
         program_id,
         current_user.id,
@@ -99,7 +155,7 @@ async def list_program_events(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(EVENT_LIST_ADAPTER, items, response)
 
 
 @router.post(
@@ -109,6 +165,7 @@ async def list_program_events(
 )
 async def create_workspace_event(
     session: SessionDep,
+    svc: EventServiceDep,
     response: Response,
     workspace_id: UUID,
     body: EventCreate,
@@ -117,10 +174,9 @@ async def create_workspace_event(
     await check_workspace_access(
         workspace_id, current_user, session, minimum_role=WorkspaceRole.editor
     )
-    svc = EventService(session)
     event_data = body.model_copy(update={"author_id": current_user.id})
     event = await svc.create_under_workspace(workspace_id, event_data)
-    response.headers["Location"] = f"/events/{event.id}"
+    set_location(response, f"/events/{event.id}")
     return event
 
 
@@ -131,6 +187,7 @@ async def create_workspace_event(
 )
 async def create_program_event(
     session: SessionDep,
+    svc: EventServiceDep,
     response: Response,
     program_id: UUID,
     body: EventCreate,
@@ -147,10 +204,9 @@ async def create_program_event(
         minimum_role=WorkspaceRole.editor,
         hide_from_non_members=True,
     )
-    svc = EventService(session)
     event_data = body.model_copy(update={"author_id": current_user.id})
     event = await svc.create_under_program(program_id, event_data)
-    response.headers["Location"] = f"/events/{event.id}"
+    set_location(response, f"/events/{event.id}")
     return event
 
 
@@ -159,9 +215,11 @@ async def create_program_event(
 
 @router.get("/events/{event_id}", response_model=EventOut)
 async def get_event(
-    session: SessionDep, event_id: UUID, current_user: UserOut = Depends(get_current_user)
+    session: SessionDep,
+    svc: EventServiceDep,
+    event_id: UUID,
+    current_user: UserOut = Depends(get_current_user),
 ) -> EventOut:
-    svc = EventService(session)
     event = await svc.get(event_id, current_user.id)
     await check_workspace_access(
         event.workspace_id,
@@ -176,14 +234,14 @@ async def get_event(
 @router.patch("/events/{event_id}", response_model=EventOut)
 async def update_event(
     session: SessionDep,
+    svc: EventServiceDep,
     event_id: UUID,
     body: EventUpdate,
     current_user: UserOut = Depends(get_current_user),
 ) -> EventOut:
-    svc = EventService(session)
-    event = await svc.get(event_id, current_user.id)
+    workspace_id = await svc.get_workspace_id(event_id)
     await check_workspace_access(
-        event.workspace_id,
+        workspace_id,
         current_user,
         session,
         minimum_role=WorkspaceRole.editor,
@@ -194,12 +252,14 @@ async def update_event(
 
 @router.delete("/events/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_event(
-    session: SessionDep, event_id: UUID, current_user: UserOut = Depends(get_current_user)
+    session: SessionDep,
+    svc: EventServiceDep,
+    event_id: UUID,
+    current_user: UserOut = Depends(get_current_user),
 ) -> None:
-    svc = EventService(session)
-    event = await svc.get(event_id, current_user.id)
+    workspace_id = await svc.get_workspace_id(event_id)
     await check_workspace_access(
-        event.workspace_id,
+        workspace_id,
         current_user,
         session,
         minimum_role=WorkspaceRole.admin,
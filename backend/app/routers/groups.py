@@ -5,11 +5,20 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import check_group_access, get_current_user
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.headers import set_location
+from app.core.pagination import (
+    Limit,
+    Offset,
+    add_keyset_headers,
+    add_pagination_headers,
+    list_response,
+    search_query,
+)
 from app.domain.enums import GroupRole
 from app.schemas.group import (
     GroupCreate,
@@ -26,24 +35,32 @@ from app.services.groups import GroupService
 router = APIRouter(tags=["groups"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
-DEFAULT_Q = Query(None, min_length=2, description="Case-insensitive search in group name")
+
+def get_group_service(session: SessionDep) -> GroupService:
+    return GroupService(session)
+
+
+GroupServiceDep = Annotated[GroupService, Depends(get_group_service)]
+
+GROUP_LIST_ADAPTER = TypeAdapter(list[GroupOut])
+GROUP_MEMBER_LIST_ADAPTER = TypeAdapter(list[GroupMemberOut])
+
+DEFAULT_Q = search_query("Case-insensitive search in group name")
 
 # ----- groups -----
 
 
-@router.get("/groups", response_model=list[GroupOut])
+@router.get("/groups", response_model=None, responses={200: {"model": list[GroupOut]}})
 async def list_groups(
-    session: SessionDep,
+    svc: GroupServiceDep,
     request: Request,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
     q: str | None = DEFAULT_Q,
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[GroupOut]:
-    svc = GroupService(session)
-    total = await svc.count(q=q)
-    items = await svc.list(q=q, limit=limit, offset=offset)
+) -> Response:
+    items, total = await svc.list_with_total(q=q, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -51,52 +68,50 @@ async def list_groups(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(GROUP_LIST_ADAPTER, items, response)
 
 
 @router.post("/groups", response_model=GroupOut, status_code=status.HTTP_201_CREATED)
 async def create_group(
-    session: SessionDep,
+    svc: GroupServiceDep,
     body: GroupCreate,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
 ) -> GroupOut:
-    svc = GroupService(session)
     group = await svc.create(body)
-    response.headers["Location"] = f"/groups/{group.id}"
+    set_location(response, f"/groups/{group.id}")
     return group
 
 
 @router.get("/groups/{group_id}", response_model=GroupOut)
 async def get_group(
-    session: SessionDep,
+    svc: GroupServiceDep,
     group_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> GroupOut:
-    svc = GroupService(session)
     return await svc.get(group_id)
 
 
 @router.patch("/groups/{group_id}", response_model=GroupOut)
 async def update_group(
     session: SessionDep,
+    svc: GroupServiceDep,
     group_id: UUID,
     body: GroupUpdate,
     current_user: UserOut = Depends(get_current_user),
 ) -> GroupOut:
     await check_group_access(group_id, current_user, session, minimum_role=GroupRole.admin)
-    svc = GroupService(session)
     return await svc.update(group_id, body)
 
 
 @router.delete("/groups/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_group(
     session: SessionDep,
+    svc: GroupServiceDep,
     group_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> None:
     await check_group_access(group_id, current_user, session, minimum_role=GroupRole.owner)
-    svc = GroupService(session)
     await svc.delete(group_id)
     return None
 
@@ -104,19 +119,34 @@ async def delete_group(
 # ----- memberships -----
 
 
-@router.get("/groups/{group_id}/memberships", response_model=list[GroupMemberOut])
+@router.get(
+    "/groups/{group_id}/memberships",
+    response_model=None,
+    responses={200: {"model": list[GroupMemberOut]}},
+)
 async def list_group_members(
-    session: SessionDep,
+    svc: GroupServiceDep,
     request: Request,
     response: Response,
     group_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[GroupMemberOut]:
-    svc = GroupService(session)
-    total = await svc.count_group_members(group_id)
-    items = await svc.list_group_members(group_id, limit=limit, offset=offset)
+    after: UUID | None = Query(
+        None, description="Keyset cursor: user_id of the last member on the previous page"
+    ),
+) -> Response:
+    if after is not None:
+        items = await svc.list_group_members(group_id, limit=limit, after=after)
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].user_id if len(items) == limit else None,
+        )
+        return list_response(GROUP_MEMBER_LIST_ADAPTER, items, response)
+
+    items, total = await svc.list_group_members_with_total(group_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -124,22 +154,22 @@ async def list_group_members(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(GROUP_MEMBER_LIST_ADAPTER, items, response)
 
 
-@router.get("/users/{user_id}/groups", response_model=list[GroupOut])
+@router.get(
+    "/users/{user_id}/groups", response_model=None, responses={200: {"model": list[GroupOut]}}
+)
 async def list_user_groups(
-    session: SessionDep,
+    svc: GroupServiceDep,
     request: Request,
     response: Response,
     user_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[GroupOut]:
-    svc = GroupService(session)
-    total = await svc.count_user_groups(user_id)
-    items = await svc.list_user_groups(user_id, limit=limit, offset=offset)
+) -> Response:
+    items, total = await svc.list_user_groups_with_total(user_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -147,7 +177,7 @@ async def list_user_groups(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(GROUP_LIST_ADAPTER, items, response)
 
 
 @router.post(
@@ -157,17 +187,17 @@ async def list_user_groups(
 )
 async def add_group_membership(
     session: SessionDep,
+    svc: GroupServiceDep,
     group_id: UUID,
     body: GroupMembershipCreate,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
 ) -> GroupMembershipOut:
     await check_group_access(group_id, current_user, session, minimum_role=GroupRole.admin)
-    svc = GroupService(session)
     created, group_membership = await svc.add_membership(group_id, body)
     if not created:
         response.status_code = status.HTTP_200_OK
-    response.headers["Location"] = f"/groups/{group_id}/memberships/{group_membership.user_id}"
+    set_location(response, f"/groups/{group_id}/memberships/{group_membership.user_id}")
     return group_membership
 
 
@@ -177,13 +207,13 @@ async def add_group_membership(
 )
 async def update_group_member(
     session: SessionDep,
+    svc: GroupServiceDep,
     group_id: UUID,
     user_id: UUID,
     body: GroupMembershipUpdate,
     current_user: UserOut = Depends(get_current_user),
 ) -> GroupMembershipOut:
     await check_group_access(group_id, current_user, session, minimum_role=GroupRole.admin)
-    svc = GroupService(session)
     return await svc.update_membership(group_id, user_id, body)
 
 
@@ -192,11 +222,10 @@ async def update_group_member(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def leave_group(
-    session: SessionDep,
+    svc: GroupServiceDep,
     group_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> None:
-    svc = GroupService(session)
     await svc.remove_membership(group_id, current_user.id)
     return None
 
@@ -207,11 +236,11 @@ async def leave_group(
 )
 async def remove_group_member(
     session: SessionDep,
+    svc: GroupServiceDep,
     group_id: UUID,
     user_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> None:
     await check_group_access(group_id, current_user, session, minimum_role=GroupRole.admin)
-    svc = GroupService(session)
     await svc.remove_membership(group_id, user_id)
     return None
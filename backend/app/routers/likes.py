@@ -4,12 +4,19 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user, require_permission
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.pagination import (
+    Limit,
+    Offset,
+    add_keyset_headers,
+    add_pagination_headers,
+    list_response,
+)
 from app.schemas.like import LikeOut
 from app.schemas.user import Permissions, UserOut
 from app.services.likes import LikeService
@@ -18,20 +25,42 @@ router = APIRouter(tags=["likes"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
+def get_like_service(session: SessionDep) -> LikeService:
+    return LikeService(session)
+
+
+LikeServiceDep = Annotated[LikeService, Depends(get_like_service)]
+
+LIKE_LIST_ADAPTER = TypeAdapter(list[LikeOut])
+
+
 # ----- collection: by content -----
-@router.get("/content/{content_id}/likes", response_model=list[LikeOut])
+@router.get(
+    "/content/{content_id}/likes", response_model=None, responses={200: {"model": list[LikeOut]}}
+)
 async def list_content_likes(
-    session: SessionDep,
+    svc: LikeServiceDep,
     request: Request,
     response: Response,
     content_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[LikeOut]:
-    svc = LikeService(session)
-    total = await svc.count_content_likes(content_id)
-    items = await svc.list_for_content(content_id, limit=limit, offset=offset)
+    after: UUID | None = Query(
+        None, description="Keyset cursor: user_id of the last like on the previous page"
+    ),
+) -> Response:
+    if after is not None:
+        items = await svc.list_for_content(content_id, limit=limit, after=after)
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].user_id if len(items) == limit else None,
+        )
+        return list_response(LIKE_LIST_ADAPTER, items, response)
+
+    items, total = await svc.list_for_content_with_total(content_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -39,7 +68,7 @@ async def list_content_likes(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(LIKE_LIST_ADAPTER, items, response)
 
 
 @router.post(
@@ -48,32 +77,32 @@ async def list_content_likes(
     status_code=status.HTTP_201_CREATED,
 )
 async def like_content(
-    session: SessionDep,
+    svc: LikeServiceDep,
     content_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> LikeOut:
-    svc = LikeService(session)
     return await svc.like_content(user_id=current_user.id, content_id=content_id)
 
 
 @router.delete("/content/{content_id}/likes", status_code=status.HTTP_204_NO_CONTENT)
 async def unlike_content(
-    session: SessionDep,
+    svc: LikeServiceDep,
     content_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> None:
-    svc = LikeService(session)
     await svc.delete(user_id=current_user.id, content_id=content_id)
     return None
 
 
-@router.delete("/content/{content_id}/likes/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/content/{content_id}/likes/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def unlike_content_admin(
-    session: SessionDep,
+    svc: LikeServiceDep,
     user_id: UUID,
     content_id: UUID,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> None:
-    svc = LikeService(session)
     await svc.delete(user_id=user_id, content_id=content_id)
     return None
@@ -5,12 +5,14 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import check_program_edit_access, check_workspace_access, get_current_user
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
-from app.domain.enums import AgeGroup, ContentType, ProgramSortBy
+from app.core.headers import set_location
+from app.core.pagination import Limit, Offset, add_pagination_headers, list_response
+from app.domain.enums import AgeGroup, ProgramSortBy
 from app.schemas.program import (
     ProgramCreate,
     ProgramFilters,
@@ -25,12 +27,26 @@ from app.services.programs import ProgramService
 router = APIRouter(tags=["programs"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
+
+def get_program_service(session: SessionDep) -> ProgramService:
+    return ProgramService(session)
+
+
+ProgramServiceDep = Annotated[ProgramService, Depends(get_program_service)]
+
+PROGRAM_LIST_ADAPTER = TypeAdapter(list[ProgramListOut])
+
 # ----- workspace-scoped collection endpoints -----
 
 
-@router.get("/workspaces/{workspace_id}/programs", response_model=list[ProgramListOut])
+@router.get(
+    "/workspaces/{workspace_id}/programs",
+    response_model=None,
+    responses={200: {"model": list[ProgramListOut]}},
+)
 async def list_workspace_programs(
     session: SessionDep,
+    svc: ProgramServiceDep,
     request: Request,
     response: Response,
     workspace_id: UUID,
@@ -96,8 +112,7 @@ async def list_workspace_programs(
         default=None,
         description="Sort order",
     ),
-) -> list[ProgramListOut]:
-    svc = ProgramService(session)
+) -> Response:
     await check_workspace_access(
         workspace_id, current_user, session, minimum_role=WorkspaceRole.viewer
     )
@@ -118,8 +133,7 @@ async def list_workspace_programs(
         sort_by=sort_by,
     )
 
-    total = await svc.count_programs_for_workspace(workspace_id, filters=filters)
-    items = await svc.list_for_workspace(
+    items, total = await svc.list_for_workspace_with_total(
         workspace_id, current_user.id, limit=limit, offset=offset, filters=filters
     )
     add_pagination_headers(
@@ -129,7 +143,7 @@ async def list_workspace_programs(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(PROGRAM_LIST_ADAPTER, items, response)
 
 
 @router.post(
@@ -139,6 +153,7 @@ async def list_workspace_programs(
 )
 async def create_program_under_workspace(
     session: SessionDep,
+    svc: ProgramServiceDep,
     workspace_id: UUID,
     body: ProgramCreate,
     response: Response,
@@ -152,9 +167,8 @@ async def create_program_under_workspace(
             "author_id": current_user.id,
         }
     )
-    svc = ProgramService(session)
     program = await svc.create_under_workspace(workspace_id, program_data)
-    response.headers["Location"] = f"/programs/{program.id}"
+    set_location(response, f"/programs/{program.id}")
     return program
 
 
@@ -165,6 +179,7 @@ async def create_program_under_workspace(
 )
 async def copy_program_to_workspace(
     session: SessionDep,
+    svc: ProgramServiceDep,
     workspace_id: UUID,
     program_id: UUID,
     response: Response,
@@ -173,30 +188,8 @@ async def copy_program_to_workspace(
     await check_workspace_access(
         workspace_id, current_user, session, minimum_role=WorkspaceRole.editor
     )
-    svc = ProgramService(session)
-    original_program = await svc.get(program_id)
-    copied_program = ProgramCreate(
-        name=original_program.name,
-        description=original_program.description,
-        equipment=original_program.equipment,
-        instructions=original_program.instructions,
-        duration_min=original_program.duration_min,
-        duration_max=original_program.duration_max,
-        age=original_program.age,
-        location=original_program.location,
-        count_min=original_program.count_min,
-        count_max=original_program.count_max,
-        price=original_program.price,
-        prep_time_min=original_program.prep_time_min,
-        prep_time_max=original_program.prep_time_max,
-        media=original_program.media,
-        author_id=current_user.id,
-        content_type=ContentType.program,
-        image=original_program.image,
-        tag_names=[t.name for t in original_program.tags],
-    )
-    program = await svc.create_under_workspace(workspace_id, copied_program)
-    response.headers["Location"] = f"/programs/{program.id}"
+    program = await svc.copy_to_workspace(program_id, workspace_id, current_user.id)
+    set_location(response, f"/programs/{program.id}")
     return program
 
 
@@ -206,11 +199,11 @@ async def copy_program_to_workspace(
 @router.get("/programs/{program_id}", response_model=ProgramOut)
 async def get_program(
     session: SessionDep,
+    svc: ProgramServiceDep,
     program_id: UUID,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
 ) -> ProgramOut:
-    svc = ProgramService(session)
     program = await svc.get(program_id, current_user.id)
     await check_workspace_access(
         program.workspace_id,
@@ -226,15 +219,15 @@ async def get_program(
 @router.patch("/programs/{program_id}", response_model=ProgramOut)
 async def update_program(
     session: SessionDep,
+    svc: ProgramServiceDep,
     program_id: UUID,
     body: ProgramUpdate,
     current_user: UserOut = Depends(get_current_user),
 ) -> ProgramOut:
-    svc = ProgramService(session)
-    program = await svc.get(program_id)
+    workspace_id, author_id = await svc.get_owner(program_id)
     await check_program_edit_access(
-        program.workspace_id,
-        program.author.id,
+        workspace_id,
+        author_id,
         current_user,
         session,
         hide_from_non_members=True,
@@ -244,12 +237,14 @@ async def update_program(
 
 @router.delete("/programs/{program_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_program(
-    session: SessionDep, program_id: UUID, current_user: UserOut = Depends(get_current_user)
+    session: SessionDep,
+    svc: ProgramServiceDep,
+    program_id: UUID,
+    current_user: UserOut = Depends(get_current_user),
 ) -> None:
-    svc = ProgramService(session)
-    program = await svc.get(program_id)
+    workspace_id, _ = await svc.get_owner(program_id)
     await check_workspace_access(
-        program.workspace_id,
+        workspace_id,
         current_user,
         session,
         minimum_role=WorkspaceRole.admin,
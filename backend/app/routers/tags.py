@@ -4,13 +4,22 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user, require_permission
 from app.core.cache import tags_cache
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.headers import set_location
+from app.core.pagination import (
+    Limit,
+    Offset,
+    add_keyset_headers,
+    add_pagination_headers,
+    list_response,
+    search_query,
+)
 from app.schemas.content import ContentListOut
 from app.schemas.tag import (
     ContentTagOut,
@@ -19,27 +28,59 @@ from app.schemas.tag import (
     TagUpdate,
 )
 from app.schemas.user import Permissions, UserOut
-from app.services.content import ContentService
 from app.services.tags import TagService
 
 router = APIRouter(tags=["tags"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
-DEFAULT_Q = Query(None, min_length=2, description="Case-insensitive search in tag names")
+
+def get_tag_service(session: SessionDep) -> TagService:
+    return TagService(session)
+
+
+TagServiceDep = Annotated[TagService, Depends(get_tag_service)]
+
+
+TAG_LIST_ADAPTER = TypeAdapter(list[TagOut])
+CONTENT_LIST_ADAPTER = TypeAdapter(list[ContentListOut])
+
+DEFAULT_Q = search_query("Case-insensitive search in tag names")
+DEFAULT_AFTER = Query(None, description="Keyset cursor: id of the last tag on the previous page")
+
+# Bodies for the author check's 403, serialized once. Tagging someone else's content
+# is a routine reject, so it is answered directly rather than raised through the
+# exception handlers.
+_FORBIDDEN_ADD_BODY = b'{"detail":"Only the content author can add tags."}'
+_FORBIDDEN_REMOVE_BODY = b'{"detail":"Only the content author can remove tags."}'
+
+
+def _forbidden(body: bytes) -> Response:
+    # A fresh Response each time: middleware appends to a response's raw header list.
+    return Response(body, status_code=status.HTTP_403_FORBIDDEN, media_type="application/json")
+
 
 # ----- tags -----
 
 
-@router.get("/tags", response_model=list[TagOut])
+@router.get("/tags", response_model=None, responses={200: {"model": list[TagOut]}})
 async def list_tags(
-    session: SessionDep,
+    svc: TagServiceDep,
     request: Request,
     response: Response,
     q: str | None = DEFAULT_Q,
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[TagOut]:
-    svc = TagService(session)
+    after: UUID | None = DEFAULT_AFTER,
+) -> Response:
+    if after is not None:
+        items = await svc.list(q=q, limit=limit, after=after)
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].id if len(items) == limit else None,
+        )
+        return list_response(TAG_LIST_ADAPTER, items, response)
 
     # Serve unfiltered requests from cache (apply pagination in-memory)
     if q is None:
@@ -50,11 +91,10 @@ async def list_tags(
             add_pagination_headers(
                 response=response, request=request, total=total, limit=limit, offset=offset
             )
-            return sliced
+            return list_response(TAG_LIST_ADAPTER, sliced, response)
 
     # DB path — filtered query or cache miss
-    total = await svc.count(q=q)
-    items = await svc.list(q=q, limit=limit, offset=offset)
+    items, total = await svc.list_with_total(q=q, limit=limit, offset=offset)
 
     # Populate cache when we fetched the full unfiltered list
     if q is None and offset == 0 and len(items) == total:
@@ -67,56 +107,62 @@ async def list_tags(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(TAG_LIST_ADAPTER, items, response)
 
 
-@router.post("/tags", response_model=TagOut, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/tags",
+    response_model=TagOut,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_permission(Permissions.member))],
+)
 async def create_tag(
-    session: SessionDep,
+    svc: TagServiceDep,
     body: TagCreate,
     response: Response,
-    current_user: UserOut = Depends(require_permission(Permissions.member)),
 ) -> TagOut:
-    svc = TagService(session)
     tag = await svc.create(body)
-    response.headers["Location"] = f"/tags/{tag.id}"
+    set_location(response, f"/tags/{tag.id}")
     await tags_cache.invalidate()
     return tag
 
 
 @router.get("/tags/{tag_id}", response_model=TagOut)
 async def get_tag(
-    session: SessionDep,
+    svc: TagServiceDep,
     tag_id: UUID,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
 ) -> TagOut:
-    svc = TagService(session)
     result = await svc.get(tag_id)
     response.headers["Cache-Control"] = "private, max-age=300"
     return result
 
 
-@router.patch("/tags/{tag_id}", response_model=TagOut)
+@router.patch(
+    "/tags/{tag_id}",
+    response_model=TagOut,
+    dependencies=[Depends(require_permission(Permissions.member))],
+)
 async def update_tag(
-    session: SessionDep,
+    svc: TagServiceDep,
     tag_id: UUID,
     body: TagUpdate,
-    current_user: UserOut = Depends(require_permission(Permissions.member)),
 ) -> TagOut:
-    svc = TagService(session)
     updated = await svc.update(tag_id, body)
     await tags_cache.invalidate()
     return updated
 
 
-@router.delete("/tags/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/tags/{tag_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_permission(Permissions.member))],
+)
 async def delete_tag(
-    session: SessionDep,
+    svc: TagServiceDep,
     tag_id: UUID,
-    current_user: UserOut = Depends(require_permission(Permissions.member)),
 ) -> None:
-    svc = TagService(session)
     await svc.delete(tag_id)
     await tags_cache.invalidate()
     return None
@@ -125,19 +171,19 @@ async def delete_tag(
 # ----- associations -----
 
 
-@router.get("/content/{content_id}/tags", response_model=list[TagOut])
+@router.get(
+    "/content/{content_id}/tags", response_model=None, responses={200: {"model": list[TagOut]}}
+)
 async def list_content_tags(
-    session: SessionDep,
+    svc: TagServiceDep,
     request: Request,
     response: Response,
     content_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[TagOut]:
-    svc = TagService(session)
-    total = await svc.count_content_tags(content_id)
-    items = await svc.list_content_tags(content_id, limit=limit, offset=offset)
+) -> Response:
+    items, total = await svc.list_content_tags_with_total(content_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -145,22 +191,24 @@ async def list_content_tags(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(TAG_LIST_ADAPTER, items, response)
 
 
-@router.get("/tags/{tag_id}/content", response_model=list[ContentListOut])
+@router.get(
+    "/tags/{tag_id}/content", response_model=None, responses={200: {"model": list[ContentListOut]}}
+)
 async def list_tagged_content(
-    session: SessionDep,
+    svc: TagServiceDep,
     request: Request,
     response: Response,
     tag_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[ContentListOut]:
-    svc = TagService(session)
-    total = await svc.count_tagged_content(tag_id)
-    items = await svc.list_tagged_content(tag_id, current_user.id, limit=limit, offset=offset)
+) -> Response:
+    items, total = await svc.list_tagged_content_with_total(
+        tag_id, current_user.id, limit=limit, offset=offset
+    )
     add_pagination_headers(
         response=response,
         request=request,
@@ -168,7 +216,7 @@ async def list_tagged_content(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(CONTENT_LIST_ADAPTER, items, response)
 
 
 @router.put(
@@ -177,41 +225,45 @@ async def list_tagged_content(
     status_code=status.HTTP_201_CREATED,
 )
 async def add_content_tag(
-    session: SessionDep,
+    svc: TagServiceDep,
     content_id: UUID,
     tag_id: UUID,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
-) -> ContentTagOut:
-    author_id = await ContentService(session).get_author_id(content_id)
-    if author_id != current_user.id and current_user.permissions != Permissions.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the content author can add tags.",
-        )
+) -> ContentTagOut | Response:
+    result = await svc.add_content_tag_if_authorized(
+        content_id,
+        tag_id,
+        current_user.id,
+        is_admin=current_user.permissions == Permissions.admin,
+    )
+    if result is None:
+        return _forbidden(_FORBIDDEN_ADD_BODY)
 
-    svc = TagService(session)
-    created, tag = await svc.add_content_tag(content_id, tag_id)
+    created, tag = result
     if not created:
         response.status_code = status.HTTP_200_OK
-    response.headers["Location"] = f"/content/{content_id}/tags/{tag_id}"
+    set_location(response, f"/content/{content_id}/tags/{tag_id}")
     return tag
 
 
-@router.delete("/content/{content_id}/tags/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/content/{content_id}/tags/{tag_id}",
+    response_model=None,
+    status_code=status.HTTP_204_NO_CONTENT,
+)
 async def remove_content_tag(
-    session: SessionDep,
+    svc: TagServiceDep,
     content_id: UUID,
     tag_id: UUID,
     current_user: UserOut = Depends(get_current_user),
-) -> None:
-    author_id = await ContentService(session).get_author_id(content_id)
-    if author_id != current_user.id and current_user.permissions != Permissions.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the content author can remove tags.",
-        )
-
-    svc = TagService(session)
-    await svc.remove_content_tag(content_id, tag_id)
+) -> Response | None:
+    removed = await svc.remove_content_tag_if_authorized(
+        content_id,
+        tag_id,
+        current_user.id,
+        is_admin=current_user.permissions == Permissions.admin,
+    )
+    if not removed:
+        return _forbidden(_FORBIDDEN_REMOVE_BODY)
     return None
@@ -4,12 +4,20 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import check_workspace_access, get_current_user
+from app.core.auth import check_workspace_access, get_current_user, require_workspace_role
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.headers import set_location
+from app.core.pagination import (
+    Limit,
+    Offset,
+    add_keyset_headers,
+    add_pagination_headers,
+    list_response,
+)
 from app.schemas.task import TaskCreate, TaskListOut, TaskOut, TaskUpdate
 from app.schemas.user import UserOut
 from app.schemas.workspace import WorkspaceRole
@@ -20,20 +28,33 @@ router = APIRouter(tags=["tasks"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
+def get_task_service(session: SessionDep) -> TaskService:
+    return TaskService(session)
+
+
+TaskServiceDep = Annotated[TaskService, Depends(get_task_service)]
+
+TASK_LIST_ADAPTER = TypeAdapter(list[TaskListOut])
+
+
 # ----- collection under workspace -----
 
 
-@router.get("/workspaces/{workspace_id}/tasks", response_model=list[TaskListOut])
+@router.get(
+    "/workspaces/{workspace_id}/tasks",
+    response_model=None,
+    responses={200: {"model": list[TaskListOut]}},
+)
 async def list_workspace_tasks(
     session: SessionDep,
+    svc: TaskServiceDep,
     request: Request,
     response: Response,
     workspace_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[TaskListOut]:
-    svc = TaskService(session)
+) -> Response:
     await check_workspace_access(
         workspace_id,
         current_user,
@@ -41,8 +62,9 @@ async def list_workspace_tasks(
         minimum_role=WorkspaceRole.viewer,
         hide_from_non_members=True,
     )
-    total = await svc.count_for_workspace(workspace_id)
-    items = await svc.list_for_workspace(workspace_id, current_user.id, limit=limit, offset=offset)
+    items, total = await svc.list_for_workspace_with_total(
+        workspace_id, current_user.id, limit=limit, offset=offset
+    )
     add_pagination_headers(
         response=response,
         request=request,
@@ -50,7 +72,7 @@ async def list_workspace_tasks(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(TASK_LIST_ADAPTER, items, response)
 
 
 @router.post(
@@ -60,12 +82,12 @@ async def list_workspace_tasks(
 )
 async def create_workspace_task(
     session: SessionDep,
+    svc: TaskServiceDep,
     workspace_id: UUID,
     body: TaskCreate,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
 ) -> TaskOut:
-    svc = TaskService(session)
     await check_workspace_access(
         workspace_id,
         current_user,
@@ -75,35 +97,46 @@ async def create_workspace_task(
     )
     task_data = body.model_copy(update={"author_id": current_user.id})
     task = await svc.create_under_workspace(workspace_id, task_data)
-    response.headers["Location"] = f"/tasks/{task.id}"
+    set_location(response, f"/tasks/{task.id}")
     return task
 
 
 # ----- collection under event -----
 
 
-@router.get("/events/{event_id}/tasks", response_model=list[TaskListOut])
+@router.get(
+    "/events/{event_id}/tasks", response_model=None, responses={200: {"model": list[TaskListOut]}}
+)
 async def list_event_tasks(
     session: SessionDep,
+    svc: TaskServiceDep,
     request: Request,
     response: Response,
     event_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[TaskListOut]:
-    svc = TaskService(session)
-    event_svc = EventService(session)
-    event = await event_svc.get(event_id, current_user.id)
-    await check_workspace_access(
-        event.workspace_id,
-        current_user,
-        session,
-        minimum_role=WorkspaceRole.viewer,
-        hide_from_non_members=True,
+    after: UUID | None = Query(
+        None, description="Keyset cursor: id of the last task on the previous page"
+    ),
+) -> Response:
+    _, role = await EventService(session).get_workspace_id_with_role(event_id, current_user.id)
+    require_workspace_role(
+        role, current_user, minimum_role=WorkspaceRole.viewer, hide_from_non_members=True
+    )
+    if after is not None:
+        items = await svc.list_for_event(event_id, current_user.id, limit=limit, after=after)
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].id if len(items) == limit else None,
+        )
+        return list_response(TASK_LIST_ADAPTER, items, response)
+
+    items, total = await svc.list_for_event_with_total(
+        event_id, current_user.id, limit=limit, offset=offset
     )
-    total = await svc.count_tasks_for_event(event_id)
-    items = await svc.list_for_event(event_id, current_user.id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -111,7 +144,7 @@ async def list_event_tasks(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(TASK_LIST_ADAPTER, items, response)
 
 
 @router.post(
@@ -121,24 +154,19 @@ async def list_event_tasks(
 )
 async def create_event_task(
     session: SessionDep,
+    svc: TaskServiceDep,
     event_id: UUID,
     body: TaskCreate,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
 ) -> TaskOut:
-    svc = TaskService(session)
-    event_svc = EventService(session)
-    event = await event_svc.get(event_id, current_user.id)
-    await check_workspace_access(
-        event.workspace_id,
-        current_user,
-        session,
-        minimum_role=WorkspaceRole.editor,
-        hide_from_non_members=True,
+    _, role = await EventService(session).get_workspace_id_with_role(event_id, current_user.id)
+    require_workspace_role(
+        role, current_user, minimum_role=WorkspaceRole.editor, hide_from_non_members=True
     )
     task_data = body.model_copy(update={"author_id": current_user.id})
     task = await svc.create_under_event(event_id, task_data)
-    response.headers["Location"] = f"/tasks/{task.id}"
+    set_location(response, f"/tasks/{task.id}")
     return task
 
 
@@ -147,9 +175,11 @@ async def create_event_task(
 
 @router.get("/tasks/{task_id}", response_model=TaskOut)
 async def get_task(
-    session: SessionDep, task_id: UUID, current_user: UserOut = Depends(get_current_user)
+    session: SessionDep,
+    svc: TaskServiceDep,
+    task_id: UUID,
+    current_user: UserOut = Depends(get_current_user),
 ) -> TaskOut:
-    svc = TaskService(session)
     task = await svc.get(task_id, current_user.id)
     await check_workspace_access(
         task.workspace_id,
@@ -164,14 +194,14 @@ async def get_task(
 @router.patch("/tasks/{task_id}", response_model=TaskOut)
 async def update_task(
     session: SessionDep,
+    svc: TaskServiceDep,
     task_id: UUID,
     body: TaskUpdate,
     current_user: UserOut = Depends(get_current_user),
 ) -> TaskOut:
-    svc = TaskService(session)
-    task = await svc.get(task_id, current_user.id)
+    workspace_id = await svc.get_workspace_id(task_id)
     await check_workspace_access(
-        task.workspace_id,
+        workspace_id,
         current_user,
         session,
         minimum_role=WorkspaceRole.editor,
@@ -182,12 +212,14 @@ async def update_task(
 
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
-    session: SessionDep, task_id: UUID, current_user: UserOut = Depends(get_current_user)
+    session: SessionDep,
+    svc: TaskServiceDep,
+    task_id: UUID,
+    current_user: UserOut = Depends(get_current_user),
 ) -> None:
-    svc = TaskService(session)
-    task = await svc.get(task_id, current_user.id)
+    workspace_id = await svc.get_workspace_id(task_id)
     await check_workspace_access(
-        task.workspace_id,
+        workspace_id,
         current_user,
         session,
         minimum_role=WorkspaceRole.admin,
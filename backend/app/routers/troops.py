@@ -4,12 +4,20 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import check_workspace_access, get_current_user
+from app.core.auth import check_workspace_access, get_current_user, require_workspace_role
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.headers import set_location
+from app.core.pagination import (
+    Limit,
+    Offset,
+    add_keyset_headers,
+    add_pagination_headers,
+    list_response,
+)
 from app.domain.enums import WorkspaceRole
 from app.schemas.event import EventOut
 from app.schemas.troop import (
@@ -25,25 +33,51 @@ router = APIRouter(tags=["troops"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
+def get_troop_service(session: SessionDep) -> TroopService:
+    return TroopService(session)
+
+
+TroopServiceDep = Annotated[TroopService, Depends(get_troop_service)]
+
+TROOP_LIST_ADAPTER = TypeAdapter(list[TroopOut])
+EVENT_LIST_ADAPTER = TypeAdapter(list[EventOut])
+
+DEFAULT_AFTER = Query(None, description="Keyset cursor: id of the last troop on the previous page")
+
+
 # ----- troops (workspace-scoped collection) -----
 
 
-@router.get("/workspaces/{workspace_id}/troops", response_model=list[TroopOut])
+@router.get(
+    "/workspaces/{workspace_id}/troops",
+    response_model=None,
+    responses={200: {"model": list[TroopOut]}},
+)
 async def list_workspace_troops(
     session: SessionDep,
+    svc: TroopServiceDep,
     request: Request,
     response: Response,
     workspace_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[TroopOut]:
+    after: UUID | None = DEFAULT_AFTER,
+) -> Response:
     await check_workspace_access(
         workspace_id, current_user, session, minimum_role=WorkspaceRole.viewer
     )
-    svc = TroopService(session)
-    total = await svc.count_troops_for_workspace(workspace_id)
-    items = await svc.list_for_workspace(workspace_id, limit=limit, offset=offset)
+    if after is not None:
+        items = await svc.list_for_workspace(workspace_id, limit=limit, after=after)
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].id if len(items) == limit else None,
+        )
+        return list_response(TROOP_LIST_ADAPTER, items, response)
+
+    items, total = await svc.list_for_workspace_with_total(workspace_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -51,7 +85,7 @@ async def list_workspace_troops(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(TROOP_LIST_ADAPTER, items, response)
 
 
 @router.post(
@@ -61,6 +95,7 @@ async def list_workspace_troops(
 )
 async def create_workspace_troop(
     session: SessionDep,
+    svc: TroopServiceDep,
     workspace_id: UUID,
     body: TroopCreate,
     response: Response,
@@ -69,9 +104,8 @@ async def create_workspace_troop(
     await check_workspace_access(
         workspace_id, current_user, session, minimum_role=WorkspaceRole.viewer
     )
-    svc = TroopService(session)
     troop = await svc.create_under_workspace(workspace_id, body)
-    response.headers["Location"] = f"/troops/{troop.id}"
+    set_location(response, f"/troops/{troop.id}")
     return troop
 
 
@@ -81,10 +115,10 @@ async def create_workspace_troop(
 @router.get("/troops/{troop_id}", response_model=TroopOut)
 async def get_troop(
     session: SessionDep,
+    svc: TroopServiceDep,
     troop_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> TroopOut:
-    svc = TroopService(session)
     troop = await svc.get(troop_id)
 
     await check_workspace_access(
@@ -95,16 +129,13 @@ async def get_troop(
 
 @router.patch("/troops/{troop_id}", response_model=TroopOut)
 async def update_troop(
-    session: SessionDep,
+    svc: TroopServiceDep,
     troop_id: UUID,
     body: TroopUpdate,
     current_user: UserOut = Depends(get_current_user),
 ) -> TroopOut:
-    svc = TroopService(session)
-    troop = await svc.get(troop_id)
-    await check_workspace_access(
-        troop.workspace_id, current_user, session, minimum_role=WorkspaceRole.admin
-    )
+    _, role = await svc.get_workspace_id_with_role(troop_id, current_user.id)
+    require_workspace_role(role, current_user, minimum_role=WorkspaceRole.admin)
     return await svc.update(troop_id, body)
 
 
@@ -113,15 +144,12 @@ async def update_troop(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete_troop(
-    session: SessionDep,
+    svc: TroopServiceDep,
     troop_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> None:
-    svc = TroopService(session)
-    troop = await svc.get(troop_id)
-    await check_workspace_access(
-        troop.workspace_id, current_user, session, minimum_role=WorkspaceRole.admin
-    )
+    _, role = await svc.get_workspace_id_with_role(troop_id, current_user.id)
+    require_workspace_role(role, current_user, minimum_role=WorkspaceRole.admin)
     await svc.delete(troop_id)
     return None
 
@@ -129,30 +157,37 @@ async def delete_troop(
 # ----- participations -----
 
 
-@router.get("/events/{event_id}/troops", response_model=list[TroopOut])
+@router.get(
+    "/events/{event_id}/troops", response_model=None, responses={200: {"model": list[TroopOut]}}
+)
 async def list_event_troops(
     session: SessionDep,
+    svc: TroopServiceDep,
     request: Request,
     response: Response,
     event_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[TroopOut]:
-    # Get event to find its workspace
+    after: UUID | None = DEFAULT_AFTER,
+) -> Response:
+    # Check workspace access via the event's workspace, read with the role in one query
     from app.services.events import EventService
 
-    event_svc = EventService(session)
-    event = await event_svc.get(event_id)
+    _, role = await EventService(session).get_workspace_id_with_role(event_id, current_user.id)
+    require_workspace_role(role, current_user, minimum_role=WorkspaceRole.viewer)
 
-    # Check workspace access via the event's workspace
-    await check_workspace_access(
-        event.workspace_id, current_user, session, minimum_role=WorkspaceRole.viewer
-    )
+    if after is not None:
+        items = await svc.list_event_troops(event_id, limit=limit, after=after)
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].id if len(items) == limit else None,
+        )
+        return list_response(TROOP_LIST_ADAPTER, items, response)
 
-    svc = TroopService(session)
-    total = await svc.count_event_troops(event_id)
-    items = await svc.list_event_troops(event_id, limit=limit, offset=offset)
+    items, total = await svc.list_event_troops_with_total(event_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -160,26 +195,24 @@ async def list_event_troops(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(TROOP_LIST_ADAPTER, items, response)
 
 
-@router.get("/troops/{troop_id}/events", response_model=list[UUID])
+@router.get(
+    "/troops/{troop_id}/events", response_model=None, responses={200: {"model": list[EventOut]}}
+)
 async def list_troop_events(
-    session: SessionDep,
+    svc: TroopServiceDep,
     request: Request,
     response: Response,
     troop_id: UUID,
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[EventOut]:
-    svc = TroopService(session)
-    troop = await svc.get(troop_id)
-    await check_workspace_access(
-        troop.workspace_id, current_user, session, minimum_role=WorkspaceRole.viewer
-    )
-    total = await svc.count_troop_events(troop_id)
-    items = await svc.list_troop_events(troop_id, limit=limit, offset=offset)
+) -> Response:
+    _, role = await svc.get_workspace_id_with_role(troop_id, current_user.id)
+    require_workspace_role(role, current_user, minimum_role=WorkspaceRole.viewer)
+    items, total = await svc.list_troop_events_with_total(troop_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -187,7 +220,7 @@ async def list_troop_events(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(EVENT_LIST_ADAPTER, items, response)
 
 
 @router.put(
@@ -196,35 +229,29 @@ async def list_troop_events(
     status_code=status.HTTP_201_CREATED,
 )
 async def add_participation(
-    session: SessionDep,
+    svc: TroopServiceDep,
     event_id: UUID,
     troop_id: UUID,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
 ) -> TroopParticipationOut:
-    svc = TroopService(session)
-    troop = await svc.get(troop_id)
-    await check_workspace_access(
-        troop.workspace_id, current_user, session, minimum_role=WorkspaceRole.admin
-    )
+    _, role = await svc.get_workspace_id_with_role(troop_id, current_user.id)
+    require_workspace_role(role, current_user, minimum_role=WorkspaceRole.admin)
     created, participation = await svc.add_participation(event_id, troop_id)
     if not created:
         response.status_code = status.HTTP_200_OK
-    response.headers["Location"] = f"/events/{event_id}/troops/{troop_id}"
+    set_location(response, f"/events/{event_id}/troops/{troop_id}")
     return participation
 
 
 @router.delete("/events/{event_id}/troops/{troop_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_participation(
-    session: SessionDep,
+    svc: TroopServiceDep,
     event_id: UUID,
     troop_id: UUID,
     current_user: UserOut = Depends(get_current_user),
 ) -> None:
-    svc = TroopService(session)
-    troop = await svc.get(troop_id)
-    await check_workspace_access(
-        troop.workspace_id, current_user, session, minimum_role=WorkspaceRole.admin
-    )
+    _, role = await svc.get_workspace_id_with_role(troop_id, current_user.id)
+    require_workspace_role(role, current_user, minimum_role=WorkspaceRole.admin)
     await svc.remove_participation(event_id, troop_id)
     return None
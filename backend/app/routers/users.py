@@ -1,41 +1,69 @@
 ## backend/app/routers/users.py
 from __future__ import annotations
 
-from collections.abc import Sequence
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user, require_permission
 from app.core.cache import user_cache
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.headers import set_location
+from app.core.pagination import (
+    Limit,
+    Offset,
+    add_keyset_headers,
+    add_pagination_headers,
+    list_response,
+    search_query,
+)
 from app.domain.enums import Permissions
 from app.schemas.user import UserCreate, UserOut, UserOutLimited, UserUpdateAdmin, UserUpdateSelf
 from app.services.users import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+
+def get_user_service(session: SessionDep) -> UserService:
+    return UserService(session)
+
+
+UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+
+USER_LIST_ADAPTER = TypeAdapter(list[UserOutLimited])
+USER_ADMIN_LIST_ADAPTER = TypeAdapter(list[UserOut])
 CurrentUser = Annotated[UserOut, Depends(get_current_user)]
 
-DEFAULT_Q = Query(None, min_length=2, description="Case-insensitive search in name/email/auth0_id")
+DEFAULT_Q = search_query("Case-insensitive search in name/email/auth0_id")
+DEFAULT_AFTER = Query(None, description="Keyset cursor: id of the last user on the previous page")
 
 
-@router.get("", response_model=list[UserOutLimited])
+@router.get("", response_model=None, responses={200: {"model": list[UserOutLimited]}})
 async def list_users(
-    session: SessionDep,
+    svc: UserServiceDep,
     request: Request,
     response: Response,
     current_user: UserOut = Depends(get_current_user),  # noqa: B008
     q: str | None = DEFAULT_Q,
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[UserOutLimited]:
-    svc = UserService(session)
-    total = await svc.count(q=q)
-    items = await svc.list(q=q, limit=limit, offset=offset)
+    after: UUID | None = DEFAULT_AFTER,
+) -> Response:
+    if after is not None:
+        items = await svc.list(q=q, limit=limit, after=after)
+        add_keyset_headers(
+            response=response,
+            request=request,
+            limit=limit,
+            next_after=items[-1].id if len(items) == limit else None,
+        )
+        return list_response(USER_LIST_ADAPTER, items, response)
+
+    items, total = await svc.list_with_total(q=q, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -43,19 +71,22 @@ async def list_users(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(USER_LIST_ADAPTER, items, response)
 
 
-@router.post("", response_model=UserOut, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=UserOut,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def create_user(
-    session: SessionDep,
+    svc: UserServiceDep,
     body: UserCreate,
     response: Response,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),  # noqa: B008
 ) -> UserOut:
-    svc = UserService(session)
     user = await svc.create(body)
-    response.headers["Location"] = f"/users/{user.id}"
+    set_location(response, f"/users/{user.id}")
     return user
 
 
@@ -67,19 +98,21 @@ async def get_current_user_info(
     return current_user
 
 
-@router.get("/admin/list", response_model=list[UserOut])
+@router.get(
+    "/admin/list",
+    response_model=None,
+    responses={200: {"model": list[UserOut]}},
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def list_users_admin(
-    session: SessionDep,
+    svc: UserServiceDep,
     request: Request,
     response: Response,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),  # noqa: B008
     q: str | None = DEFAULT_Q,
     limit: Limit = 50,
     offset: Offset = 0,
-) -> Sequence[UserOut]:
-    svc = UserService(session)
-    total = await svc.count(q=q)
-    items = await svc.list_full(q=q, limit=limit, offset=offset)
+) -> Response:
+    items, total = await svc.list_full_with_total(q=q, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -87,40 +120,40 @@ async def list_users_admin(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(USER_ADMIN_LIST_ADAPTER, items, response)
 
 
 @router.get("/{user_id}", response_model=UserOutLimited)
 async def get_user(
-    session: SessionDep,
+    svc: UserServiceDep,
     user_id: UUID,
     current_user: UserOut = Depends(get_current_user),  # noqa: B008
 ) -> UserOutLimited:
     """Get any user's public profile (if allowed)"""
-    svc = UserService(session)
     return await svc.get(user_id)
 
 
 @router.patch("/me", response_model=UserOut)
 async def update_current_user(
-    session: SessionDep,
+    svc: UserServiceDep,
     body: UserUpdateSelf,  # Restricted schema
     current_user: UserOut = Depends(get_current_user),  # noqa: B008
 ) -> UserOut:
-    svc = UserService(session)
     updated = await svc.update(current_user.id, body)
     await user_cache.invalidate(current_user.auth0_id)
     return updated
 
 
-@router.patch("/{user_id}", response_model=UserOut)
+@router.patch(
+    "/{user_id}",
+    response_model=UserOut,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def update_user(
-    session: SessionDep,
+    svc: UserServiceDep,
     user_id: UUID,
     body: UserUpdateAdmin,  # Full schema
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),  # noqa: B008
 ) -> UserOut:
-    svc = UserService(session)
     updated = await svc.update(user_id, body)
     await user_cache.invalidate(updated.auth0_id)
     return updated
@@ -128,22 +161,23 @@ async def update_user(
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_current_user(
-    session: SessionDep,
+    svc: UserServiceDep,
     current_user: UserOut = Depends(get_current_user),  # noqa: B008
 ) -> None:
-    svc = UserService(session)
     await svc.delete(current_user.id)
     await user_cache.invalidate(current_user.auth0_id)
     return None
 
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def delete_user(
-    session: SessionDep,
+    svc: UserServiceDep,
     user_id: UUID,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),  # noqa: B008
 ) -> None:
-    svc = UserService(session)
     target = await svc.get_full(user_id)  # fetch auth0_id before deletion for cache invalidation
     await svc.delete(user_id)
     await user_cache.invalidate(target.auth0_id)
@@ -4,13 +4,27 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import check_workspace_access, get_current_user, require_permission
+from app.core.auth import (
+    check_workspace_access,
+    get_current_user,
+    get_workspace_role,
+    require_permission,
+    require_workspace_role,
+)
 from app.core.cache import membership_cache
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.headers import set_location
+from app.core.pagination import (
+    Limit,
+    Offset,
+    add_pagination_headers,
+    list_response,
+    model_response,
+)
 from app.domain.enums import Permissions, WorkspaceRole
 from app.schemas.user import UserOut
 from app.schemas.workspace import (
@@ -26,8 +40,13 @@ router = APIRouter(tags=["workspaces"])
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
+WORKSPACE_LIST_ADAPTER = TypeAdapter(list[WorkspaceOut])
+MEMBERSHIP_LIST_ADAPTER = TypeAdapter(list[WorkspaceMembershipOut])
+
 
-@router.get("/users/me/workspaces", response_model=list[WorkspaceOut])
+@router.get(
+    "/users/me/workspaces", response_model=None, responses={200: {"model": list[WorkspaceOut]}}
+)
 async def list_my_workspaces(
     session: SessionDep,
     request: Request,
@@ -35,10 +54,11 @@ async def list_my_workspaces(
     current_user: UserOut = Depends(get_current_user),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[WorkspaceOut]:
+) -> Response:
     svc = WorkspaceService(session)
-    total = await svc.count_user_workspaces(current_user.id)
-    items = await svc.list_user_workspaces(current_user.id, limit=limit, offset=offset)
+    items, total = await svc.list_user_workspaces_with_total(
+        current_user.id, limit=limit, offset=offset
+    )
     add_pagination_headers(
         response=response,
         request=request,
@@ -46,22 +66,25 @@ async def list_my_workspaces(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(WORKSPACE_LIST_ADAPTER, items, response)
 
 
-@router.get("/users/{user_id}/workspaces", response_model=list[WorkspaceOut])
+@router.get(
+    "/users/{user_id}/workspaces",
+    response_model=None,
+    responses={200: {"model": list[WorkspaceOut]}},
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def list_user_workspaces_admin(
     session: SessionDep,
     request: Request,
     response: Response,
     user_id: UUID,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
     limit: Limit = 50,
     offset: Offset = 0,
-) -> list[WorkspaceOut]:
+) -> Response:
     svc = WorkspaceService(session)
-    total = await svc.count_user_workspaces(user_id)
-    items = await svc.list_user_workspaces(user_id, limit=limit, offset=offset)
+    items, total = await svc.list_user_workspaces_with_total(user_id, limit=limit, offset=offset)
     add_pagination_headers(
         response=response,
         request=request,
@@ -69,7 +92,7 @@ async def list_user_workspaces_admin(
         limit=limit,
         offset=offset,
     )
-    return items
+    return list_response(WORKSPACE_LIST_ADAPTER, items, response)
 
 
 @router.post(
@@ -85,7 +108,7 @@ async def create_my_workspace(
 ) -> WorkspaceOut:
     svc = WorkspaceService(session)
     workspace = await svc.create_user_workspace(current_user.id, body)
-    response.headers["Location"] = f"/workspaces/{workspace.id}"
+    set_location(response, f"/workspaces/{workspace.id}")
     return workspace
 
 
@@ -93,27 +116,31 @@ async def create_my_workspace(
     "/users/{user_id}/workspaces",
     response_model=WorkspaceOut,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_permission(Permissions.admin))],
 )
 async def create_user_workspace_admin(
     session: SessionDep,
     user_id: UUID,
     body: WorkspaceCreate,
     response: Response,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
 ) -> WorkspaceOut:
     svc = WorkspaceService(session)
     workspace = await svc.create_user_workspace(user_id, body)
-    response.headers["Location"] = f"/workspaces/{workspace.id}"
+    set_location(response, f"/workspaces/{workspace.id}")
     return workspace
 
 
-@router.get("/workspaces/{workspace_id}/my-role", response_model=WorkspaceMembershipOut)
+@router.get(
+    "/workspaces/{workspace_id}/my-role",
+    response_model=None,
+    responses={200: {"model": WorkspaceMembershipOut}},
+)
 async def get_my_workspace_role(
     session: SessionDep,
     workspace_id: UUID,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
-) -> WorkspaceMembershipOut:
+) -> Response:
     """Return the current user's membership/role for a workspace, or 404 if not a member.
 
     Platform admins bypass all workspace membership checks in the rest of the API, so
@@ -121,42 +148,55 @@ async def get_my_workspace_role(
     frontend can correctly infer their edit / delete permissions.
     """
     if current_user.permissions == Permissions.admin:
-        response.headers["Cache-Control"] = "private, max-age=120"
-        return WorkspaceMembershipOut(
-            workspace_id=workspace_id,
-            user_id=current_user.id,
-            role=WorkspaceRole.owner,
-        )
-    svc = WorkspaceService(session)
-    result = await svc.get_user_membership(workspace_id, current_user.id)
+        role: WorkspaceRole | None = WorkspaceRole.owner
+    else:
+        # Same cached lookup the access checks use, so this is usually a cache hit.
+        role = await get_workspace_role(workspace_id, current_user.id, session)
+        if role is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Membership not found"
+            )
     response.headers["Cache-Control"] = "private, max-age=120"
-    return result
+    # All three fields are already typed: the path UUID, the user's id and a role enum.
+    membership = WorkspaceMembershipOut.model_construct(
+        workspace_id=workspace_id, user_id=current_user.id, role=role
+    )
+    return model_response(membership, response)
 
 
-@router.get("/workspaces/{workspace_id}/members", response_model=list[WorkspaceMembershipOut])
+@router.get(
+    "/workspaces/{workspace_id}/members",
+    response_model=None,
+    responses={200: {"model": list[WorkspaceMembershipOut]}},
+    dependencies=[Depends(require_permission(Permissions.admin))],
+)
 async def list_workspace_members(
     session: SessionDep,
     workspace_id: UUID,
-    current_user: UserOut = Depends(require_permission(Permissions.admin)),
-) -> list[WorkspaceMembershipOut]:
+    response: Response,
+) -> Response:
     svc = WorkspaceService(session)
-    return await svc.list_members(workspace_id)
+    members = await svc.list_members(workspace_id)
+    return list_response(MEMBERSHIP_LIST_ADAPTER, members, response)
 
 
-@router.get("/workspaces/{workspace_id}", response_model=WorkspaceOut)
+@router.get(
+    "/workspaces/{workspace_id}", response_model=None, responses={200: {"model": WorkspaceOut}}
+)
 async def get_workspace(
     session: SessionDep,
     workspace_id: UUID,
     response: Response,
     current_user: UserOut = Depends(get_current_user),
-) -> WorkspaceOut:
-    await check_workspace_access(
-        workspace_id, current_user, session, minimum_role=WorkspaceRole.viewer
-    )
-    svc = WorkspaceService(session)
-    result = await svc.get(workspace_id)
+) -> Response:
+    # The workspace and the caller's role come back together in one query.
+    found = await WorkspaceService(session).get_with_role(workspace_id, current_user.id)
+    workspace, role = found or (None, None)
+    require_workspace_role(role, current_user, minimum_role=WorkspaceRole.viewer)
+    if workspace is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
     response.headers["Cache-Control"] = "private, max-age=60"
-    return result
+    return model_response(workspace, response)
 
 
 @router.patch("/workspaces/{workspace_id}", response_model=WorkspaceOut)
@@ -205,6 +245,6 @@ async def delete_workspace(
         workspace_id, current_user, session, minimum_role=WorkspaceRole.owner
     )
     svc = WorkspaceService(session)
-    await svc.delete(workspace_id)
-    await membership_cache.clear_all()
+    member_ids = await svc.delete(workspace_id)
+    await membership_cache.invalidate_workspace(workspace_id, member_ids)
     return None
@@ -4,10 +4,9 @@ import datetime as dt
 from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from pydantic import BaseModel, ConfigDict, StringConstraints
 
 from app.domain.comment_constraints import BODY_MAX, BODY_MIN
-from app.utils import get_current_datetime
 
 BodyStr = Annotated[
     str,
@@ -28,7 +27,6 @@ class CommentCreate(BaseModel):
 
     body: BodyStr
     user_id: UUID
-    created_at: dt.datetime = Field(default_factory=get_current_datetime)
 
 
 class CommentUpdate(BaseModel):
@@ -7,7 +7,6 @@ from uuid import UUID
 from pydantic import (
     BaseModel,
     ConfigDict,
-    Field,
     StringConstraints,
     ValidationInfo,
     field_validator,
@@ -27,7 +26,6 @@ from app.repositories.content import ContentStats
 from app.schemas.comment import CommentOut
 from app.schemas.tag import TagOut
 from app.schemas.user import UserOutLimited
-from app.utils import get_current_datetime
 
 from .workspace import WorkspaceNested
 
@@ -90,7 +88,6 @@ class ContentCreate(ContentBase):
     model_config = ConfigDict(str_strip_whitespace=True, use_enum_values=True)
 
     name: NameStr
-    created_at: dt.datetime = Field(default_factory=get_current_datetime)
 
 
 class ContentUpdate(ContentBase):
@@ -130,7 +127,13 @@ class ContentListOut(BaseModel):
 
     @classmethod
     def from_row(cls, obj: Any, stats: ContentStats) -> Self:
-        return cls.model_validate(obj).model_copy(update=vars(stats))
+        # The nested author/workspace/tags come from ORM objects and still need
+        # validating, but the stats are driver-typed, so they are written in place
+        # (as model_copy(update=...) would) without copying the whole model.
+        out = cls.model_validate(obj)
+        out.__dict__.update(stats._asdict())
+        out.__pydantic_fields_set__.update(stats._fields)
+        return out
 
 
 class ContentOut(ContentListOut):
@@ -141,7 +144,3 @@ class ContentOut(ContentListOut):
     instructions: InstructionsStr | None = None
     media: dict[str, Any] | None = None
     comments: list[CommentOut] = []
-
-
-UserOutLimited.model_rebuild()
-TagOut.model_rebuild()
@@ -8,6 +8,7 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class EmailSendRequest(BaseModel):
+    # No upper bound: send_email splits large lists into BCC envelopes.
     recipients: list[EmailStr] = Field(..., min_length=1)
     subject: str = Field(..., min_length=1, max_length=200)
     html: str = Field(..., min_length=1)
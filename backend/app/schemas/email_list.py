@@ -1,17 +1,10 @@
 from __future__ import annotations
 
-from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
-from app.domain.user_constraints import (
-    EMAIL_MAX,
-)
-
-EmailConstrained = Annotated[
-    EmailStr, StringConstraints(max_length=EMAIL_MAX, strip_whitespace=True)
-]
+from app.schemas.user import EmailConstrained
 
 
 class EmailListCreate(BaseModel):
@@ -3,12 +3,15 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.comment import Comment
 from app.repositories.comments import CommentRepository
 from app.schemas.comment import CommentCreate, CommentOut, CommentUpdate
 
+_COMMENT_LIST_ADAPTER = TypeAdapter(list[CommentOut])
+
 
 class CommentService:
     def __init__(self, session: AsyncSession) -> None:
@@ -22,14 +25,21 @@ class CommentService:
         self, content_id: UUID, *, limit: int = 50, offset: int = 0
     ) -> list[CommentOut]:
         rows = await self.repo.list_for_content(content_id, limit=limit, offset=offset)
-        return [CommentOut.model_validate(r) for r in rows]
+        return _COMMENT_LIST_ADAPTER.validate_python(rows)
+
+    async def list_for_content_with_total(
+        self, content_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[list[CommentOut], int]:
+        rows, total = await self.repo.list_for_content_with_total(
+            content_id, limit=limit, offset=offset
+        )
+        return _COMMENT_LIST_ADAPTER.validate_python(rows), total
 
     async def create_under_content(self, content_id: UUID, data: CommentCreate) -> CommentOut:
         comment = Comment(
             body=data.body,
             content_id=content_id,
             user_id=data.user_id,
-            created_at=data.created_at,
         )
         await self.repo.create(comment)
         await self.session.commit()
@@ -46,9 +56,8 @@ class CommentService:
         row = await self.repo.get(comment_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
-        patch = data.model_dump(exclude_unset=True)
-        for k, v in patch.items():
-            setattr(row, k, v)
+        for name in data.model_fields_set:
+            setattr(row, name, getattr(data, name))
         await self.session.commit()
         await self.session.refresh(row)
         return CommentOut.model_validate(row)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import builtins
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy.exc import IntegrityError
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.email_list import EmailList
+from app.core.cache import email_list_cache
 from app.repositories.email_list import EmailListRepository
 from app.schemas.email_list import EmailListCreate, EmailListOut
 
+_EMAIL_LIST_ADAPTER = TypeAdapter(list[EmailListOut])
+
 
 class EmailListService:
     def __init__(self, session: AsyncSession) -> None:
@@ -17,17 +20,37 @@ class EmailListService:
         self.repo = EmailListRepository(session)
 
     async def list(self) -> list[EmailListOut]:
+        """Read the subscriber list from the database; sends must use this, not the cache."""
         rows = await self.repo.list()
-        return [EmailListOut.model_validate(r) for r in rows]
+        return _EMAIL_LIST_ADAPTER.validate_python(rows)
+
+    async def count(self) -> int:
+        """Subscriber count, taken from the cached list when it is warm."""
+        cached = await email_list_cache.get()
+        if cached is not None:
+            return len(cached)
+        return await self.repo.count()
+
+    async def list_cached(self) -> builtins.list[EmailListOut]:
+        """Like ``list`` but served from ``email_list_cache`` when warm.
+
+        The mutating methods below invalidate the cache after they commit. Only
+        for the admin listing: another worker's cache can still hold an address
+        that just unsubscribed, so broadcasts read through ``list``.
+        """
+        cached = await email_list_cache.get()
+        if cached is not None:
+            return cached
+        entries = await self.list()
+        await email_list_cache.set(entries)
+        return entries
 
     async def create(self, data: EmailListCreate) -> None:
-        email_entry = EmailList(**data.model_dump())
-        try:
-            await self.repo.create(email_entry)
-            await self.session.commit()
-        except IntegrityError:
-            # Already subscribed — silently succeed so callers cannot enumerate subscribers
-            await self.session.rollback()
+        # Already subscribed — silently succeed so callers cannot enumerate subscribers
+        if not await self.repo.create_if_absent(data.email):
+            return
+        await self.session.commit()
+        await email_list_cache.invalidate()
 
     async def delete(self, email: str) -> None:
         deleted_count = await self.repo.delete(email)
@@ -37,6 +60,7 @@ class EmailListService:
                 detail="Email not found in subscription list",
             )
         await self.session.commit()
+        await email_list_cache.invalidate()
 
     async def unsubscribe_by_token(self, token: UUID) -> None:
         deleted_count = await self.repo.delete_by_token(token)
@@ -46,3 +70,4 @@ class EmailListService:
                 detail="Invalid or expired unsubscribe token.",
             )
         await self.session.commit()
+        await email_list_cache.invalidate()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import datetime as dt
+from typing import NoReturn
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import invalid_cursor
+from app.domain.enums import WorkspaceRole
 from app.models.event import Event
+from app.repositories.content import NEW_CONTENT_STATS
 from app.repositories.events import EventRepository
 from app.repositories.programs import ProgramRepository
 from app.repositories.tags import TagRepository
@@ -40,6 +44,7 @@ class EventService:
         date_to: dt.datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: UUID | None = None,
     ) -> list[EventListOut]:
         rows = await self.repo.list_for_workspace(
             workspace_id,
@@ -48,9 +53,32 @@ class EventService:
             date_to=date_to,
             limit=limit,
             offset=offset,
+            after=after,
         )
+        if not rows and after is not None and not await self.repo.cursor_exists(Event.id, after):
+            raise invalid_cursor()
         return [EventListOut.from_row(event, stats) for event, stats in rows]
 
+    async def list_for_workspace_with_total(
+        self,
+        workspace_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        date_from: dt.datetime | None = None,
+        date_to: dt.datetime | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[EventListOut], int]:
+        rows, total = await self.repo.list_for_workspace_with_total(
+            workspace_id,
+            current_user_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+        )
+        return [EventListOut.from_row(event, stats) for event, stats in rows], total
+
     async def count_events_for_program(
         self,
         workspace_id: UUID,
@@ -73,6 +101,7 @@ class EventService:
         date_to: dt.datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: UUID | None = None,
     ) -> list[EventListOut]:
         rows = await self.repo.list_for_program(
             workspace_id,
@@ -82,9 +111,34 @@ class EventService:
             date_to=date_to,
             limit=limit,
             offset=offset,
+            after=after,
         )
+        if not rows and after is not None and not await self.repo.cursor_exists(Event.id, after):
+            raise invalid_cursor()
         return [EventListOut.from_row(event, stats) for event, stats in rows]
 
+    async def list_for_program_with_total(
+        self,
+        workspace_id: UUID,
+        program_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        date_from: dt.datetime | None = None,
+        date_to: dt.datetime | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[EventListOut], int]:
+        rows, total = await self.repo.list_for_program_with_total(
+            workspace_id,
+            program_id,
+            current_user_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+        )
+        return [EventListOut.from_row(event, stats) for event, stats in rows], total
+
     # ----- creation under workspace/program -----
 
     async def create_under_workspace(self, workspace_id: UUID, data: EventCreate) -> EventOut:
@@ -103,24 +157,18 @@ class EventService:
                     detail=f"Unknown tags: {not_found}",
                 )
         await self.session.commit()
-        fetched = await self.repo.get(event.id)
-        if not fetched:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to retrieve created event",
-            )
-        ev, stats = fetched
-        return EventOut.from_row(ev, stats)
+        return await self._created_out(event.id)
 
     async def create_under_program(self, program_id: UUID, data: EventCreate) -> EventOut:
-        prog_row = await self.program_repo.get(program_id)
-        if not prog_row:
+        # Only the workspace id is needed; skip loading the program and its relations.
+        owner = await self.program_repo.get_owner(program_id)
+        if owner is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
-        prog, _ = prog_row
+        workspace_id, _ = owner
         tag_names = data.tag_names or []
         event = Event(
-            workspace_id=prog.workspace_id,
-            program_id=prog.id,
+            workspace_id=workspace_id,
+            program_id=program_id,
             **data.model_dump(exclude={"tag_names"}),
         )
         await self.repo.create(event)
@@ -134,14 +182,16 @@ class EventService:
                     detail=f"Unknown tags: {not_found}",
                 )
         await self.session.commit()
-        fetched = await self.repo.get(event.id)
-        if not fetched:
+        return await self._created_out(event.id)
+
+    async def _created_out(self, event_id: UUID) -> EventOut:
+        created = await self.repo.get_created(event_id)
+        if not created:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to retrieve created event",
             )
-        ev, stats = fetched
-        return EventOut.from_row(ev, stats)
+        return EventOut.from_row(created, NEW_CONTENT_STATS)
 
     # ----- item operations -----
 
@@ -152,6 +202,20 @@ class EventService:
         ev, stats = row
         return EventOut.from_row(ev, stats)
 
+    async def get_workspace_id(self, event_id: UUID) -> UUID:
+        workspace_id = await self.repo.get_workspace_id(event_id)
+        if workspace_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+        return workspace_id
+
+    async def get_workspace_id_with_role(
+        self, event_id: UUID, user_id: UUID
+    ) -> tuple[UUID, WorkspaceRole | None]:
+        found = await self.repo.get_workspace_id_with_role(event_id, user_id)
+        if found is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+        return found
+
     async def get_in_program(
         self,
         event_id: UUID,
@@ -168,29 +232,11 @@ class EventService:
     async def update(
         self, event_id: UUID, data: EventUpdate, current_user_id: UUID | None = None
     ) -> EventOut:
-        row = await self.repo.get(event_id)
-        if not row:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
-        event, _ = row
-        if "program_id" in data.model_fields_set:
-            if data.program_id is not None:
-                prog_row = await self.program_repo.get(data.program_id)
-                if not prog_row:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND, detail="Program not found"
-                    )
-                prog, _ = prog_row
-                if prog.workspace_id != event.workspace_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Program does not belong to the same workspace as the event",
-                    )
-                event.program_id = prog.id
-            else:
-                event.program_id = None
-        patch = data.model_dump(exclude_unset=True, exclude={"program_id", "tag_names"})
-        for k, v in patch.items():
-            setattr(event, k, v)
+        if not data.model_fields_set:
+            return await self.get(event_id, current_user_id)
+        patch = data.model_dump(exclude_unset=True, exclude={"tag_names"})
+        if not await self.repo.update_fields(event_id, patch):
+            await self._raise_update_miss(event_id, data.program_id)
         if "tag_names" in data.model_fields_set:
             tag_repo = TagRepository(self.session)
             not_found = await tag_repo.set_content_tags_by_names(event_id, data.tag_names or [])
@@ -209,9 +255,22 @@ class EventService:
         ev, stats = updated
         return EventOut.from_row(ev, stats)
 
+    async def _raise_update_miss(self, event_id: UUID, program_id: UUID | None) -> NoReturn:
+        # The UPDATE checks the target program itself; these reads only run once it
+        # matched nothing, to say which of its conditions failed.
+        if program_id is not None and await self.repo.get_workspace_id(event_id) is not None:
+            prog_owner = await self.program_repo.get_owner(program_id)
+            if prog_owner is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Program not found"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Program does not belong to the same workspace as the event",
+            )
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+
     async def delete(self, event_id: UUID) -> None:
-        row = await self.repo.get(event_id)
-        if not row:
+        if not await self.repo.delete(event_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
-        await self.repo.delete(event_id)
         await self.session.commit()
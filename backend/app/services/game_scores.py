@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.game_score_policy import score_replaces
 from app.repositories.game_scores import GameScoreRepository
 from app.schemas.game_score import GameScoreOut
 
+_GAME_SCORE_LIST_ADAPTER = TypeAdapter(list[GameScoreOut])
+
 
 class GameScoreService:
     def __init__(self, session: AsyncSession) -> None:
@@ -33,4 +36,4 @@ class GameScoreService:
 
     async def get_top_scores(self, game_slug: str) -> list[GameScoreOut]:
         rows = await self.repo.get_top_scores(game_slug)
-        return [GameScoreOut.model_validate(r) for r in rows]
+        return _GAME_SCORE_LIST_ADAPTER.validate_python(rows)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import builtins
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import group_cache, group_list_cache, group_membership_cache
+from app.core.pagination import invalid_cursor
 from app.models.group import Group
+from app.models.user import User
 from app.repositories.groups import GroupRepository
 from app.schemas.group import (
     GroupCreate,
@@ -18,6 +23,9 @@ from app.schemas.group import (
     GroupUpdate,
 )
 
+_GROUP_LIST_ADAPTER = TypeAdapter(list[GroupOut])
+_GROUP_MEMBER_LIST_ADAPTER = TypeAdapter(list[GroupMemberOut])
+
 
 class GroupService:
     def __init__(self, session: AsyncSession) -> None:
@@ -31,13 +39,30 @@ class GroupService:
 
     async def list(self, *, q: str | None, limit: int = 50, offset: int = 0) -> list[GroupOut]:
         rows = await self.repo.list(q=q, limit=limit, offset=offset)
-        return [GroupOut.model_validate(r) for r in rows]
+        return _GROUP_LIST_ADAPTER.validate_python(rows)
+
+    async def list_with_total(
+        self, *, q: str | None, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[GroupOut], int]:
+        version = await group_list_cache.version()
+        cached = await group_list_cache.get(version, q, limit, offset)
+        if cached is not None:
+            return cached
+        rows, total = await self.repo.list_with_total(q=q, limit=limit, offset=offset)
+        page = _GROUP_LIST_ADAPTER.validate_python(rows), total
+        await group_list_cache.set(version, q, limit, offset, page)
+        return page
 
     async def get(self, group_id: UUID) -> GroupOut:
+        cached = await group_cache.get(group_id)
+        if cached is not None:
+            return cached
         row = await self.repo.get(group_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-        return GroupOut.model_validate(row)
+        group = GroupOut.model_validate(row)
+        await group_cache.set(group)
+        return group
 
     async def create(self, data: GroupCreate) -> GroupOut:
         g = Group(**data.model_dump())
@@ -50,19 +75,15 @@ class GroupService:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT, detail="Group already exists"
             ) from None
-        await self.session.refresh(g)
+        await group_list_cache.clear_all()
         return GroupOut.model_validate(g)
 
     async def update(self, group_id: UUID, data: GroupUpdate) -> GroupOut:
-        g = await self.repo.get(group_id)
-        if not g:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-
+        if not data.model_fields_set:
+            return await self.get(group_id)
         patch = data.model_dump(exclude_unset=True)
-        for k, v in patch.items():
-            setattr(g, k, v)
-
         try:
+            g = await self.repo.update_fields(group_id, patch)
             await self.session.commit()
         except IntegrityError:
             await self.session.rollback()
@@ -70,29 +91,51 @@ class GroupService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Group update violates constraints",
             ) from None
-        await self.session.refresh(g)
+        if not g:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
+        await group_cache.invalidate(group_id)
+        await group_list_cache.clear_all()
         return GroupOut.model_validate(g)
 
     async def delete(self, group_id: UUID) -> None:
-        g = await self.repo.get(group_id)
-        if not g:
+        member_ids = await self.repo.list_member_ids(group_id)
+        if not await self.repo.delete(group_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-        await self.repo.delete(group_id)
         await self.session.commit()
+        await group_cache.invalidate(group_id)
+        await group_list_cache.clear_all()
+        await group_membership_cache.invalidate_group(group_id, member_ids)
 
     # ----- memberships -----
 
+    async def _ensure_exists(self, group_id: UUID) -> None:
+        # Member queries only return rows for a live group, so callers need this
+        # probe just to tell an empty page of a real group from a missing one.
+        if not await self.repo.exists(group_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
+
     async def count_group_members(self, group_id: UUID) -> int:
         return await self.repo.count_group_members(group_id)
 
     async def list_group_members(
+        self, group_id: UUID, *, limit: int = 50, offset: int = 0, after: UUID | None = None
+    ) -> builtins.list[GroupMemberOut]:
+        rows = await self.repo.list_group_members(group_id, limit=limit, offset=offset, after=after)
+        if not rows:
+            await self._ensure_exists(group_id)
+            if after is not None and not await self.repo.cursor_exists(User.id, after):
+                raise invalid_cursor()
+        return _GROUP_MEMBER_LIST_ADAPTER.validate_python(rows)
+
+    async def list_group_members_with_total(
         self, group_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[GroupMemberOut]:  # type: ignore[valid-type]
-        # ensure group exists for better UX
-        if not await self.repo.get(group_id):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-        rows = await self.repo.list_group_members(group_id, limit=limit, offset=offset)
-        return [GroupMemberOut.model_validate(r) for r in rows]  # type: ignore[attr-defined]
+    ) -> tuple[list[GroupMemberOut], int]:  # type: ignore[valid-type]
+        rows, total = await self.repo.list_group_members_with_total(
+            group_id, limit=limit, offset=offset
+        )
+        if not rows:
+            await self._ensure_exists(group_id)
+        return _GROUP_MEMBER_LIST_ADAPTER.validate_python(rows), total
 
     async def count_user_groups(self, user_id: UUID) -> int:
         return await self.repo.count_groups_for_user(user_id)
@@ -101,7 +144,15 @@ class GroupService:
         self, user_id: UUID, *, limit: int = 50, offset: int = 0
     ) -> list[GroupOut]:  # type: ignore[valid-type]
         rows = await self.repo.list_groups_for_user(user_id, limit=limit, offset=offset)
-        return [GroupOut.model_validate(r) for r in rows]
+        return _GROUP_LIST_ADAPTER.validate_python(rows)
+
+    async def list_user_groups_with_total(
+        self, user_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[GroupOut], int]:
+        rows, total = await self.repo.list_groups_for_user_with_total(
+            user_id, limit=limit, offset=offset
+        )
+        return _GROUP_LIST_ADAPTER.validate_python(rows), total
 
     async def add_membership(
         self, group_id: UUID, data: GroupMembershipCreate
@@ -111,11 +162,13 @@ class GroupService:
             await self.session.commit()
         except IntegrityError:
             await self.session.rollback()
-            # duplicate composite PK (user already member) or missing FK
+            # An existing membership is returned by the upsert; this is a missing FK
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Membership already exists or violates constraints",
             ) from None
+        # A lookup before the add may have cached this user as a non-member.
+        await group_membership_cache.invalidate(data.user_id, group_id)
         return created, GroupMembershipOut.model_validate(gs)
 
     async def get_user_membership(self, group_id: UUID, user_id: UUID) -> GroupMembershipOut | None:
@@ -127,18 +180,22 @@ class GroupService:
     async def update_membership(
         self, group_id: UUID, user_id: UUID, data: GroupMembershipUpdate
     ) -> GroupMembershipOut:
-        gm = await self.repo.get_membership(group_id, user_id)
+        if not data.model_fields_set:
+            current = await self.get_user_membership(group_id, user_id)
+            if current is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Membership not found"
+                )
+            return current
+        gm = await self.repo.update_membership(
+            group_id, user_id, data.model_dump(exclude_unset=True)
+        )
         if not gm:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Membership not found"
             )
-
-        patch = data.model_dump(exclude_unset=True)
-        for k, v in patch.items():
-            setattr(gm, k, v)
-
         await self.session.commit()
-        await self.session.refresh(gm)
+        await group_membership_cache.invalidate(user_id, group_id)
         return GroupMembershipOut.model_validate(gm)
 
     async def remove_membership(self, group_id: UUID, user_id: UUID) -> None:
@@ -148,3 +205,4 @@ class GroupService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Membership not found"
             )
         await self.session.commit()
+        await group_membership_cache.invalidate(user_id, group_id)
@@ -3,12 +3,15 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.like import UserLikedContent
 from app.repositories.likes import LikeRepository
 from app.schemas.like import LikeOut
 
+_LIKE_LIST_ADAPTER = TypeAdapter(list[LikeOut])
+
 
 class LikeService:
     def __init__(self, session: AsyncSession) -> None:
@@ -19,20 +22,30 @@ class LikeService:
         return await self.repo.count_content_likes(content_id)
 
     async def list_for_content(
-        self, content_id: UUID, *, limit: int = 50, offset: int = 0
+        self, content_id: UUID, *, limit: int = 50, offset: int = 0, after: UUID | None = None
     ) -> list[LikeOut]:
-        rows = await self.repo.list_for_content(content_id, limit=limit, offset=offset)
-        return [LikeOut.model_validate(r) for r in rows]
+        rows = await self.repo.list_for_content(content_id, limit=limit, offset=offset, after=after)
+        return _LIKE_LIST_ADAPTER.validate_python(rows)
 
-    async def like_content(self, user_id: UUID, content_id: UUID) -> LikeOut:
-        like = UserLikedContent(
-            content_id=content_id,
-            user_id=user_id,
+    async def list_for_content_with_total(
+        self, content_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[list[LikeOut], int]:
+        rows, total = await self.repo.list_for_content_with_total(
+            content_id, limit=limit, offset=offset
         )
-        await self.repo.create(like)
-        await self.session.commit()
-        await self.session.refresh(like)
-        return LikeOut.model_validate(like)
+        return _LIKE_LIST_ADAPTER.validate_python(rows), total
+
+    async def like_content(self, user_id: UUID, content_id: UUID) -> LikeOut:
+        # The like row is just its key, so there is nothing to read back.
+        try:
+            await self.repo.upsert(user_id=user_id, content_id=content_id)
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Content not found"
+            ) from None
+        return LikeOut(user_id=user_id, content_id=content_id)
 
     async def delete(self, user_id: UUID, content_id: UUID) -> None:
         deleted = await self.repo.delete(user_id=user_id, content_id=content_id)
@@ -8,6 +8,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.program import Program
+from app.repositories.content import NEW_CONTENT_STATS
 from app.repositories.programs import ProgramRepository
 from app.repositories.tags import TagRepository
 from app.schemas.program import (
@@ -45,6 +46,20 @@ class ProgramService:
         )
         return [ProgramListOut.from_row(prog, stats) for prog, stats in rows]
 
+    async def list_for_workspace_with_total(
+        self,
+        workspace_id: UUID,
+        current_user_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        filters: ProgramFilters | None = None,
+    ) -> tuple[list[ProgramListOut], int]:
+        rows, total = await self.repo.list_by_workspace_with_total(
+            workspace_id, current_user_id, limit=limit, offset=offset, filters=filters
+        )
+        return [ProgramListOut.from_row(prog, stats) for prog, stats in rows], total
+
     async def get_in_workspace(
         self, program_id: UUID, workspace_id: UUID, current_user_id: UUID | None = None
     ) -> ProgramOut:
@@ -70,15 +85,7 @@ class ProgramService:
                         detail=f"Unknown tags: {not_found}",
                     )
             await self.session.commit()
-
-            fetched = await self.repo.get(program.id)
-            if not fetched:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to retrieve created program",
-                )
-            prog, stats = fetched
-            return ProgramOut.from_row(prog, stats)
+            return await self._created_out(program.id)
         except SQLAlchemyError as e:
             logger.error(f"SQLAlchemy error creating program: {e}")
             raise HTTPException(
@@ -94,6 +101,24 @@ class ProgramService:
                 detail="Failed to create program",
             ) from e
 
+    async def copy_to_workspace(
+        self, program_id: UUID, workspace_id: UUID, author_id: UUID
+    ) -> ProgramOut:
+        new_id = await self.repo.copy_to_workspace(program_id, workspace_id, author_id)
+        if new_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
+        await self.session.commit()
+        return await self._created_out(new_id)
+
+    async def _created_out(self, program_id: UUID) -> ProgramOut:
+        created = await self.repo.get_created(program_id)
+        if not created:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve created program",
+            )
+        return ProgramOut.from_row(created, NEW_CONTENT_STATS)
+
     async def get(self, program_id: UUID, current_user_id: UUID | None = None) -> ProgramOut:
         row = await self.repo.get(program_id, current_user_id)
         if not row:
@@ -102,14 +127,17 @@ class ProgramService:
         prog, stats = row
         return ProgramOut.from_row(prog, stats)
 
+    async def get_owner(self, program_id: UUID) -> tuple[UUID, UUID | None]:
+        owner = await self.repo.get_owner(program_id)
+        if owner is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
+        return owner
+
     async def update(
         self, program_id: UUID, data: ProgramUpdate, current_user_id: UUID | None = None
     ) -> ProgramOut:
-        row = await self.repo.get(program_id)
-        if not row:
-            logger.error(f"Program {program_id} not found")
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
-        prog, _ = row
+        if not data.model_fields_set:
+            return await self.get(program_id, current_user_id)
         patch = data.model_dump(exclude_unset=True, exclude={"tag_names"})
         logger.info(
             "[programs.py update] patch after model_dump: %r",
@@ -121,8 +149,9 @@ class ProgramService:
                 patch["age"],
                 [type(v).__name__ for v in (patch["age"] or [])],
             )
-        for k, v in patch.items():
-            setattr(prog, k, v)
+        if not await self.repo.update_fields(program_id, patch):
+            logger.error(f"Program {program_id} not found")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
         if "tag_names" in data.model_fields_set:
             tag_repo = TagRepository(self.session)
             not_found = await tag_repo.set_content_tags_by_names(program_id, data.tag_names or [])
@@ -142,9 +171,7 @@ class ProgramService:
         return ProgramOut.from_row(prog, stats)
 
     async def delete(self, program_id: UUID) -> None:
-        row = await self.repo.get(program_id)
-        if not row:
+        if not await self.repo.delete(program_id):
             logger.error(f"Program {program_id} not found")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
-        await self.repo.delete(program_id)
         await self.session.commit()
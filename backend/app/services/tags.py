@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import builtins
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import invalid_cursor
 from app.models.tag import Tag
 from app.repositories.tags import TagRepository
 from app.schemas.content import ContentListOut
@@ -17,6 +19,12 @@ from app.schemas.tag import (
 )
 
 
+# Rows were validated on the way in; building the DTOs without re-validating
+# them keeps list pages and item reads cheap.
+def _tag_out(tag: Tag) -> TagOut:
+    return TagOut.model_construct(id=tag.id, name=tag.name)
+
+
 class TagService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -27,15 +35,25 @@ class TagService:
     async def count(self, *, q: str | None) -> int:
         return await self.repo.count(q=q)
 
-    async def list(self, *, q: str | None, limit: int = 50, offset: int = 0) -> list[TagOut]:
-        rows = await self.repo.list(q=q, limit=limit, offset=offset)
-        return [TagOut.model_validate(r) for r in rows]
+    async def list(
+        self, *, q: str | None, limit: int = 50, offset: int = 0, after: UUID | None = None
+    ) -> list[TagOut]:
+        rows = await self.repo.list(q=q, limit=limit, offset=offset, after=after)
+        if not rows and after is not None and not await self.repo.cursor_exists(Tag.id, after):
+            raise invalid_cursor()
+        return [_tag_out(r) for r in rows]
+
+    async def list_with_total(
+        self, *, q: str | None, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[TagOut], int]:
+        rows, total = await self.repo.list_with_total(q=q, limit=limit, offset=offset)
+        return [_tag_out(r) for r in rows], total
 
     async def get(self, tag_id: UUID) -> TagOut:
         row = await self.repo.get(tag_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
-        return TagOut.model_validate(row)
+        return _tag_out(row)
 
     async def create(self, data: TagCreate) -> TagOut:
         tag = Tag(**data.model_dump())
@@ -48,17 +66,14 @@ class TagService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Tag with this name already exists",
             ) from e
-        await self.session.refresh(tag)
-        return TagOut.model_validate(tag)
+        return _tag_out(tag)
 
     async def update(self, tag_id: UUID, data: TagUpdate) -> TagOut:
-        tag = await self.repo.get(tag_id)
-        if not tag:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
+        if not data.model_fields_set:
+            return await self.get(tag_id)
         patch = data.model_dump(exclude_unset=True)
-        for k, v in patch.items():
-            setattr(tag, k, v)
         try:
+            tag = await self.repo.update_fields(tag_id, patch)
             await self.session.commit()
         except IntegrityError:
             await self.session.rollback()
@@ -66,14 +81,13 @@ class TagService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Tag update violates constraints",
             ) from None
-        await self.session.refresh(tag)
-        return TagOut.model_validate(tag)
+        if not tag:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
+        return _tag_out(tag)
 
     async def delete(self, tag_id: UUID) -> None:
-        tag = await self.repo.get(tag_id)
-        if not tag:
+        if not await self.repo.delete(tag_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
-        await self.repo.delete(tag_id)
         await self.session.commit()
 
     # ----- associations -----
@@ -85,7 +99,15 @@ class TagService:
         self, content_id: UUID, *, limit: int = 100, offset: int = 0
     ) -> list[TagOut]:  # type: ignore[valid-type]
         rows = await self.repo.list_content_tags(content_id, limit=limit, offset=offset)
-        return [TagOut.model_validate(r) for r in rows]
+        return [_tag_out(r) for r in rows]
+
+    async def list_content_tags_with_total(
+        self, content_id: UUID, *, limit: int = 100, offset: int = 0
+    ) -> tuple[builtins.list[TagOut], int]:
+        rows, total = await self.repo.list_content_tags_with_total(
+            content_id, limit=limit, offset=offset
+        )
+        return [_tag_out(r) for r in rows], total
 
     async def count_tagged_content(self, tag_id: UUID) -> int:
         return await self.repo.count_tagged_content(tag_id)
@@ -98,9 +120,17 @@ class TagService:
         )
         return [ContentListOut.from_row(r, stats) for r, stats in rows]  # type: ignore[attr-defined]
 
-    async def add_content_tag(self, content_id: UUID, tag_id: UUID) -> tuple[bool, ContentTagOut]:
+    async def add_content_tag_if_authorized(
+        self, content_id: UUID, tag_id: UUID, user_id: UUID, *, is_admin: bool
+    ) -> tuple[bool, ContentTagOut] | None:
+        """Attach a tag to content authored by the user (any content for admins).
+
+        Returns ``(created, tag)``, or ``None`` when the user may not tag it.
+        """
         try:
-            created, ct = await self.repo.add_content_tag(content_id, tag_id)
+            found, authorized, created = await self.repo.add_content_tag_if_authorized(
+                content_id, tag_id, user_id, is_admin=is_admin
+            )
             await self.session.commit()
         except IntegrityError:
             await self.session.rollback()
@@ -108,13 +138,38 @@ class TagService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Tag is already attached to this content",
             ) from None
-        return created, ContentTagOut.model_validate(ct)
-
-    async def remove_content_tag(self, content_id: UUID, tag_id: UUID) -> None:
-        deleted = await self.repo.remove_content_tag(content_id, tag_id)
+        if not found:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Content not found")
+        if not authorized:
+            return None
+        return created, ContentTagOut.model_construct(tag_id=tag_id)
+
+    async def remove_content_tag_if_authorized(
+        self, content_id: UUID, tag_id: UUID, user_id: UUID, *, is_admin: bool
+    ) -> bool:
+        """Detach a tag from content authored by the user (any content for admins).
+
+        Returns ``False`` when the user may not untag it.
+        """
+        found, authorized, deleted = await self.repo.remove_content_tag_if_authorized(
+            content_id, tag_id, user_id, is_admin=is_admin
+        )
+        if not found:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Content not found")
+        if not authorized:
+            return False
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Tag not attached to content",
             )
         await self.session.commit()
+        return True
+
+    async def list_tagged_content_with_total(
+        self, tag_id: UUID, current_user_id: UUID | None = None, *, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[ContentListOut], int]:
+        rows, total = await self.repo.list_tagged_content_with_total(
+            tag_id, current_user_id, limit=limit, offset=offset
+        )
+        return [ContentListOut.from_row(r, stats) for r, stats in rows], total  # type: ignore[attr-defined]
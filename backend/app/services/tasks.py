@@ -3,11 +3,11 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.content import Content
+from app.core.pagination import invalid_cursor
 from app.models.task import Task
+from app.repositories.events import EventRepository
 from app.repositories.tags import TagRepository
 from app.repositories.tasks import TaskRepository
 from app.schemas.task import TaskCreate, TaskListOut, TaskOut, TaskUpdate
@@ -28,10 +28,28 @@ class TaskService:
         *,
         limit: int = 50,
         offset: int = 0,
+        after: UUID | None = None,
     ) -> list[TaskListOut]:
-        rows = await self.repo.list_for_event(event_id, current_user_id, limit=limit, offset=offset)
+        rows = await self.repo.list_for_event(
+            event_id, current_user_id, limit=limit, offset=offset, after=after
+        )
+        if not rows and after is not None and not await self.repo.cursor_exists(Task.id, after):
+            raise invalid_cursor()
         return [TaskListOut.from_row(task, stats) for task, stats in rows]
 
+    async def list_for_event_with_total(
+        self,
+        event_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[TaskListOut], int]:
+        rows, total = await self.repo.list_for_event_with_total(
+            event_id, current_user_id, limit=limit, offset=offset
+        )
+        return [TaskListOut.from_row(task, stats) for task, stats in rows], total
+
     async def count_for_workspace(self, workspace_id: UUID) -> int:
         return await self.repo.count_for_workspace(workspace_id)
 
@@ -48,10 +66,21 @@ class TaskService:
         )
         return [TaskListOut.from_row(task, stats) for task, stats in rows]
 
-    async def create_under_event(self, event_id: UUID, data: TaskCreate) -> TaskOut:
-        workspace_id = await self.session.scalar(
-            select(Content.workspace_id).where(Content.id == event_id, Content.deleted_at.is_(None))
+    async def list_for_workspace_with_total(
+        self,
+        workspace_id: UUID,
+        current_user_id: UUID | None = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[TaskListOut], int]:
+        rows, total = await self.repo.list_for_workspace_with_total(
+            workspace_id, current_user_id, limit=limit, offset=offset
         )
+        return [TaskListOut.from_row(task, stats) for task, stats in rows], total
+
+    async def create_under_event(self, event_id: UUID, data: TaskCreate) -> TaskOut:
+        workspace_id = await EventRepository(self.session).get_workspace_id(event_id)
         if workspace_id is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
         tag_names = data.tag_names or []
@@ -110,6 +139,12 @@ class TaskService:
         task, stats = row
         return TaskOut.from_row(task, stats)
 
+    async def get_workspace_id(self, task_id: UUID) -> UUID:
+        workspace_id = await self.repo.get_workspace_id(task_id)
+        if workspace_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+        return workspace_id
+
     async def get_in_event(
         self, task_id: UUID, event_id: UUID, current_user_id: UUID | None = None
     ) -> TaskOut:
@@ -128,11 +163,8 @@ class TaskService:
         task, _ = row
         patch = data.model_dump(exclude_unset=True, exclude={"tag_names"})
         if "event_id" in patch and patch["event_id"] is not None:
-            event_workspace_id = await self.session.scalar(
-                select(Content.workspace_id).where(
-                    Content.id == patch["event_id"],
-                    Content.deleted_at.is_(None),
-                )
+            event_workspace_id = await EventRepository(self.session).get_workspace_id(
+                patch["event_id"]
             )
             if event_workspace_id is None:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
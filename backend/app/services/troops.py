@@ -3,9 +3,12 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import invalid_cursor
+from app.domain.enums import WorkspaceRole
 from app.models.troop import Troop
 from app.repositories.troops import TroopRepository
 from app.schemas.event import EventOut
@@ -17,6 +20,14 @@ from app.schemas.troop import (
 )
 
 
+# Trusted DB rows: construct the DTOs without re-validating them.
+def _troop_out(troop: Troop) -> TroopOut:
+    return TroopOut.model_construct(id=troop.id, name=troop.name, workspace_id=troop.workspace_id)
+
+
+_EVENT_LIST_ADAPTER = TypeAdapter(list[EventOut])
+
+
 class TroopService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -27,10 +38,23 @@ class TroopService:
         return await self.repo.count_troops_for_workspace(workspace_id)
 
     async def list_for_workspace(
-        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0
+        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0, after: UUID | None = None
     ) -> list[TroopOut]:
-        rows = await self.repo.list_for_workspace(workspace_id, limit=limit, offset=offset)
-        return [TroopOut.model_validate(r) for r in rows]
+        rows = await self.repo.list_for_workspace(
+            workspace_id, limit=limit, offset=offset, after=after
+        )
+        if not rows and after is not None and not await self.repo.cursor_exists(Troop.id, after):
+            raise invalid_cursor()
+        return [_troop_out(r) for r in rows]
+
+    async def list_for_workspace_with_total(
+        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[list[TroopOut], int]:
+        rows, total = await self.repo.list_for_workspace_with_total(
+            workspace_id, limit=limit, offset=offset
+        )
+        items = [_troop_out(r) for r in rows]
+        return items, total
 
     async def create_under_workspace(self, workspace_id: UUID, data: TroopCreate) -> TroopOut:
         troop = Troop(
@@ -40,24 +64,31 @@ class TroopService:
         await self.repo.create(troop)
         await self.session.commit()
         await self.session.refresh(troop)
-        return TroopOut.model_validate(troop)
+        return _troop_out(troop)
 
     async def get(self, troop_id: UUID) -> TroopOut:
         row = await self.repo.get(troop_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Troop not found")
-        return TroopOut.model_validate(row)
+        return _troop_out(row)
+
+    async def get_workspace_id_with_role(
+        self, troop_id: UUID, user_id: UUID
+    ) -> tuple[UUID, WorkspaceRole | None]:
+        found = await self.repo.get_workspace_id_with_role(troop_id, user_id)
+        if found is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Troop not found")
+        return found
 
     async def update(self, troop_id: UUID, data: TroopUpdate) -> TroopOut:
         row = await self.repo.get(troop_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Troop not found")
-        patch = data.model_dump(exclude_unset=True)
-        for k, v in patch.items():
-            setattr(row, k, v)
+        for name in data.model_fields_set:
+            setattr(row, name, getattr(data, name))
         await self.session.commit()
         await self.session.refresh(row)
-        return TroopOut.model_validate(row)
+        return _troop_out(row)
 
     async def delete(self, troop_id: UUID) -> None:
         deleted = await self.repo.delete(troop_id)
@@ -71,10 +102,21 @@ class TroopService:
         return await self.repo.count_event_troops(event_id)
 
     async def list_event_troops(
-        self, event_id: UUID, *, limit: int = 50, offset: int = 0
+        self, event_id: UUID, *, limit: int = 50, offset: int = 0, after: UUID | None = None
     ) -> list[TroopOut]:
-        rows = await self.repo.list_event_troops(event_id, limit=limit, offset=offset)
-        return [TroopOut.model_validate(r) for r in rows]
+        rows = await self.repo.list_event_troops(event_id, limit=limit, offset=offset, after=after)
+        if not rows and after is not None and not await self.repo.cursor_exists(Troop.id, after):
+            raise invalid_cursor()
+        return [_troop_out(r) for r in rows]
+
+    async def list_event_troops_with_total(
+        self, event_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[list[TroopOut], int]:
+        rows, total = await self.repo.list_event_troops_with_total(
+            event_id, limit=limit, offset=offset
+        )
+        items = [_troop_out(r) for r in rows]
+        return items, total
 
     async def count_troop_events(self, troop_id: UUID) -> int:
         return await self.repo.count_troop_events(troop_id)
@@ -83,7 +125,15 @@ class TroopService:
         self, troop_id: UUID, *, limit: int = 50, offset: int = 0
     ) -> list[EventOut]:
         rows = await self.repo.list_troop_events(troop_id, limit=limit, offset=offset)
-        return [EventOut.model_validate(r) for r in rows]
+        return _EVENT_LIST_ADAPTER.validate_python(rows)
+
+    async def list_troop_events_with_total(
+        self, troop_id: UUID, *, limit: int = 50, offset: int = 0
+    ) -> tuple[list[EventOut], int]:
+        rows, total = await self.repo.list_troop_events_with_total(
+            troop_id, limit=limit, offset=offset
+        )
+        return _EVENT_LIST_ADAPTER.validate_python(rows), total
 
     async def add_participation(
         self, event_id: UUID, troop_id: UUID
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import builtins
 from collections.abc import Sequence
 from uuid import UUID
 
@@ -7,11 +8,29 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import invalid_cursor
 from app.models.user import User
 from app.repositories.users import UserRepository
 from app.schemas.user import UserCreate, UserOut, UserOutLimited, UserUpdateAdmin, UserUpdateSelf
 
 
+# Trusted DB rows: construct the DTOs without re-validating them.
+def _limited_out(user: User) -> UserOutLimited:
+    return UserOutLimited.model_construct(id=user.id, name=user.name)
+
+
+def _full_out(user: User) -> UserOut:
+    return UserOut.model_construct(
+        id=user.id,
+        email=user.email,
+        auth0_id=user.auth0_id,
+        name=user.name,
+        pronouns=user.pronouns,
+        permissions=user.permissions,
+        preferences=user.preferences,
+    )
+
+
 class UserService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -22,13 +41,13 @@ class UserService:
         row = await self.repo.get(user_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-        return UserOut.model_validate(row)
+        return _full_out(row)
 
     async def get(self, user_id: UUID) -> UserOutLimited:
         row = await self.repo.get(user_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-        return UserOutLimited.model_validate(row)
+        return _limited_out(row)
 
     async def get_by_auth0_id(self, auth0_id: str) -> UserOut | None:
         """
@@ -42,23 +61,37 @@ class UserService:
         """
         user = await self.repo.get_by_auth0_id(auth0_id)
         if user:
-            return UserOut.model_validate(user)
+            return _full_out(user)
         return None
 
     async def count(self, *, q: str | None) -> int:
         return await self.repo.count(q=q)
 
     async def list(
-        self, *, q: str | None, limit: int = 50, offset: int = 0
+        self, *, q: str | None, limit: int = 50, offset: int = 0, after: UUID | None = None
     ) -> list[UserOutLimited]:
-        rows = await self.repo.list(q=q, limit=limit, offset=offset)
-        return [UserOutLimited.model_validate(r) for r in rows]
+        rows = await self.repo.list(q=q, limit=limit, offset=offset, after=after)
+        if not rows and after is not None and not await self.repo.cursor_exists(User.id, after):
+            raise invalid_cursor()
+        return [_limited_out(r) for r in rows]
+
+    async def list_with_total(
+        self, *, q: str | None, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[UserOutLimited], int]:
+        rows, total = await self.repo.list_with_total(q=q, limit=limit, offset=offset)
+        return [_limited_out(r) for r in rows], total
 
     async def list_full(
         self, *, q: str | None, limit: int = 50, offset: int = 0
     ) -> Sequence[UserOut]:
         rows = await self.repo.list(q=q, limit=limit, offset=offset)
-        return [UserOut.model_validate(r) for r in rows]
+        return [_full_out(r) for r in rows]
+
+    async def list_full_with_total(
+        self, *, q: str | None, limit: int = 50, offset: int = 0
+    ) -> tuple[builtins.list[UserOut], int]:
+        rows, total = await self.repo.list_with_total(q=q, limit=limit, offset=offset)
+        return [_full_out(r) for r in rows], total
 
     async def create(self, data: UserCreate) -> UserOut:
         user = User(**data.model_dump())
@@ -73,16 +106,15 @@ class UserService:
                 detail="User with this email or auth0_id already exists",
             ) from e
         await self.session.refresh(user)
-        return UserOut.model_validate(user)
+        return _full_out(user)
 
     async def update(self, user_id: UUID, data: UserUpdateSelf | UserUpdateAdmin) -> UserOut:
         row = await self.repo.get(user_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-        patch = data.model_dump(exclude_unset=True)
-        for k, v in patch.items():
-            setattr(row, k, v)
+        for name in data.model_fields_set:
+            setattr(row, name, getattr(data, name))
 
         try:
             await self.session.commit()
@@ -93,7 +125,7 @@ class UserService:
                 detail="User with this email or auth0_id already exists",
             ) from None
         await self.session.refresh(row)
-        return UserOut.model_validate(row)
+        return _full_out(row)
 
     async def delete(self, user_id: UUID) -> None:
         row = await self.repo.get(user_id)
@@ -3,8 +3,10 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.loaders import get_membership_loader
 from app.domain.enums import WorkspaceRole
 from app.models.workspace import Workspace
 from app.repositories.workspaces import WorkspaceRepository
@@ -15,31 +17,42 @@ from app.schemas.workspace import (
     WorkspaceUpdate,
 )
 
+_WORKSPACE_LIST_ADAPTER = TypeAdapter(list[WorkspaceOut])
+_MEMBERSHIP_LIST_ADAPTER = TypeAdapter(list[WorkspaceMembershipOut])
+
 
 class WorkspaceService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
         self.repo = WorkspaceRepository(session)
 
-    async def get(self, workspace_id: UUID) -> WorkspaceOut:
-        ws = await self.repo.get(workspace_id)
-        if not ws:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
-        return WorkspaceOut.model_validate(ws)
-
-    async def count_user_workspaces(self, user_id: UUID) -> int:
-        return await self.repo.count_user_workspaces(user_id)
+    async def get_with_role(
+        self, workspace_id: UUID, user_id: UUID
+    ) -> tuple[WorkspaceOut, WorkspaceRole | None] | None:
+        found = await self.repo.get_with_role(workspace_id, user_id)
+        if found is None:
+            return None
+        ws, role = found
+        return WorkspaceOut.model_validate(ws), role
+
+    async def get_name_with_role(
+        self, workspace_id: UUID, user_id: UUID
+    ) -> tuple[str, WorkspaceRole | None] | None:
+        return await self.repo.get_name_with_role(workspace_id, user_id)
 
-    async def list_user_workspaces(
+    async def list_user_workspaces_with_total(
         self, user_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[WorkspaceOut]:
-        rows = await self.repo.list_user_workspaces(user_id, limit=limit, offset=offset)
-        return [WorkspaceOut.model_validate(r) for r in rows]
+    ) -> tuple[list[WorkspaceOut], int]:
+        rows, total = await self.repo.list_user_workspaces_with_total(
+            user_id, limit=limit, offset=offset
+        )
+        return _WORKSPACE_LIST_ADAPTER.validate_python(rows), total
 
     async def create_user_workspace(self, user_id: UUID, data: WorkspaceCreate) -> WorkspaceOut:
         ws = Workspace(**data.model_dump())
         await self.repo.create_user_workspace(user_id, ws)
         await self.session.commit()
+        get_membership_loader(self.session).clear()
         await self.session.refresh(ws)
         return WorkspaceOut.model_validate(ws)
 
@@ -48,23 +61,28 @@ class WorkspaceService:
         if not ws:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
 
-        patch = data.model_dump(exclude_unset=True)
-        for k, v in patch.items():
-            setattr(ws, k, v)
+        for name in data.model_fields_set:
+            setattr(ws, name, getattr(data, name))
         await self.session.commit()
         await self.session.refresh(ws)
         return WorkspaceOut.model_validate(ws)
 
-    async def delete(self, workspace_id: UUID) -> None:
-        ws = await self.repo.get(workspace_id)
-        if not ws:
+    async def delete(self, workspace_id: UUID) -> list[UUID]:
+        """Returns the ids of the workspace's members.
+
+        The caller uses them to invalidate just those cached roles rather than
+        flushing the membership cache for every workspace.
+        """
+        member_ids = await self.repo.list_member_ids(workspace_id)
+        if not await self.repo.delete(workspace_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
-        await self.repo.delete(workspace_id)
         await self.session.commit()
+        get_membership_loader(self.session).clear()
+        return member_ids
 
     async def list_members(self, workspace_id: UUID) -> list[WorkspaceMembershipOut]:
         rows = await self.repo.list_members(workspace_id)
-        return [WorkspaceMembershipOut.model_validate(r) for r in rows]
+        return _MEMBERSHIP_LIST_ADAPTER.validate_python(rows)
 
     async def set_member_role(
         self, workspace_id: UUID, user_id: UUID, role: WorkspaceRole
@@ -90,6 +108,7 @@ class WorkspaceService:
 
         membership = await self.repo.set_member_role(workspace_id, user_id, role)
         await self.session.commit()
+        get_membership_loader(self.session).clear()
         await self.session.refresh(membership)
         return WorkspaceMembershipOut.model_validate(membership), displaced_owner_id
 
@@ -19,6 +19,20 @@ class Settings(BaseSettings):
     logger_level: str = Field("INFO", alias="LOGGER_LEVEL")
     logger_file: str | None = Field(None, alias="LOGGER_FILE")
     db_url: str = ""
+    # Server-side prepared statements (psycopg). Turn off behind a transaction-mode
+    # pooler such as PgBouncer < 1.21, which cannot route them to the same backend.
+    db_prepared_statements: bool = Field(True, alias="DB_PREPARED_STATEMENTS")
+    db_prepared_max: int = Field(500, alias="DB_PREPARED_MAX")
+    # Connection pool. Connections are recycled by age; the per-checkout ping is
+    # opt-in for networks that drop idle connections sooner than the recycle age.
+    db_pool_size: int = Field(10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(5, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle_seconds: int = Field(60, alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_timeout_seconds: int = Field(30, alias="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_pre_ping: bool = Field(False, alias="DB_POOL_PRE_PING")
+    # Behind PgBouncer the pooler owns the connections, so the app keeps none open
+    # and server-side prepared statements are disabled regardless of the flag above.
+    db_use_pgbouncer: bool = Field(False, alias="DB_USE_PGBOUNCER")
 
     # Auth0 configuration
     auth0_domain: str = Field(..., alias="AUTH0_DOMAIN")
@@ -36,6 +50,11 @@ class Settings(BaseSettings):
     resend_api_key: str | None = Field(None, alias="RESEND_API_KEY")
     resend_from_email: str = Field("Slóði <noreply@slodi.is>", alias="RESEND_FROM_EMAIL")
     resend_max_recipients: int = Field(50, alias="RESEND_MAX_RECIPIENTS")
+    # "inline" (send from the web process) or "redis" (enqueue for app.workers.email_outbox)
+    email_queue_backend: str = Field("inline", alias="EMAIL_QUEUE_BACKEND")
+
+    # Number of uvicorn worker processes (read by uvicorn itself as well).
+    web_concurrency: int = Field(1, alias="WEB_CONCURRENCY")
 
     # Cache configuration
     cache_backend: str = Field("memory", alias="CACHE_BACKEND")  # "memory" or "redis"
@@ -44,6 +63,9 @@ class Settings(BaseSettings):
     cache_user_ttl_seconds: int = Field(300, alias="CACHE_USER_TTL_SECONDS")
     cache_membership_ttl_seconds: int = Field(120, alias="CACHE_MEMBERSHIP_TTL_SECONDS")
     cache_tags_ttl_seconds: int = Field(600, alias="CACHE_TAGS_TTL_SECONDS")
+    cache_email_list_ttl_seconds: int = Field(60, alias="CACHE_EMAIL_LIST_TTL_SECONDS")
+    cache_group_ttl_seconds: int = Field(300, alias="CACHE_GROUP_TTL_SECONDS")
+    cache_group_list_ttl_seconds: int = Field(60, alias="CACHE_GROUP_LIST_TTL_SECONDS")
     rate_limit_max_window_seconds: int = Field(3600, alias="RATE_LIMIT_MAX_WINDOW_SECONDS")
 
     @property
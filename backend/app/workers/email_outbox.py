@@ -0,0 +1,141 @@
+"""Email outbox worker.
+
+Run as a long-lived process alongside the API when EMAIL_QUEUE_BACKEND="redis":
+    python -m app.workers.email_outbox
+
+Reads the outbox stream through a consumer group, so several workers can share
+the load and each message is delivered to only one of them, then sends each
+message via Resend. Messages left unacknowledged, by a worker that died or by
+a send that failed, are claimed back with XAUTOCLAIM on startup and
+periodically afterwards. A message that keeps failing is moved to a
+dead-letter stream after a few deliveries instead of being retried forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from typing import cast
+
+from redis.exceptions import ResponseError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.email import OUTBOX_STREAM, outbox_client, send_email
+
+logger = logging.getLogger(__name__)
+
+GROUP = "email-workers"
+DEAD_LETTER_STREAM = f"{OUTBOX_STREAM}:dead"
+_READ_COUNT = 10
+_BLOCK_MS = 5000
+# A pending message idle this long belongs to a worker that crashed before XACK.
+# Kept well above the time a batch takes to send so a live worker is not raced.
+_RECLAIM_MIN_IDLE_MS = 5 * 60 * 1000
+_RECLAIM_INTERVAL_SECONDS = 60
+# Deliveries (first read plus reclaims) before a failing message is dead-lettered.
+_MAX_DELIVERIES = 5
+
+# Shapes of the untyped redis-py responses, with decode_responses=True.
+_Entry = tuple[str, dict[str, str]]
+_ReadGroupResponse = list[tuple[str, list[_Entry]]]
+# Redis < 7 returns entries trimmed from the stream with no fields.
+_AutoClaimResponse = tuple[str, list[tuple[str, dict[str, str] | None]], list[str]]
+
+
+async def ensure_group() -> None:
+    """Create the consumer group (and the stream) if they do not exist yet."""
+    try:
+        await outbox_client().xgroup_create(OUTBOX_STREAM, GROUP, id="0", mkstream=True)
+    except ResponseError as exc:
+        if "BUSYGROUP" not in str(exc):
+            raise
+
+
+async def process_message(message_id: str, fields: dict[str, str]) -> None:
+    """Send one queued email and acknowledge it.
+
+    A failed send is logged and left pending, so ``reclaim_pending`` retries it
+    once it has been idle for ``_RECLAIM_MIN_IDLE_MS``.
+    """
+    try:
+        recipients: list[str] = json.loads(fields["recipients"])
+        await run_in_threadpool(send_email, recipients, fields["subject"], fields["html"])
+    except Exception:
+        logger.exception("Failed to send queued email %s; it will be retried", message_id)
+        return
+    await outbox_client().xack(OUTBOX_STREAM, GROUP, message_id)
+
+
+async def _delivery_count(message_id: str) -> int:
+    pending = await outbox_client().xpending_range(
+        OUTBOX_STREAM, GROUP, min=message_id, max=message_id, count=1
+    )
+    return int(pending[0]["times_delivered"]) if pending else 0
+
+
+async def dead_letter(message_id: str, fields: dict[str, str]) -> None:
+    """Move a message that keeps failing to the dead-letter stream and ack it."""
+    logger.error("Giving up on queued email %s; moved to %s", message_id, DEAD_LETTER_STREAM)
+    async with outbox_client().pipeline(transaction=True) as pipe:
+        pipe.xadd(DEAD_LETTER_STREAM, {**fields, "outbox_id": message_id})
+        pipe.xack(OUTBOX_STREAM, GROUP, message_id)
+        await pipe.execute()
+
+
+async def reclaim_pending(consumer: str) -> None:
+    """Claim and send messages that have sat unacknowledged for too long."""
+    start = "0-0"
+    while True:
+        response = cast(
+            _AutoClaimResponse,
+            await outbox_client().xautoclaim(
+                OUTBOX_STREAM,
+                GROUP,
+                consumer,
+                min_idle_time=_RECLAIM_MIN_IDLE_MS,
+                start_id=start,
+                count=_READ_COUNT,
+            ),
+        )
+        start, messages = response[0], response[1]
+        for message_id, fields in messages:
+            if fields is None:
+                await outbox_client().xack(OUTBOX_STREAM, GROUP, message_id)
+            elif await _delivery_count(message_id) > _MAX_DELIVERIES:
+                await dead_letter(message_id, fields)
+            else:
+                await process_message(message_id, fields)
+        if start == "0-0":
+            return
+
+
+async def main() -> None:
+    """Entry point: consume the outbox until the process is stopped."""
+    logging.basicConfig(level=logging.INFO)
+    await ensure_group()
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+    logger.info("Consuming %s as %s", OUTBOX_STREAM, consumer)
+
+    await reclaim_pending(consumer)
+    next_reclaim = time.monotonic() + _RECLAIM_INTERVAL_SECONDS
+    while True:
+        if time.monotonic() >= next_reclaim:
+            await reclaim_pending(consumer)
+            next_reclaim = time.monotonic() + _RECLAIM_INTERVAL_SECONDS
+        response = cast(
+            _ReadGroupResponse,
+            await outbox_client().xreadgroup(
+                GROUP, consumer, {OUTBOX_STREAM: ">"}, count=_READ_COUNT, block=_BLOCK_MS
+            ),
+        )
+        for _stream, messages in response:
+            for message_id, fields in messages:
+                await process_message(message_id, fields)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
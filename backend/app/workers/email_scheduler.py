@@ -20,9 +20,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
 from app.core.db import get_session_maker
+from app.core.email import unsubscribe_url
 from app.core.email_templates.renderer import render
 from app.models.email_draft import EmailDraft
-from app.services.email_list import EmailListService
+from app.repositories.email_list import EmailListRepository
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -89,28 +90,32 @@ async def process_draft(draft: EmailDraft, session: AsyncSession) -> None:
             context["blocks"] = draft.blocks
         html = render(draft.template, context)
 
-        messages: list[tuple[str, str, str, str | None]] = []
+        # Run blocking Resend calls in a thread to avoid blocking the loop
+        loop = asyncio.get_running_loop()
+        sent = 0
 
         if draft.manual_recipients:
+            messages: list[tuple[str, str, str, str | None]] = []
             for recipient in draft.manual_recipients:
                 recipient_html = html.replace("{unsubscribe_url}", "https://slodi.is/unsubscribe")
                 messages.append((recipient, draft.subject, recipient_html, None))
-        else:
-            subscribers = await EmailListService(session).list()
-            for subscriber in subscribers:
-                unsub_url = f"https://slodi.is/unsubscribe?token={subscriber.unsubscribe_token}"
-                subscriber_html = html.replace("{unsubscribe_url}", unsub_url)
-                messages.append((subscriber.email, draft.subject, subscriber_html, unsub_url))
-
-        if messages:
-            # Run blocking Resend call in a thread to avoid blocking the loop
-            loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, _send_batch_sync, messages)
+            sent = len(messages)
+        else:
+            # Stream subscribers one batch at a time instead of loading the whole list
+            async for chunk in EmailListRepository(session).iter_chunks(_BATCH_SIZE):
+                messages = []
+                for subscriber in chunk:
+                    unsub_url = unsubscribe_url(subscriber.unsubscribe_token)
+                    subscriber_html = html.replace("{unsubscribe_url}", unsub_url)
+                    messages.append((subscriber.email, draft.subject, subscriber_html, unsub_url))
+                await loop.run_in_executor(None, _send_batch_sync, messages)
+                sent += len(messages)
 
         draft.status = "sent"
         draft.sent_at = dt.datetime.now(dt.timezone.utc)
         await session.commit()
-        logger.info("Draft %s sent successfully (%d recipients)", draft.id, len(messages))
+        logger.info("Draft %s sent successfully (%d recipients)", draft.id, sent)
 
     except Exception:
         logger.exception("Failed to send draft %s", draft.id)
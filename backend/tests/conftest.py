@@ -1,16 +1,20 @@
 """Test configuration and fixtures."""
 
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 from testcontainers.postgres import PostgresContainer
 
 from app.core.auth import get_current_user
+from app.core.cache import email_list_cache
 from app.core.db import get_session
 from app.domain.enums import Permissions
 from app.main import create_app
@@ -21,6 +25,13 @@ from app.schemas.workspace import WorkspaceOut
 # ── Unit test fixtures (mocked DB) ────────────────────────────────────────────
 
 
+@pytest.fixture
+def reset_email_list_cache():
+    """Stop a subscriber list cached by one test leaking into the next."""
+    yield
+    asyncio.run(email_list_cache.invalidate())
+
+
 @pytest.fixture
 def mock_db_session():
     """Create a mock database session."""
@@ -126,6 +137,8 @@ async def integration_engine(postgres_container):
     url = postgres_container.get_connection_url().replace("psycopg2", "psycopg")
     engine = create_async_engine(url, poolclass=NullPool)
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
     yield engine
     async with engine.begin() as conn:
@@ -151,3 +164,31 @@ async def db(integration_engine) -> AsyncGenerator[AsyncSession, None]:
         async with session_factory() as session:
             yield session
         await conn.rollback()
+
+
+@pytest.fixture
+def strict_loading(db):
+    """
+    Query budget for a block of code run against ``db``.
+
+    ``with strict_loading(3): ...`` fails the test if the block sends more than
+    three statements to Postgres, catching lazy loads that slip past raiseload.
+    """
+    engine = db.bind.sync_engine
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    @contextmanager
+    def budget(max_statements: int) -> Iterator[None]:
+        start = len(statements)
+        yield
+        ran = statements[start:]
+        assert len(ran) <= max_statements, (
+            f"{len(ran)} statements exceed the budget of {max_statements}:\n" + "\n---\n".join(ran)
+        )
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield budget
+    event.remove(engine, "before_cursor_execute", record)
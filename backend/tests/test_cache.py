@@ -5,15 +5,19 @@ from __future__ import annotations
 from uuid import uuid4
 
 import pytest
+from aiocache import SimpleMemoryCache  # type: ignore[import-untyped]
+from aiocache.serializers import PickleSerializer  # type: ignore[import-untyped]
 
 from app.core.cache import (
     CACHE_MISS,
+    GroupListCache,
+    GroupMembershipCache,
     TagsCache,
     UserCache,
     WorkspaceMembershipCache,
     _make_cache,
 )
-from app.domain.enums import WorkspaceRole
+from app.domain.enums import GroupRole, WorkspaceRole
 from app.schemas.tag import TagOut
 from app.schemas.user import UserOut
 
@@ -113,6 +117,19 @@ async def test_membership_cache_invalidate() -> None:
     assert result is CACHE_MISS
 
 
+@pytest.mark.asyncio
+async def test_membership_cache_invalidate_workspace() -> None:
+    cache = WorkspaceMembershipCache(_make_cache(ttl=60, namespace="test_mem_invalidate_ws"))
+    u1, u2, ws_id, other_ws = uuid4(), uuid4(), uuid4(), uuid4()
+    await cache.set(u1, ws_id, WorkspaceRole.owner)
+    await cache.set(u2, ws_id, WorkspaceRole.viewer)
+    await cache.set(u1, other_ws, WorkspaceRole.admin)
+    await cache.invalidate_workspace(ws_id, [u1, u2])
+    assert await cache.get(u1, ws_id) is CACHE_MISS
+    assert await cache.get(u2, ws_id) is CACHE_MISS
+    assert await cache.get(u1, other_ws) == WorkspaceRole.admin
+
+
 @pytest.mark.asyncio
 async def test_membership_cache_clear_all() -> None:
     cache = WorkspaceMembershipCache(_make_cache(ttl=60, namespace="test_mem_clear"))
@@ -125,6 +142,71 @@ async def test_membership_cache_clear_all() -> None:
     assert await cache.get(u2, w2) is CACHE_MISS
 
 
+# ---------------------------------------------------------------------------
+# GroupMembershipCache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_group_membership_cache_roles_and_non_members() -> None:
+    cache = GroupMembershipCache(_make_cache(ttl=60, namespace="test_group_mem"))
+    user_id, member_of, outside = uuid4(), uuid4(), uuid4()
+    assert await cache.get(user_id, member_of) is CACHE_MISS
+
+    await cache.set(user_id, member_of, GroupRole.admin)
+    await cache.set(user_id, outside, None)
+    assert await cache.get(user_id, member_of) == GroupRole.admin
+    assert await cache.get(user_id, outside) is None
+
+    await cache.invalidate(user_id, outside)
+    assert await cache.get(user_id, outside) is CACHE_MISS
+
+
+@pytest.mark.asyncio
+async def test_membership_caches_non_member_survives_pickling() -> None:
+    """The Redis backend pickles values, so the non-member marker must compare by value."""
+    backend = SimpleMemoryCache(ttl=60, namespace="test_mem_pickle", serializer=PickleSerializer())
+    workspaces, groups = WorkspaceMembershipCache(backend), GroupMembershipCache(backend)
+    user_id, ws_id, group_id = uuid4(), uuid4(), uuid4()
+    await workspaces.set(user_id, ws_id, None)
+    await groups.set(user_id, group_id, None)
+    assert await workspaces.get(user_id, ws_id) is None
+    assert await groups.get(user_id, group_id) is None
+
+
+@pytest.mark.asyncio
+async def test_group_membership_cache_invalidate_group() -> None:
+    cache = GroupMembershipCache(_make_cache(ttl=60, namespace="test_group_mem_invalidate"))
+    u1, u2, group_id, other = uuid4(), uuid4(), uuid4(), uuid4()
+    await cache.set(u1, group_id, GroupRole.admin)
+    await cache.set(u2, group_id, GroupRole.viewer)
+    await cache.set(u1, other, GroupRole.admin)
+    await cache.invalidate_group(group_id, [u1, u2])
+    assert await cache.get(u1, group_id) is CACHE_MISS
+    assert await cache.get(u2, group_id) is CACHE_MISS
+    assert await cache.get(u1, other) == GroupRole.admin
+
+
+# ---------------------------------------------------------------------------
+# GroupListCache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_group_list_cache_write_retires_every_page() -> None:
+    cache = GroupListCache(_make_cache(ttl=60, namespace="test_group_list"))
+    version = await cache.version()
+    await cache.set(version, None, 50, 0, ([], 0))
+    await cache.set(version, "skáta", 50, 0, ([], 0))
+    assert await cache.get(version, None, 50, 0) == ([], 0)
+
+    await cache.clear_all()
+    new_version = await cache.version()
+    assert new_version != version
+    assert await cache.get(new_version, None, 50, 0) is None
+    assert await cache.get(new_version, "skáta", 50, 0) is None
+
+
 # ---------------------------------------------------------------------------
 # TagsCache
 # ---------------------------------------------------------------------------
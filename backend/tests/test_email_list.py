@@ -1,12 +1,16 @@
 """Tests for the email list router."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import pytest
 from fastapi import HTTPException, status
 
 from app.schemas.email_list import EmailListOut
 
+# Most tests here read or write the shared subscriber list cache.
+pytestmark = pytest.mark.usefixtures("reset_email_list_cache")
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
@@ -119,3 +123,201 @@ def test_delete_email_not_found(client):
 
         response = client.delete("/emaillist/missing@example.com")
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# ── Subscriber list cache ─────────────────────────────────────────────────────
+
+
+def test_list_emails_served_from_cache(client):
+    entries = [_make_entry("a@example.com")]
+
+    with patch(
+        "app.services.email_list.EmailListService.list",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = entries
+
+        assert client.get("/emaillist").status_code == status.HTTP_200_OK
+        assert client.get("/emaillist").json()[0]["email"] == "a@example.com"
+        mock_list.assert_awaited_once()
+
+
+async def test_unsubscribe_invalidates_cached_list():
+    from app.core.cache import email_list_cache
+    from app.services.email_list import EmailListService
+
+    await email_list_cache.set([_make_entry("a@example.com")])
+    svc = EmailListService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.delete_by_token.return_value = 1
+
+    await svc.unsubscribe_by_token(uuid4())
+
+    assert await email_list_cache.get() is None
+
+
+async def test_count_served_from_warm_cache():
+    from app.core.cache import email_list_cache
+    from app.services.email_list import EmailListService
+
+    await email_list_cache.set([_make_entry("a@example.com"), _make_entry("b@example.com")])
+    svc = EmailListService(AsyncMock())
+    svc.repo = AsyncMock()
+
+    assert await svc.count() == 2
+    svc.repo.count.assert_not_awaited()
+
+
+async def test_duplicate_subscribe_keeps_cached_list():
+    from app.core.cache import email_list_cache
+    from app.schemas.email_list import EmailListCreate
+    from app.services.email_list import EmailListService
+
+    await email_list_cache.set([_make_entry("a@example.com")])
+    svc = EmailListService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.create_if_absent.return_value = False
+
+    await svc.create(EmailListCreate(email="a@example.com"))
+
+    svc.session.commit.assert_not_awaited()
+    svc.session.rollback.assert_not_awaited()
+    assert await email_list_cache.get() is not None
+
+
+# ── Broadcast ─────────────────────────────────────────────────────────────────
+
+
+def test_broadcast_enqueues_without_loading_subscribers(client):
+    with (
+        patch(
+            "app.services.email_list.EmailListService.count",
+            new_callable=AsyncMock,
+        ) as mock_count,
+        patch("app.routers.email_router.send_broadcast_background") as mock_send,
+    ):
+        mock_count.return_value = 2
+
+        response = client.post("/emails/broadcast", json={"subject": "Hi", "html": "<p>x</p>"})
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json() == {"recipients_count": 2}
+        mock_send.assert_called_once()
+        assert mock_send.call_args.args[1:] == ("Hi", "<p>x</p>")
+
+
+def test_broadcast_over_recipient_limit_rejected(client):
+    from app.settings import settings
+
+    with (
+        patch(
+            "app.services.email_list.EmailListService.count",
+            new_callable=AsyncMock,
+        ) as mock_count,
+        patch("app.routers.email_router.send_broadcast_background") as mock_send,
+    ):
+        mock_count.return_value = settings.resend_max_recipients + 1
+
+        response = client.post("/emails/broadcast", json={"subject": "Hi", "html": "<p>x</p>"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_send.assert_not_called()
+
+
+def test_send_accepts_more_recipients_than_one_envelope(client):
+    recipients = [f"user{i}@example.com" for i in range(120)]
+    with patch("app.routers.email_router.send_email_background") as mock_send:
+        response = client.post(
+            "/emails/send", json={"recipients": recipients, "subject": "Hi", "html": "<p>x</p>"}
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        mock_send.assert_called_once()
+
+
+def test_send_email_bccs_recipients_in_envelopes_of_fifty():
+    from app.core import email
+
+    recipients = [f"user{i}@example.com" for i in range(120)]
+    with (
+        patch.object(email.settings, "resend_api_key", "re_test"),
+        patch.object(email.resend.Emails, "send") as mock_send,
+    ):
+        email.send_email(recipients, "Hi", "<p>x</p>")
+
+    bccs = [call.args[0]["bcc"] for call in mock_send.call_args_list]
+    assert [len(b) for b in bccs] == [50, 50, 20]
+    assert sum(bccs, []) == recipients
+
+
+# ── Email outbox ──────────────────────────────────────────────────────────────
+
+
+def test_send_email_background_enqueues_with_redis_backend():
+    from fastapi import BackgroundTasks
+
+    from app.core import email
+
+    background_tasks = BackgroundTasks()
+    with patch.object(email.settings, "email_queue_backend", "redis"):
+        email.send_email_background(background_tasks, ["a@example.com"], "Hi", "<p>x</p>")
+
+    (task,) = background_tasks.tasks
+    assert task.func is email._enqueue_email
+    assert task.args == (["a@example.com"], "Hi", "<p>x</p>")
+
+
+async def test_outbox_worker_leaves_failed_send_pending():
+    from app.workers import email_outbox
+
+    client = AsyncMock()
+    with (
+        patch.object(email_outbox, "outbox_client", return_value=client),
+        patch.object(email_outbox, "send_email", side_effect=RuntimeError("boom")),
+    ):
+        await email_outbox.process_message(
+            "1-0", {"recipients": '["a@example.com"]', "subject": "Hi", "html": "<p>x</p>"}
+        )
+
+    client.xack.assert_not_awaited()
+
+
+async def test_outbox_worker_reclaims_stale_pending_messages():
+    from app.workers import email_outbox
+
+    client = AsyncMock()
+    client.xautoclaim.side_effect = [
+        ["2-0", [("1-0", {"recipients": '["a@example.com"]', "subject": "Hi", "html": "x"})], []],
+        ["0-0", [("2-0", None)], []],
+    ]
+    client.xpending_range.return_value = [{"message_id": "1-0", "times_delivered": 2}]
+    with (
+        patch.object(email_outbox, "outbox_client", return_value=client),
+        patch.object(email_outbox, "send_email") as mock_send,
+    ):
+        await email_outbox.reclaim_pending("worker-1")
+
+    mock_send.assert_called_once_with(["a@example.com"], "Hi", "x")
+    assert client.xautoclaim.await_args_list[1].kwargs["start_id"] == "2-0"
+    assert [c.args[2] for c in client.xack.await_args_list] == ["1-0", "2-0"]
+
+
+async def test_outbox_worker_dead_letters_repeatedly_failing_messages():
+    from app.workers import email_outbox
+
+    fields = {"recipients": "not json", "subject": "Hi", "html": "x"}
+    client = AsyncMock()
+    client.xautoclaim.return_value = ["0-0", [("1-0", fields)], []]
+    client.xpending_range.return_value = [{"message_id": "1-0", "times_delivered": 6}]
+    client.pipeline = MagicMock()
+    pipe = client.pipeline.return_value.__aenter__.return_value
+    pipe.execute = AsyncMock()
+    with (
+        patch.object(email_outbox, "outbox_client", return_value=client),
+        patch.object(email_outbox, "send_email") as mock_send,
+    ):
+        await email_outbox.reclaim_pending("worker-1")
+
+    mock_send.assert_not_called()
+    pipe.xadd.assert_called_once_with(
+        email_outbox.DEAD_LETTER_STREAM, {**fields, "outbox_id": "1-0"}
+    )
+    pipe.xack.assert_called_once_with(email_outbox.OUTBOX_STREAM, email_outbox.GROUP, "1-0")
+    pipe.execute.assert_awaited_once()
@@ -5,6 +5,7 @@ from datetime import timezone
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
+import pytest
 from fastapi import HTTPException, status
 
 from app.schemas.event import EventListOut, EventOut
@@ -54,39 +55,26 @@ def _make_event_list_out(workspace_id, program_id=None):
 def test_list_workspace_events(client, sample_workspace):
     event = _make_event_list_out(sample_workspace.id)
 
-    with (
-        patch(
-            "app.services.events.EventService.count_events_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_count,
-        patch(
-            "app.services.events.EventService.list_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_list,
-    ):
-        mock_count.return_value = 1
-        mock_list.return_value = [event]
+    with patch(
+        "app.services.events.EventService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([event], 1)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/events")
         assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Total-Count"] == "1"
         data = response.json()
         assert len(data) == 1
         assert data[0]["name"] == event.name
 
 
 def test_list_workspace_events_empty(client, sample_workspace):
-    with (
-        patch(
-            "app.services.events.EventService.count_events_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_count,
-        patch(
-            "app.services.events.EventService.list_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_list,
-    ):
-        mock_count.return_value = 0
-        mock_list.return_value = []
+    with patch(
+        "app.services.events.EventService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([], 0)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/events")
         assert response.status_code == status.HTTP_200_OK
@@ -94,24 +82,41 @@ def test_list_workspace_events_empty(client, sample_workspace):
 
 
 def test_list_workspace_events_with_date_filters(client, sample_workspace):
+    with patch(
+        "app.services.events.EventService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([], 0)
+
+        response = client.get(
+            f"/workspaces/{sample_workspace.id}/events",
+            params={"date_from": "2025-01-01T00:00:00Z", "date_to": "2025-12-31T23:59:59Z"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+
+def test_list_workspace_events_keyset(client, sample_workspace):
+    event = _make_event_list_out(sample_workspace.id)
+    after = uuid4()
+
     with (
         patch(
-            "app.services.events.EventService.count_events_for_workspace",
+            "app.services.events.EventService.list_for_workspace_with_total",
             new_callable=AsyncMock,
-        ) as mock_count,
+        ) as mock_total,
         patch(
             "app.services.events.EventService.list_for_workspace",
             new_callable=AsyncMock,
         ) as mock_list,
     ):
-        mock_count.return_value = 0
-        mock_list.return_value = []
+        mock_list.return_value = [event]
 
-        response = client.get(
-            f"/workspaces/{sample_workspace.id}/events",
-            params={"date_from": "2025-01-01T00:00:00Z", "date_to": "2025-12-31T23:59:59Z"},
-        )
+        response = client.get(f"/workspaces/{sample_workspace.id}/events?after={after}&limit=1")
         assert response.status_code == status.HTTP_200_OK
+        mock_total.assert_not_awaited()
+        assert mock_list.await_args.kwargs["after"] == after
+        assert f"after={event.id}" in response.headers["Link"]
+        assert "X-Total-Count" not in response.headers
 
 
 # ── List program events ───────────────────────────────────────────────────────
@@ -121,18 +126,11 @@ def test_list_program_events(client, sample_workspace):
     program_id = uuid4()
     event = _make_event_list_out(sample_workspace.id, program_id=program_id)
 
-    with (
-        patch(
-            "app.services.events.EventService.count_events_for_program",
-            new_callable=AsyncMock,
-        ) as mock_count,
-        patch(
-            "app.services.events.EventService.list_for_program",
-            new_callable=AsyncMock,
-        ) as mock_list,
-    ):
-        mock_count.return_value = 1
-        mock_list.return_value = [event]
+    with patch(
+        "app.services.events.EventService.list_for_program_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([event], 1)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/programs/{program_id}/events")
         assert response.status_code == status.HTTP_200_OK
@@ -234,7 +232,7 @@ def test_update_event(client, sample_workspace):
 
     with (
         patch(
-            "app.services.events.EventService.get",
+            "app.services.events.EventService.get_workspace_id",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -242,7 +240,7 @@ def test_update_event(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_update,
     ):
-        mock_get.return_value = event
+        mock_get.return_value = event.workspace_id
         mock_update.return_value = updated
 
         response = client.patch(
@@ -258,7 +256,7 @@ def test_delete_event(client, sample_workspace):
 
     with (
         patch(
-            "app.services.events.EventService.get",
+            "app.services.events.EventService.get_workspace_id",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -266,7 +264,7 @@ def test_delete_event(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_delete,
     ):
-        mock_get.return_value = event
+        mock_get.return_value = event.workspace_id
         mock_delete.return_value = None
 
         response = client.delete(f"/events/{event.id}")
@@ -276,10 +274,59 @@ def test_delete_event(client, sample_workspace):
 
 def test_delete_event_not_found(client):
     with patch(
-        "app.services.events.EventService.get",
+        "app.services.events.EventService.get_workspace_id",
         new_callable=AsyncMock,
     ) as mock_get:
         mock_get.side_effect = HTTPException(status_code=404, detail="Event not found")
 
         response = client.delete(f"/events/{uuid4()}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_update_rejects_program_from_another_workspace():
+    from app.schemas.event import EventUpdate
+    from app.services.events import EventService
+
+    svc = EventService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.program_repo = AsyncMock()
+    # The guarded UPDATE matched nothing although the event exists.
+    svc.repo.update_fields.return_value = False
+    svc.repo.get_workspace_id.return_value = uuid4()
+    svc.program_repo.get_owner.return_value = (uuid4(), uuid4())
+
+    with pytest.raises(HTTPException) as exc:
+        await svc.update(uuid4(), EventUpdate(program_id=uuid4()))
+    assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+    svc.session.commit.assert_not_awaited()
+
+
+async def test_empty_update_reads_event_without_writing():
+    from app.schemas.event import EventUpdate
+    from app.services.events import EventService
+
+    svc = EventService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.get.return_value = None
+
+    with pytest.raises(HTTPException) as exc:
+        await svc.update(uuid4(), EventUpdate())
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+    svc.repo.update_fields.assert_not_awaited()
+    svc.session.commit.assert_not_awaited()
+
+
+async def test_update_with_program_skips_ownership_reads_on_success():
+    from app.schemas.event import EventUpdate
+    from app.services.events import EventService
+
+    svc = EventService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.program_repo = AsyncMock()
+    svc.repo.update_fields.return_value = True
+    svc.repo.get.return_value = None
+
+    with pytest.raises(HTTPException):
+        await svc.update(uuid4(), EventUpdate(program_id=uuid4()))
+    svc.repo.get_workspace_id.assert_not_awaited()
+    svc.program_repo.get_owner.assert_not_awaited()
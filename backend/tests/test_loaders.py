@@ -0,0 +1,96 @@
+"""Unit tests for app.core.loaders — the repository query is patched out."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.cache import CACHE_MISS
+from app.core.loaders import get_membership_loader
+from app.domain.enums import WorkspaceRole
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.info = {}
+    return session
+
+
+async def test_results_are_memoised_for_the_session() -> None:
+    ws, user = uuid4(), uuid4()
+    session = _session()
+
+    with patch(
+        "app.repositories.workspaces.WorkspaceRepository.find_user_roles",
+        new_callable=AsyncMock,
+    ) as mock_find:
+        mock_find.return_value = {(ws, user): WorkspaceRole.viewer}
+
+        assert await get_membership_loader(session).load(ws, user) == WorkspaceRole.viewer
+        assert await get_membership_loader(session).load(ws, user) == WorkspaceRole.viewer
+
+    assert mock_find.await_count == 1
+
+
+async def test_failed_lookup_is_not_memoised() -> None:
+    ws, user = uuid4(), uuid4()
+    loader = get_membership_loader(_session())
+
+    with patch(
+        "app.repositories.workspaces.WorkspaceRepository.find_user_roles",
+        new_callable=AsyncMock,
+    ) as mock_find:
+        mock_find.side_effect = [RuntimeError("db down"), {}]
+
+        with pytest.raises(RuntimeError):
+            await loader.load(ws, user)
+        assert await loader.load(ws, user) is None
+
+
+async def test_primed_role_is_served_without_a_query() -> None:
+    ws, user = uuid4(), uuid4()
+    loader = get_membership_loader(_session())
+    loader.prime(ws, user, WorkspaceRole.admin)
+
+    with patch(
+        "app.repositories.workspaces.WorkspaceRepository.find_user_roles",
+        new_callable=AsyncMock,
+    ) as mock_find:
+        assert await loader.load(ws, user) == WorkspaceRole.admin
+
+    mock_find.assert_not_awaited()
+    assert loader.peek(uuid4(), user) is CACHE_MISS
+
+
+async def test_clear_forgets_memoised_roles() -> None:
+    ws, user = uuid4(), uuid4()
+    loader = get_membership_loader(_session())
+
+    with patch(
+        "app.repositories.workspaces.WorkspaceRepository.find_user_roles",
+        new_callable=AsyncMock,
+    ) as mock_find:
+        mock_find.side_effect = [{}, {(ws, user): WorkspaceRole.editor}]
+
+        assert await loader.load(ws, user) is None
+        loader.clear()
+        assert await loader.load(ws, user) == WorkspaceRole.editor
+
+    assert mock_find.await_count == 2
+
+
+async def test_repeat_role_checks_skip_the_shared_cache() -> None:
+    from app.core.auth import get_workspace_role
+
+    ws, user = uuid4(), uuid4()
+    session = _session()
+
+    with patch("app.core.auth.membership_cache") as mock_cache:
+        mock_cache.get = AsyncMock(return_value=WorkspaceRole.editor)
+
+        assert await get_workspace_role(ws, user, session) == WorkspaceRole.editor
+        assert await get_workspace_role(ws, user, session) == WorkspaceRole.editor
+
+    mock_cache.get.assert_awaited_once_with(user, ws)
@@ -0,0 +1,45 @@
+"""Unit tests for app.main route registration — no DB or external dependencies."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import APIRouter
+
+from app.main import ROUTERS, assert_shared_cache, assert_unique_routes
+
+
+def test_registered_routes_are_unique() -> None:
+    assert_unique_routes(ROUTERS)
+
+
+def test_duplicate_route_fails_startup() -> None:
+    first = APIRouter()
+    second = APIRouter()
+
+    @first.get("/programs/{program_id}")
+    async def get_program() -> None: ...
+
+    @second.get("/programs/{program_id}")
+    async def get_program_again() -> None: ...
+
+    with pytest.raises(RuntimeError, match="GET /programs/{program_id}"):
+        assert_unique_routes([first, second])
+
+
+def test_same_path_different_method_is_allowed() -> None:
+    router = APIRouter()
+
+    @router.get("/programs/{program_id}")
+    async def get_program() -> None: ...
+
+    @router.delete("/programs/{program_id}")
+    async def delete_program() -> None: ...
+
+    assert_unique_routes([router])
+
+
+def test_multiple_workers_require_shared_cache() -> None:
+    with pytest.raises(RuntimeError, match="CACHE_BACKEND=redis"):
+        assert_shared_cache(2, "memory")
+    assert_shared_cache(2, "redis")
+    assert_shared_cache(1, "memory")
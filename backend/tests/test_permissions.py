@@ -76,6 +76,7 @@ def test_viewer_cannot_delete_emaillist_entry(viewer_client):
 # ── Admin user has access ─────────────────────────────────────────────────────
 
 
+@pytest.mark.usefixtures("reset_email_list_cache")
 def test_admin_can_list_emaillist(client):
     from unittest.mock import patch
 
@@ -92,18 +93,154 @@ def test_admin_can_list_emaillist(client):
 def test_admin_can_list_admin_users(client):
     from unittest.mock import patch
 
+    with patch(
+        "app.services.users.UserService.list_full_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([], 0)
+
+        response = client.get("/users/admin/list")
+        assert response.status_code == status.HTTP_200_OK
+
+
+# ── Workspace role lookup ─────────────────────────────────────────────────────
+
+
+def test_my_role_uses_cached_role_lookup(viewer_client, viewer_user):
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    from app.domain.enums import WorkspaceRole
+
+    workspace_id = uuid4()
+    with patch("app.routers.workspaces.get_workspace_role", new_callable=AsyncMock) as mock_role:
+        mock_role.return_value = WorkspaceRole.editor
+        response = viewer_client.get(f"/workspaces/{workspace_id}/my-role")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "workspace_id": str(workspace_id),
+        "user_id": str(viewer_user.id),
+        "role": "editor",
+    }
+
+
+def test_my_role_404_for_non_member(viewer_client):
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    with patch("app.routers.workspaces.get_workspace_role", new_callable=AsyncMock) as mock_role:
+        mock_role.return_value = None
+        response = viewer_client.get(f"/workspaces/{uuid4()}/my-role")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_non_member_cannot_tell_missing_workspace_from_existing(viewer_client):
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    with patch(
+        "app.services.workspaces.WorkspaceService.get_with_role", new_callable=AsyncMock
+    ) as mock_get:
+        mock_get.return_value = None
+        response = viewer_client.get(f"/workspaces/{uuid4()}")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_workspace_editor_cannot_invite(viewer_client):
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    from app.domain.enums import WorkspaceRole
+
     with (
         patch(
-            "app.services.users.UserService.count",
+            "app.services.workspaces.WorkspaceService.get_name_with_role",
             new_callable=AsyncMock,
-        ) as mock_count,
+        ) as mock_lookup,
+        patch("app.routers.email_router.send_email_background") as mock_send,
+    ):
+        mock_lookup.return_value = ("Skátar", WorkspaceRole.editor)
+        response = viewer_client.post(
+            f"/emails/workspaces/{uuid4()}/invite", json={"email": "new@example.com"}
+        )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    mock_send.assert_not_called()
+
+
+def test_workspace_admin_can_invite(viewer_client):
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    from app.domain.enums import WorkspaceRole
+
+    with (
         patch(
-            "app.services.users.UserService.list_full",
+            "app.services.workspaces.WorkspaceService.get_name_with_role",
             new_callable=AsyncMock,
-        ) as mock_list,
+        ) as mock_lookup,
+        patch("app.routers.email_router.send_email_background") as mock_send,
     ):
-        mock_count.return_value = 0
-        mock_list.return_value = []
+        mock_lookup.return_value = ("Skátar", WorkspaceRole.admin)
+        response = viewer_client.post(
+            f"/emails/workspaces/{uuid4()}/invite", json={"email": "new@example.com"}
+        )
 
-        response = client.get("/users/admin/list")
-        assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert mock_send.call_args.kwargs["subject"] == "Boð í Skátar á Slóða"
+
+
+def test_non_author_cannot_tag_content(viewer_client, viewer_user):
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    content_id, tag_id = uuid4(), uuid4()
+    with patch(
+        "app.services.tags.TagService.add_content_tag_if_authorized", new_callable=AsyncMock
+    ) as mock_add:
+        mock_add.return_value = None
+        response = viewer_client.put(f"/content/{content_id}/tags/{tag_id}")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json() == {"detail": "Only the content author can add tags."}
+    mock_add.assert_awaited_once_with(content_id, tag_id, viewer_user.id, is_admin=False)
+
+
+def test_non_author_cannot_untag_content(viewer_client, viewer_user):
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    content_id, tag_id = uuid4(), uuid4()
+    with patch(
+        "app.services.tags.TagService.remove_content_tag_if_authorized", new_callable=AsyncMock
+    ) as mock_remove:
+        mock_remove.return_value = False
+        response = viewer_client.delete(f"/content/{content_id}/tags/{tag_id}")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json() == {"detail": "Only the content author can remove tags."}
+    mock_remove.assert_awaited_once_with(content_id, tag_id, viewer_user.id, is_admin=False)
+
+
+def test_require_permission_returns_one_dependency_per_level():
+    from app.core.auth import require_permission
+    from app.domain.enums import Permissions
+
+    assert require_permission(Permissions.admin) is require_permission(Permissions.admin)
+    assert require_permission(Permissions.admin) is not require_permission(Permissions.member)
+
+
+def test_non_member_cannot_list_event_tasks(viewer_client):
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    with patch(
+        "app.services.events.EventService.get_workspace_id_with_role", new_callable=AsyncMock
+    ) as mock_lookup:
+        mock_lookup.return_value = (uuid4(), None)
+        response = viewer_client.get(f"/events/{uuid4()}/tasks")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,238 @@
+"""Repository queries against a real Postgres (hand-built SQL that mocks cannot check).
+
+Run with:
+    PYTHONPATH=. uv run pytest -q -m integration
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+from app import models as m
+from app import schemas as s
+from app.domain.enums import GroupRole
+from app.repositories.email_list import EmailListRepository
+from app.repositories.events import EventRepository
+from app.repositories.groups import GroupRepository
+from app.repositories.programs import ProgramRepository
+from app.repositories.tags import TagRepository
+from app.repositories.users import UserRepository
+from app.services.events import EventService
+
+pytestmark = pytest.mark.integration
+
+
+async def _user(db, name: str, email: str) -> m.User:
+    user = m.User(name=name, auth0_id=f"auth0|{email}", email=email)
+    db.add(user)
+    await db.flush()
+    return user
+
+
+async def _workspace(db) -> m.Workspace:
+    ws = m.Workspace(**s.WorkspaceCreate(name="Sveit").model_dump())
+    db.add(ws)
+    await db.flush()
+    return ws
+
+
+async def _program(db, author: m.User, ws: m.Workspace) -> m.Program:
+    program = m.Program(
+        name="Dagskrá", author_id=author.id, workspace_id=ws.id, content_type=m.ContentType.program
+    )
+    db.add(program)
+    await db.flush()
+    return program
+
+
+async def _event(db, author: m.User, ws: m.Workspace, program: m.Program | None = None) -> m.Event:
+    event = m.Event(
+        name="Fundur",
+        author_id=author.id,
+        workspace_id=ws.id,
+        content_type=m.ContentType.event,
+        start_dt=dt.datetime(2026, 9, 1, 18, tzinfo=dt.timezone.utc),
+        program_id=program.id if program else None,
+    )
+    db.add(event)
+    await db.flush()
+    return event
+
+
+async def _column(db, column, row_id):
+    """Read one column straight from the table, bypassing the identity map."""
+    table = column.table
+    return await db.scalar(select(column).where(table.c.id == row_id))
+
+
+# ── User search ───────────────────────────────────────────────────────────────
+
+
+async def test_user_search_matches_word_prefixes(db):
+    jon = await _user(db, "Jon Jónsson", "jon@example.com")
+    foo = await _user(db, "Anna", "foo@bar.com")
+    repo = UserRepository(db)
+
+    assert [u.id for u in await repo.list(q="jo")] == [jon.id]
+    assert [u.id for u in await repo.list(q="foo")] == [foo.id]
+    assert [u.id for u in await repo.list(q="jon jóns")] == [jon.id]
+    assert await repo.count(q="nobody") == 0
+    assert await repo.count(q="son") == 0
+    assert {jon.id, foo.id} <= {u.id for u in await repo.list(q="   ")}
+
+
+# ── ON CONFLICT upserts ───────────────────────────────────────────────────────
+
+
+async def test_repeat_group_add_returns_stored_role(db):
+    user = await _user(db, "Gudrun", "gudrun@example.com")
+    group = m.Group(name="Skátafélagið")
+    db.add(group)
+    await db.flush()
+    repo = GroupRepository(db)
+
+    created, gm = await repo.add_membership(group.id, user.id, GroupRole.admin)
+    assert created is True
+    assert gm.role == GroupRole.admin
+
+    created, gm = await repo.add_membership(group.id, user.id, GroupRole.viewer)
+    assert created is False
+    assert gm.role == GroupRole.admin
+    assert (await repo.get_membership(group.id, user.id)).role == GroupRole.admin
+
+
+async def test_repeat_subscribe_leaves_the_row_alone(db):
+    repo = EmailListRepository(db)
+
+    assert await repo.create_if_absent("sub@example.com") is True
+    (first,) = await repo.list()
+    assert await repo.create_if_absent("sub@example.com") is False
+    (again,) = await repo.list()
+    assert again.unsubscribe_token == first.unsubscribe_token
+
+
+# ── Authorised untagging ──────────────────────────────────────────────────────
+
+
+async def test_non_author_untag_leaves_the_tag(db):
+    author = await _user(db, "Author", "author@example.com")
+    other = await _user(db, "Other", "other@example.com")
+    program = await _program(db, author, await _workspace(db))
+    tag = m.Tag(name="útivist")
+    db.add(tag)
+    await db.flush()
+    db.add(m.ContentTag(content_id=program.id, tag_id=tag.id))
+    await db.flush()
+    repo = TagRepository(db)
+
+    result = await repo.remove_content_tag_if_authorized(
+        program.id, tag.id, other.id, is_admin=False
+    )
+
+    linked = (
+        select(func.count()).select_from(m.ContentTag).where(m.ContentTag.content_id == program.id)
+    )
+    assert result == (True, False, False)
+    assert await db.scalar(linked) == 1
+    assert await repo.remove_content_tag_if_authorized(
+        program.id, tag.id, author.id, is_admin=False
+    ) == (True, True, True)
+    assert await db.scalar(linked) == 0
+
+
+# ── Guarded event update ──────────────────────────────────────────────────────
+
+
+async def test_event_update_rejects_program_from_another_workspace(db):
+    author = await _user(db, "Author", "author@example.com")
+    home, away = await _workspace(db), await _workspace(db)
+    own_program = await _program(db, author, home)
+    foreign_program = await _program(db, author, away)
+    event = await _event(db, author, home, own_program)
+    repo = EventRepository(db)
+
+    assert await repo.update_fields(event.id, {"program_id": foreign_program.id}) is False
+    assert await _column(db, m.Event.__table__.c.program_id, event.id) == own_program.id
+
+    other = await _program(db, author, home)
+    assert await repo.update_fields(event.id, {"program_id": other.id}) is True
+    assert await _column(db, m.Event.__table__.c.program_id, event.id) == other.id
+
+
+# ── Soft deletes with orphaning CTEs ──────────────────────────────────────────
+
+
+async def test_event_delete_orphans_tasks(db):
+    author = await _user(db, "Author", "author@example.com")
+    ws = await _workspace(db)
+    event = await _event(db, author, ws)
+    task = m.Task(
+        name="Verkefni",
+        author_id=author.id,
+        workspace_id=ws.id,
+        content_type=m.ContentType.task,
+        event_id=event.id,
+    )
+    db.add(task)
+    await db.flush()
+    repo = EventRepository(db)
+
+    assert await repo.delete(event.id) == 1
+    assert await _column(db, m.Task.__table__.c.event_id, task.id) is None
+    assert await _column(db, m.Content.__table__.c.deleted_at, event.id) is not None
+    assert await _column(db, m.Content.__table__.c.deleted_at, task.id) is None
+    assert await repo.delete(event.id) == 0
+
+
+async def test_program_delete_orphans_events(db):
+    author = await _user(db, "Author", "author@example.com")
+    ws = await _workspace(db)
+    program = await _program(db, author, ws)
+    event = await _event(db, author, ws, program)
+    repo = ProgramRepository(db)
+
+    assert await repo.delete(program.id) == 1
+    assert await _column(db, m.Event.__table__.c.program_id, event.id) is None
+    assert await _column(db, m.Content.__table__.c.deleted_at, event.id) is None
+    assert await repo.delete(program.id) == 0
+
+
+# ── Keyset cursors ────────────────────────────────────────────────────────────
+
+
+async def test_event_keyset_pages_and_rejects_unknown_cursor(db):
+    author = await _user(db, "Author", "author@example.com")
+    ws = await _workspace(db)
+    # Same start_dt, so the id tiebreaker decides the order.
+    events = [await _event(db, author, ws), await _event(db, author, ws)]
+    first, second = sorted(events, key=lambda e: e.id)
+    svc = EventService(db)
+
+    page = await svc.list_for_workspace(ws.id, limit=1, after=first.id)
+    assert [e.id for e in page] == [second.id]
+    assert await svc.list_for_workspace(ws.id, limit=1, after=second.id) == []
+
+    with pytest.raises(HTTPException) as exc:
+        await svc.list_for_workspace(ws.id, limit=1, after=uuid4())
+    assert exc.value.status_code == 400
+
+
+# ── Query budgets ─────────────────────────────────────────────────────────────
+
+
+async def test_event_detail_loads_within_budget(db, strict_loading):
+    author = await _user(db, "Author", "author@example.com")
+    event = await _event(db, author, await _workspace(db))
+    db.expunge_all()
+
+    # The event row (author and workspace joined), then one SELECT each for its
+    # tags, tasks and comments; serialising it must not lazy-load anything else.
+    with strict_loading(4):
+        out = await EventService(db).get(event.id)
+
+    assert out.id == event.id
@@ -36,20 +36,39 @@ def test_list_content_likes(client):
     content_id = uuid4()
     sample_likes = [_make_like(content_id=content_id), _make_like(content_id=content_id)]
 
+    with patch(
+        "app.services.likes.LikeService.list_for_content_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = (sample_likes, 2)
+
+        response = client.get(f"/content/{content_id}/likes")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 2
+
+
+def test_list_content_likes_keyset(client):
+    content_id = uuid4()
+    like = _make_like(content_id=content_id)
+    after = uuid4()
+
     with (
+        patch(
+            "app.services.likes.LikeService.list_for_content_with_total",
+            new_callable=AsyncMock,
+        ) as mock_total,
         patch(
             "app.services.likes.LikeService.list_for_content", new_callable=AsyncMock
         ) as mock_list,
-        patch(
-            "app.services.likes.LikeService.count_content_likes", new_callable=AsyncMock
-        ) as mock_count,
     ):
-        mock_list.return_value = sample_likes
-        mock_count.return_value = 2
+        mock_list.return_value = [like]
 
-        response = client.get(f"/content/{content_id}/likes")
+        response = client.get(f"/content/{content_id}/likes?after={after}&limit=1")
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.json()) == 2
+        mock_total.assert_not_awaited()
+        mock_list.assert_awaited_once_with(content_id, limit=1, after=after)
+        assert f"after={like.user_id}" in response.headers["Link"]
+        assert "X-Total-Count" not in response.headers
 
 
 def test_like_content(client):
@@ -74,19 +93,15 @@ def test_list_content_comments(client):
     content_id = uuid4()
     sample_comments = [_make_comment(content_id=content_id), _make_comment(content_id=content_id)]
 
-    with (
-        patch(
-            "app.services.comments.CommentService.list_for_content", new_callable=AsyncMock
-        ) as mock_list,
-        patch(
-            "app.services.comments.CommentService.count_content_comments", new_callable=AsyncMock
-        ) as mock_count,
-    ):
-        mock_list.return_value = sample_comments
-        mock_count.return_value = 2
+    with patch(
+        "app.services.comments.CommentService.list_for_content_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = (sample_comments, 2)
 
         response = client.get(f"/content/{content_id}/comments")
         assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Total-Count"] == "2"
         data = response.json()
         assert len(data) == 2
         assert data[0]["body"] == "Great content!"
@@ -144,16 +159,11 @@ def test_delete_comment_not_found(client):
 def test_list_content_likes_empty(client):
     content_id = uuid4()
 
-    with (
-        patch(
-            "app.services.likes.LikeService.list_for_content", new_callable=AsyncMock
-        ) as mock_list,
-        patch(
-            "app.services.likes.LikeService.count_content_likes", new_callable=AsyncMock
-        ) as mock_count,
-    ):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    with patch(
+        "app.services.likes.LikeService.list_for_content_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([], 0)
 
         response = client.get(f"/content/{content_id}/likes")
         assert response.status_code == status.HTTP_200_OK
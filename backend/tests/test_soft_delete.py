@@ -56,10 +56,10 @@ def test_delete_program_returns_204(client):
     sample = _prog()
 
     with (
-        patch("app.services.programs.ProgramService.get", new_callable=AsyncMock) as mock_get,
+        patch("app.services.programs.ProgramService.get_owner", new_callable=AsyncMock) as mock_get,
         patch("app.services.programs.ProgramService.delete", new_callable=AsyncMock) as mock_del,
     ):
-        mock_get.return_value = sample
+        mock_get.return_value = (sample.workspace_id, sample.author_id)
         mock_del.return_value = None
 
         resp = client.delete(f"/programs/{program_id}")
@@ -68,7 +68,9 @@ def test_delete_program_returns_204(client):
 
 
 def test_delete_program_not_found_returns_404(client):
-    with patch("app.services.programs.ProgramService.get", new_callable=AsyncMock) as mock_get:
+    with patch(
+        "app.services.programs.ProgramService.get_owner", new_callable=AsyncMock
+    ) as mock_get:
         mock_get.side_effect = _not_found()
 
         resp = client.delete(f"/programs/{uuid4()}")
@@ -84,7 +86,7 @@ def test_delete_workspace_returns_204(client):
     with patch(
         "app.services.workspaces.WorkspaceService.delete", new_callable=AsyncMock
     ) as mock_del:
-        mock_del.return_value = None
+        mock_del.return_value = []
 
         resp = client.delete(f"/workspaces/{ws_id}")
         assert resp.status_code == status.HTTP_204_NO_CONTENT
@@ -234,8 +236,10 @@ def test_get_program_returns_404_after_soft_delete(client):
 
 
 def test_get_workspace_returns_404_after_soft_delete(client):
-    with patch("app.services.workspaces.WorkspaceService.get", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = _not_found()
+    with patch(
+        "app.services.workspaces.WorkspaceService.get_with_role", new_callable=AsyncMock
+    ) as mock_get:
+        mock_get.return_value = None
 
         resp = client.get(f"/workspaces/{uuid4()}")
         assert resp.status_code == status.HTTP_404_NOT_FOUND
@@ -68,18 +68,11 @@ def _make_event(workspace_id):
 def test_list_workspace_tasks(client, sample_workspace):
     task = _make_task_list_out(sample_workspace.id)
 
-    with (
-        patch(
-            "app.services.tasks.TaskService.count_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_count,
-        patch(
-            "app.services.tasks.TaskService.list_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_list,
-    ):
-        mock_count.return_value = 1
-        mock_list.return_value = [task]
+    with patch(
+        "app.services.tasks.TaskService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([task], 1)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/tasks")
         assert response.status_code == status.HTTP_200_OK
@@ -89,18 +82,11 @@ def test_list_workspace_tasks(client, sample_workspace):
 
 
 def test_list_workspace_tasks_empty(client, sample_workspace):
-    with (
-        patch(
-            "app.services.tasks.TaskService.count_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_count,
-        patch(
-            "app.services.tasks.TaskService.list_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_list,
-    ):
-        mock_count.return_value = 0
-        mock_list.return_value = []
+    with patch(
+        "app.services.tasks.TaskService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([], 0)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/tasks")
         assert response.status_code == status.HTTP_200_OK
@@ -113,21 +99,16 @@ def test_list_event_tasks(client, sample_workspace):
 
     with (
         patch(
-            "app.services.events.EventService.get",
+            "app.services.events.EventService.get_workspace_id_with_role",
             new_callable=AsyncMock,
         ) as mock_event_get,
         patch(
-            "app.services.tasks.TaskService.count_tasks_for_event",
-            new_callable=AsyncMock,
-        ) as mock_count,
-        patch(
-            "app.services.tasks.TaskService.list_for_event",
+            "app.services.tasks.TaskService.list_for_event_with_total",
             new_callable=AsyncMock,
         ) as mock_list,
     ):
-        mock_event_get.return_value = event
-        mock_count.return_value = 1
-        mock_list.return_value = [task]
+        mock_event_get.return_value = (event.workspace_id, None)
+        mock_list.return_value = ([task], 1)
 
         response = client.get(f"/events/{event.id}/tasks")
         assert response.status_code == status.HTTP_200_OK
@@ -162,7 +143,7 @@ def test_create_event_task(client, sample_workspace):
 
     with (
         patch(
-            "app.services.events.EventService.get",
+            "app.services.events.EventService.get_workspace_id_with_role",
             new_callable=AsyncMock,
         ) as mock_event_get,
         patch(
@@ -170,7 +151,7 @@ def test_create_event_task(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_create,
     ):
-        mock_event_get.return_value = event
+        mock_event_get.return_value = (event.workspace_id, None)
         mock_create.return_value = task
 
         response = client.post(
@@ -216,7 +197,7 @@ def test_update_task(client, sample_workspace):
 
     with (
         patch(
-            "app.services.tasks.TaskService.get",
+            "app.services.tasks.TaskService.get_workspace_id",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -224,7 +205,7 @@ def test_update_task(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_update,
     ):
-        mock_get.return_value = task
+        mock_get.return_value = task.workspace_id
         mock_update.return_value = updated
 
         response = client.patch(f"/tasks/{task.id}", json={"name": "Updated Task"})
@@ -237,7 +218,7 @@ def test_delete_task(client, sample_workspace):
 
     with (
         patch(
-            "app.services.tasks.TaskService.get",
+            "app.services.tasks.TaskService.get_workspace_id",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -245,7 +226,7 @@ def test_delete_task(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_delete,
     ):
-        mock_get.return_value = task
+        mock_get.return_value = task.workspace_id
         mock_delete.return_value = None
 
         response = client.delete(f"/tasks/{task.id}")
@@ -255,7 +236,7 @@ def test_delete_task(client, sample_workspace):
 
 def test_delete_task_not_found(client):
     with patch(
-        "app.services.tasks.TaskService.get",
+        "app.services.tasks.TaskService.get_workspace_id",
         new_callable=AsyncMock,
     ) as mock_get:
         mock_get.side_effect = HTTPException(status_code=404, detail="Task not found")
@@ -44,18 +44,11 @@ def _make_event(workspace_id):
 def test_list_workspace_troops(client, sample_workspace):
     troop = _make_troop(sample_workspace.id)
 
-    with (
-        patch(
-            "app.services.troops.TroopService.count_troops_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_count,
-        patch(
-            "app.services.troops.TroopService.list_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_list,
-    ):
-        mock_count.return_value = 1
-        mock_list.return_value = [troop]
+    with patch(
+        "app.services.troops.TroopService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([troop], 1)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/troops")
         assert response.status_code == status.HTTP_200_OK
@@ -65,24 +58,34 @@ def test_list_workspace_troops(client, sample_workspace):
 
 
 def test_list_workspace_troops_empty(client, sample_workspace):
-    with (
-        patch(
-            "app.services.troops.TroopService.count_troops_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_count,
-        patch(
-            "app.services.troops.TroopService.list_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_list,
-    ):
-        mock_count.return_value = 0
-        mock_list.return_value = []
+    with patch(
+        "app.services.troops.TroopService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([], 0)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/troops")
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == []
 
 
+def test_list_workspace_troops_keyset(client, sample_workspace):
+    troop = _make_troop(sample_workspace.id)
+    after = uuid4()
+
+    with patch(
+        "app.services.troops.TroopService.list_for_workspace",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = [troop]
+
+        response = client.get(f"/workspaces/{sample_workspace.id}/troops?after={after}&limit=5")
+        assert response.status_code == status.HTTP_200_OK
+        mock_list.assert_awaited_once_with(sample_workspace.id, limit=5, after=after)
+        assert "Link" not in response.headers
+        assert response.headers["X-Limit"] == "5"
+
+
 def test_create_troop(client, sample_workspace):
     troop = _make_troop(sample_workspace.id)
 
@@ -134,7 +137,7 @@ def test_update_troop(client, sample_workspace):
 
     with (
         patch(
-            "app.services.troops.TroopService.get",
+            "app.services.troops.TroopService.get_workspace_id_with_role",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -142,7 +145,7 @@ def test_update_troop(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_update,
     ):
-        mock_get.return_value = troop
+        mock_get.return_value = (troop.workspace_id, None)
         mock_update.return_value = updated
 
         response = client.patch(f"/troops/{troop.id}", json={"name": "Updated Troop"})
@@ -155,7 +158,7 @@ def test_delete_troop(client, sample_workspace):
 
     with (
         patch(
-            "app.services.troops.TroopService.get",
+            "app.services.troops.TroopService.get_workspace_id_with_role",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -163,7 +166,7 @@ def test_delete_troop(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_delete,
     ):
-        mock_get.return_value = troop
+        mock_get.return_value = (troop.workspace_id, None)
         mock_delete.return_value = None
 
         response = client.delete(f"/troops/{troop.id}")
@@ -173,7 +176,7 @@ def test_delete_troop(client, sample_workspace):
 
 def test_delete_troop_not_found(client):
     with patch(
-        "app.services.troops.TroopService.get",
+        "app.services.troops.TroopService.get_workspace_id_with_role",
         new_callable=AsyncMock,
     ) as mock_get:
         mock_get.side_effect = HTTPException(status_code=404, detail="Troop not found")
@@ -191,7 +194,32 @@ def test_list_event_troops(client, sample_workspace):
 
     with (
         patch(
-            "app.services.events.EventService.get",
+            "app.services.events.EventService.get_workspace_id_with_role",
+            new_callable=AsyncMock,
+        ) as mock_event_get,
+        patch(
+            "app.services.troops.TroopService.list_event_troops_with_total",
+            new_callable=AsyncMock,
+        ) as mock_list,
+    ):
+        mock_event_get.return_value = (event.workspace_id, None)
+        mock_list.return_value = ([troop], 1)
+
+        response = client.get(f"/events/{event.id}/troops")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["name"] == troop.name
+
+
+def test_list_event_troops_keyset(client, sample_workspace):
+    event = _make_event(sample_workspace.id)
+    troop = _make_troop(sample_workspace.id)
+    after = uuid4()
+
+    with (
+        patch(
+            "app.services.events.EventService.get_workspace_id_with_role",
             new_callable=AsyncMock,
         ) as mock_event_get,
         patch(
@@ -203,15 +231,39 @@ def test_list_event_troops(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_list,
     ):
-        mock_event_get.return_value = event
-        mock_count.return_value = 1
+        mock_event_get.return_value = (event.workspace_id, None)
         mock_list.return_value = [troop]
 
-        response = client.get(f"/events/{event.id}/troops")
+        response = client.get(f"/events/{event.id}/troops?after={after}&limit=1")
+        assert response.status_code == status.HTTP_200_OK
+        mock_count.assert_not_awaited()
+        mock_list.assert_awaited_once_with(event.id, limit=1, after=after)
+        assert f"after={troop.id}" in response.headers["Link"]
+        assert "X-Total-Count" not in response.headers
+
+
+def test_list_troop_events(client, sample_workspace):
+    troop = _make_troop(sample_workspace.id)
+    event = _make_event(sample_workspace.id)
+
+    with (
+        patch(
+            "app.services.troops.TroopService.get_workspace_id_with_role", new_callable=AsyncMock
+        ) as mock_get,
+        patch(
+            "app.services.troops.TroopService.list_troop_events_with_total",
+            new_callable=AsyncMock,
+        ) as mock_list,
+    ):
+        mock_get.return_value = (troop.workspace_id, None)
+        mock_list.return_value = ([event], 1)
+
+        response = client.get(f"/troops/{troop.id}/events")
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 1
-        assert data[0]["name"] == troop.name
+        assert data[0]["name"] == event.name
+        assert response.headers["X-Total-Count"] == "1"
 
 
 def test_add_troop_participation(client, sample_workspace):
@@ -221,7 +273,7 @@ def test_add_troop_participation(client, sample_workspace):
 
     with (
         patch(
-            "app.services.troops.TroopService.get",
+            "app.services.troops.TroopService.get_workspace_id_with_role",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -229,7 +281,7 @@ def test_add_troop_participation(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_add,
     ):
-        mock_get.return_value = troop
+        mock_get.return_value = (troop.workspace_id, None)
         mock_add.return_value = (True, participation)
 
         response = client.put(f"/events/{event.id}/troops/{troop.id}")
@@ -246,7 +298,7 @@ def test_add_troop_participation_idempotent(client, sample_workspace):
 
     with (
         patch(
-            "app.services.troops.TroopService.get",
+            "app.services.troops.TroopService.get_workspace_id_with_role",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -254,7 +306,7 @@ def test_add_troop_participation_idempotent(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_add,
     ):
-        mock_get.return_value = troop
+        mock_get.return_value = (troop.workspace_id, None)
         mock_add.return_value = (False, participation)
 
         response = client.put(f"/events/{event.id}/troops/{troop.id}")
@@ -267,7 +319,7 @@ def test_remove_troop_participation(client, sample_workspace):
 
     with (
         patch(
-            "app.services.troops.TroopService.get",
+            "app.services.troops.TroopService.get_workspace_id_with_role",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -275,7 +327,7 @@ def test_remove_troop_participation(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_remove,
     ):
-        mock_get.return_value = troop
+        mock_get.return_value = (troop.workspace_id, None)
         mock_remove.return_value = None
 
         response = client.delete(f"/events/{event.id}/troops/{troop.id}")
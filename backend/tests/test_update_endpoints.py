@@ -43,7 +43,7 @@ def test_update_program(client, sample_workspace):
 
     with (
         patch(
-            "app.services.programs.ProgramService.get",
+            "app.services.programs.ProgramService.get_owner",
             new_callable=AsyncMock,
         ) as mock_get,
         patch(
@@ -51,7 +51,7 @@ def test_update_program(client, sample_workspace):
             new_callable=AsyncMock,
         ) as mock_update,
     ):
-        mock_get.return_value = program
+        mock_get.return_value = (program.workspace_id, program.author_id)
         mock_update.return_value = updated
 
         response = client.patch(f"/programs/{program.id}", json={"name": "Updated Program"})
@@ -63,7 +63,7 @@ def test_update_program_not_found(client):
     from fastapi import HTTPException
 
     with patch(
-        "app.services.programs.ProgramService.get",
+        "app.services.programs.ProgramService.get_owner",
         new_callable=AsyncMock,
     ) as mock_get:
         mock_get.side_effect = HTTPException(status_code=404, detail="Program not found")
@@ -30,12 +30,10 @@ def test_get_user(client, sample_user):
 
 
 def test_list_users(client, sample_user):
-    with (
-        patch("app.services.users.UserService.list", new_callable=AsyncMock) as mock_list,
-        patch("app.services.users.UserService.count", new_callable=AsyncMock) as mock_count,
-    ):
-        mock_list.return_value = [sample_user]
-        mock_count.return_value = 1
+    with patch(
+        "app.services.users.UserService.list_with_total", new_callable=AsyncMock
+    ) as mock_list:
+        mock_list.return_value = ([sample_user], 1)
 
         response = client.get("/users")
         assert response.status_code == status.HTTP_200_OK
@@ -43,6 +41,13 @@ def test_list_users(client, sample_user):
         assert len(data) == 1
 
 
+def test_user_search_prefix_tsquery_quotes_each_word():
+    from app.repositories.users import _prefix_tsquery
+
+    assert _prefix_tsquery(" jo  o'brien ") == "'jo':* & 'o''brien':*"
+    assert _prefix_tsquery("   ") == ""
+
+
 # ── Workspaces ────────────────────────────────────────────────────────────────
 
 
@@ -59,29 +64,25 @@ def test_create_workspace(client, sample_user, sample_workspace_data, sample_wor
 
 
 def test_list_user_workspaces(client, sample_user, sample_workspace):
-    with (
-        patch(
-            "app.services.workspaces.WorkspaceService.list_user_workspaces",
-            new_callable=AsyncMock,
-        ) as mock_list,
-        patch(
-            "app.services.workspaces.WorkspaceService.count_user_workspaces",
-            new_callable=AsyncMock,
-        ) as mock_count,
-    ):
-        mock_list.return_value = [sample_workspace]
-        mock_count.return_value = 1
+    with patch(
+        "app.services.workspaces.WorkspaceService.list_user_workspaces_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([sample_workspace], 1)
 
         response = client.get(f"/users/{sample_user.id}/workspaces")
         assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Total-Count"] == "1"
         data = response.json()
         assert len(data) == 1
         assert data[0]["name"] == sample_workspace.name
 
 
 def test_get_workspace(client, sample_workspace):
-    with patch("app.services.workspaces.WorkspaceService.get", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = sample_workspace
+    with patch(
+        "app.services.workspaces.WorkspaceService.get_with_role", new_callable=AsyncMock
+    ) as mock_get:
+        mock_get.return_value = (sample_workspace, None)
 
         response = client.get(f"/workspaces/{sample_workspace.id}")
         assert response.status_code == status.HTTP_200_OK
@@ -97,9 +98,25 @@ def test_get_user_not_found(client):
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+def test_admin_my_role_is_owner_without_lookup(client, admin_user):
+    workspace_id = uuid4()
+    with patch("app.routers.workspaces.get_workspace_role", new_callable=AsyncMock) as mock_role:
+        response = client.get(f"/workspaces/{workspace_id}/my-role")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "workspace_id": str(workspace_id),
+        "user_id": str(admin_user.id),
+        "role": "owner",
+    }
+    mock_role.assert_not_awaited()
+
+
 def test_get_workspace_not_found(client):
-    with patch("app.services.workspaces.WorkspaceService.get", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = HTTPException(status_code=404, detail="Workspace not found")
+    with patch(
+        "app.services.workspaces.WorkspaceService.get_with_role", new_callable=AsyncMock
+    ) as mock_get:
+        mock_get.return_value = None
 
         response = client.get(f"/workspaces/{uuid4()}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -121,19 +138,17 @@ def test_delete_workspace_returns_204(client, sample_workspace):
     with patch(
         "app.services.workspaces.WorkspaceService.delete", new_callable=AsyncMock
     ) as mock_del:
-        mock_del.return_value = None
+        mock_del.return_value = []
 
         response = client.delete(f"/workspaces/{sample_workspace.id}")
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
 def test_list_users_empty(client):
-    with (
-        patch("app.services.users.UserService.list", new_callable=AsyncMock) as mock_list,
-        patch("app.services.users.UserService.count", new_callable=AsyncMock) as mock_count,
-    ):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    with patch(
+        "app.services.users.UserService.list_with_total", new_callable=AsyncMock
+    ) as mock_list:
+        mock_list.return_value = ([], 0)
 
         response = client.get("/users")
         assert response.status_code == status.HTTP_200_OK
@@ -4,6 +4,7 @@ from datetime import datetime
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
+import pytest
 from fastapi import HTTPException, status
 
 from app.schemas.group import GroupOut
@@ -54,18 +55,11 @@ def test_create_program(client, sample_workspace):
 def test_list_workspace_programs(client, sample_workspace):
     sample_program = _make_program(sample_workspace.id)
 
-    with (
-        patch(
-            "app.services.programs.ProgramService.list_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_list,
-        patch(
-            "app.services.programs.ProgramService.count_programs_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_count,
-    ):
-        mock_list.return_value = [sample_program]
-        mock_count.return_value = 1
+    with patch(
+        "app.services.programs.ProgramService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([sample_program], 1)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/programs")
         assert response.status_code == status.HTTP_200_OK
@@ -74,6 +68,21 @@ def test_list_workspace_programs(client, sample_workspace):
         assert data[0]["name"] == sample_program.name
 
 
+def test_copy_program_to_workspace(client, sample_workspace):
+    source_id = uuid4()
+    copied = _make_program(sample_workspace.id)
+
+    with patch(
+        "app.services.programs.ProgramService.copy_to_workspace", new_callable=AsyncMock
+    ) as mock_copy:
+        mock_copy.return_value = copied
+
+        response = client.post(f"/workspaces/{sample_workspace.id}/programs/{source_id}/copy")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.headers["Location"] == f"/programs/{copied.id}"
+        assert mock_copy.await_args.args[:2] == (source_id, sample_workspace.id)
+
+
 # ── Groups ────────────────────────────────────────────────────────────────────
 
 
@@ -91,12 +100,11 @@ def test_create_group(client):
 def test_list_groups(client):
     sample_group = _make_group()
 
-    with (
-        patch("app.services.groups.GroupService.list", new_callable=AsyncMock) as mock_list,
-        patch("app.services.groups.GroupService.count", new_callable=AsyncMock) as mock_count,
-    ):
-        mock_list.return_value = [sample_group]
-        mock_count.return_value = 1
+    with patch(
+        "app.services.groups.GroupService.list_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([sample_group], 1)
 
         response = client.get("/groups")
         assert response.status_code == status.HTTP_200_OK
@@ -116,6 +124,92 @@ def test_get_group(client):
         assert response.json()["name"] == sample_group.name
 
 
+async def test_get_group_served_from_cache():
+    from app.services.groups import GroupService
+
+    group = _make_group()
+    svc = GroupService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.get.return_value = group
+
+    assert await svc.get(group.id) == group
+    assert await svc.get(group.id) == group
+    svc.repo.get.assert_awaited_once_with(group.id)
+
+
+async def test_delete_group_invalidates_cache():
+    from app.core.cache import group_cache
+    from app.services.groups import GroupService
+
+    group = _make_group()
+    await group_cache.set(group)
+    svc = GroupService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.get.return_value = group
+
+    await svc.delete(group.id)
+
+    assert await group_cache.get(group.id) is None
+
+
+async def test_update_group_writes_with_one_returning_update():
+    from app.models.group import Group
+    from app.schemas.group import GroupUpdate
+    from app.services.groups import GroupService
+
+    group_id = uuid4()
+    svc = GroupService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.update_fields.return_value = Group(id=group_id, name="Renamed")
+
+    updated = await svc.update(group_id, GroupUpdate(name="Renamed"))
+
+    assert updated == GroupOut(id=group_id, name="Renamed")
+    svc.repo.update_fields.assert_awaited_once_with(group_id, {"name": "Renamed"})
+    svc.repo.get.assert_not_awaited()
+    svc.session.refresh.assert_not_awaited()
+
+
+async def test_list_groups_served_from_cache_until_write():
+    from app.services.groups import GroupService
+
+    group = _make_group()
+    svc = GroupService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.list_with_total.return_value = ([group], 1)
+    svc.repo.delete.return_value = 1
+
+    assert await svc.list_with_total(q=None) == ([group], 1)
+    assert await svc.list_with_total(q=None) == ([group], 1)
+    svc.repo.list_with_total.assert_awaited_once()
+
+    await svc.delete(group.id)
+    await svc.list_with_total(q=None)
+    assert svc.repo.list_with_total.await_count == 2
+
+
+async def test_list_group_members_probes_existence_only_for_empty_page():
+    from app.domain.enums import GroupRole
+    from app.models.group import GroupMemberRow
+    from app.services.groups import GroupService
+
+    svc = GroupService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.list_group_members_with_total.return_value = (
+        [GroupMemberRow(user_id=uuid4(), name="Anna", role=GroupRole.viewer)],
+        1,
+    )
+
+    await svc.list_group_members_with_total(uuid4())
+    svc.repo.exists.assert_not_awaited()
+
+    svc.repo.list_group_members_with_total.return_value = ([], 0)
+    svc.repo.exists.return_value = False
+    with pytest.raises(HTTPException) as exc_info:
+        await svc.list_group_members_with_total(uuid4())
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
 # ── Tags ──────────────────────────────────────────────────────────────────────
 
 
@@ -125,16 +219,46 @@ def test_list_tags(client):
         {"id": uuid4(), "name": "FastAPI", "description": None},
     ]
 
+    with patch("app.services.tags.TagService.list_with_total", new_callable=AsyncMock) as mock_list:
+        mock_list.return_value = ([type("Tag", (), tag)() for tag in sample_tags], 2)
+
+        response = client.get("/tags")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 2
+
+
+def test_list_tags_keyset(client):
+    tag = type("Tag", (), {"id": uuid4(), "name": "Python"})()
+    after = uuid4()
+
     with (
         patch("app.services.tags.TagService.list", new_callable=AsyncMock) as mock_list,
-        patch("app.services.tags.TagService.count", new_callable=AsyncMock) as mock_count,
+        patch(
+            "app.services.tags.TagService.list_with_total", new_callable=AsyncMock
+        ) as mock_with_total,
     ):
-        mock_list.return_value = [type("Tag", (), tag)() for tag in sample_tags]
-        mock_count.return_value = 2
+        mock_list.return_value = [tag]
 
-        response = client.get("/tags")
+        response = client.get(f"/tags?after={after}&limit=1")
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.json()) == 2
+        mock_with_total.assert_not_awaited()
+        mock_list.assert_awaited_once_with(q=None, limit=1, after=after)
+        assert f"after={tag.id}" in response.headers["Link"]
+        assert "X-Total-Count" not in response.headers
+
+
+async def test_tag_service_list_builds_tag_out_from_rows():
+    from app.schemas.tag import TagOut
+    from app.services.tags import TagService
+
+    row = type("Tag", (), {"id": uuid4(), "name": "Python"})()
+    svc = TagService(AsyncMock())
+    svc.repo = AsyncMock()
+    svc.repo.list.return_value = [row]
+
+    tags = await svc.list(q=None)
+
+    assert tags == [TagOut(id=row.id, name="Python")]
 
 
 def test_create_tag(client):
@@ -156,10 +280,10 @@ def test_delete_program_returns_204(client, sample_workspace):
     sample_program = _make_program(sample_workspace.id)
 
     with (
-        patch("app.services.programs.ProgramService.get", new_callable=AsyncMock) as mock_get,
+        patch("app.services.programs.ProgramService.get_owner", new_callable=AsyncMock) as mock_get,
         patch("app.services.programs.ProgramService.delete", new_callable=AsyncMock) as mock_del,
     ):
-        mock_get.return_value = sample_program
+        mock_get.return_value = (sample_program.workspace_id, sample_program.author_id)
         mock_del.return_value = None
 
         response = client.delete(f"/programs/{sample_program.id}")
@@ -168,7 +292,9 @@ def test_delete_program_returns_204(client, sample_workspace):
 
 
 def test_delete_program_not_found(client):
-    with patch("app.services.programs.ProgramService.get", new_callable=AsyncMock) as mock_get:
+    with patch(
+        "app.services.programs.ProgramService.get_owner", new_callable=AsyncMock
+    ) as mock_get:
         mock_get.side_effect = HTTPException(status_code=404, detail="Program not found")
 
         response = client.delete(f"/programs/{uuid4()}")
@@ -206,18 +332,11 @@ def test_get_group_not_found(client):
 
 
 def test_list_workspace_programs_empty(client, sample_workspace):
-    with (
-        patch(
-            "app.services.programs.ProgramService.list_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_list,
-        patch(
-            "app.services.programs.ProgramService.count_programs_for_workspace",
-            new_callable=AsyncMock,
-        ) as mock_count,
-    ):
-        mock_list.return_value = []
-        mock_count.return_value = 0
+    with patch(
+        "app.services.programs.ProgramService.list_for_workspace_with_total",
+        new_callable=AsyncMock,
+    ) as mock_list:
+        mock_list.return_value = ([], 0)
 
         response = client.get(f"/workspaces/{sample_workspace.id}/programs")
         assert response.status_code == status.HTTP_200_OK